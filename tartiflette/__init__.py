@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.directive.directive import Directive
@@ -34,8 +34,19 @@ async def create_engine(
     json_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
     custom_default_arguments_coercer: Optional[Callable] = None,
     coerce_list_concurrently: Optional[bool] = None,
+    list_max_concurrency: Optional[int] = None,
+    max_concurrent_resolvers: Optional[int] = None,
+    max_concurrent_resolvers_per_execution: Optional[int] = None,
     coerce_parent_concurrently: Optional[bool] = None,
     sdl_file_encoding: Optional[str] = None,
+    query_parser_mode: Optional[str] = None,
+    persisted_query_store: Optional["PersistedQueryStore"] = None,
+    persisted_query_allowlist_only: Optional[bool] = None,
+    normalize_queries: Optional[bool] = None,
+    response_cache: Optional["ResponseCache"] = None,
+    source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+    tracing: Optional["Tracing"] = None,
+    instruments: Optional[Sequence["Instrument"]] = None,
 ) -> "Engine":
     """
     Create an engine by analyzing the SDL and connecting it with the imported
@@ -55,17 +66,44 @@ async def create_engine(
     the engine to import, usually this modules contains your Resolvers,
     Directives, Scalar or Subscription code
     :param query_cache_decorator: callable that will replace the tartiflette
-    default lru_cache decorator to cache query parsing
+    default QueryCache decorator to cache query parsing
     :param json_loader: A callable that will replace default python
-    json module.loads for ast_json loading
+    json module.loads for ast_json loading (only used with the "json" query
+    parser mode)
     :param custom_default_arguments_coercer: callable that will replace the
     tartiflette `default_arguments_coercer`
     :param coerce_list_concurrently: whether or not list will be coerced
     concurrently
+    :param list_max_concurrency: maximum number of items of a list completed
+    concurrently by default
+    :param max_concurrent_resolvers: maximum number of resolvers called
+    concurrently by all the executions of the engine
+    :param max_concurrent_resolvers_per_execution: maximum number of resolvers
+    called concurrently by a single execution
     :param coerce_parent_concurrently: whether or not field will be coerced
     concurrently
     :param sdl_file_encoding: file encoding of the SDL, if different from
     `locale.getpreferredencoding(False)`
+    :param query_parser_mode: how the libgraphqlparser AST is transformed into
+    a DocumentNode, either "ast" to walk the C AST directly or "json" to go
+    through its JSON representation (defaults to "json" when a custom
+    `json_loader` is provided, "ast" otherwise)
+    :param persisted_query_store: store in charge of keeping the validated
+    documents of persisted queries by query id
+    :param persisted_query_allowlist_only: whether or not only the queries
+    already present in the persisted query store can be executed
+    :param normalize_queries: whether or not queries only differing by their
+    ignored tokens (whitespaces, commas, comments...) should share the same
+    cache entry & persisted query
+    :param response_cache: cache of the whole responses of query operations,
+    based on the cache hints declared by the resolved fields
+    :param source_shapes: shapes of the values resolved for each object type,
+    used to compile the default resolver of their fields into synchronous
+    getters
+    :param tracing: traces the timings of the parsing, the execution & the
+    resolvers of a sample of the executions
+    :param instruments: instruments notified of the parsing, validation,
+    execution, field resolution & coercion and errors of the executions
     :type sdl: Union[str, List[str]]
     :type schema_name: str
     :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
@@ -76,8 +114,19 @@ async def create_engine(
     :type json_loader: Optional[Callable[[str], Dict[str, Any]]]
     :type custom_default_arguments_coercer: Optional[Callable]
     :type coerce_list_concurrently: Optional[bool]
+    :type list_max_concurrency: Optional[int]
+    :type max_concurrent_resolvers: Optional[int]
+    :type max_concurrent_resolvers_per_execution: Optional[int]
     :type coerce_parent_concurrently: Optional[bool]
     :type sdl_file_encoding: Optional[str]
+    :type query_parser_mode: Optional[str]
+    :type persisted_query_store: Optional[PersistedQueryStore]
+    :type persisted_query_allowlist_only: Optional[bool]
+    :type normalize_queries: Optional[bool]
+    :type response_cache: Optional[ResponseCache]
+    :type source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]]
+    :type tracing: Optional[Tracing]
+    :type instruments: Optional[Sequence[Instrument]]
     :return: a Cooked Engine instance
     :rtype: Engine
 
@@ -90,7 +139,7 @@ async def create_engine(
     >>>   hello(name: String!): String!
     >>> }''')
     """
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments,too-many-locals
     e = Engine()
 
     await e.cook(
@@ -104,8 +153,19 @@ async def create_engine(
         json_loader=json_loader,
         custom_default_arguments_coercer=custom_default_arguments_coercer,
         coerce_list_concurrently=coerce_list_concurrently,
+        list_max_concurrency=list_max_concurrency,
+        max_concurrent_resolvers=max_concurrent_resolvers,
+        max_concurrent_resolvers_per_execution=max_concurrent_resolvers_per_execution,
         coerce_parent_concurrently=coerce_parent_concurrently,
         sdl_file_encoding=sdl_file_encoding,
+        query_parser_mode=query_parser_mode,
+        persisted_query_store=persisted_query_store,
+        persisted_query_allowlist_only=persisted_query_allowlist_only,
+        normalize_queries=normalize_queries,
+        response_cache=response_cache,
+        source_shapes=source_shapes,
+        tracing=tracing,
+        instruments=instruments,
     )
 
     return e
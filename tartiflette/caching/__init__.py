@@ -0,0 +1,6 @@
+from tartiflette.caching.base import CacheStore
+from tartiflette.caching.memory import MemoryCacheStore
+from tartiflette.caching.policy import CachePolicy
+from tartiflette.caching.response import ResponseCache
+
+__all__ = ("CacheStore", "CachePolicy", "MemoryCacheStore", "ResponseCache")
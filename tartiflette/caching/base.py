@@ -0,0 +1,130 @@
+import hashlib
+import json
+
+from collections.abc import Mapping
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+__all__ = ("CacheStore", "compute_key_digest", "freeze_value")
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Converts a value into an equivalent representation which doesn't depend
+    on the order of the items of its dictionaries.
+    :param value: the value to convert
+    :type value: Any
+    :return: the frozen value
+    :rtype: Any
+    """
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted(
+                (
+                    (str(key), freeze_value(item))
+                    for key, item in value.items()
+                ),
+                key=lambda item: item[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    return value
+
+
+def _encode_key_part(value: Any) -> Any:
+    """
+    Converts the parts of a cache key which aren't natively serializable to
+    JSON into an equivalent serializable representation.
+    :param value: the part of the key to convert
+    :type value: Any
+    :return: the serializable representation of the part
+    :rtype: Any
+    :raises TypeError: if the part has no stable representation
+    """
+    if isinstance(value, (set, frozenset)):
+        # Items are sorted through their serialized representation since
+        # the iteration order of sets isn't stable across processes
+        return sorted(_dump_key(item) for item in value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal, date, time)):
+        return str(value)
+    raise TypeError(
+        f"< {value!r} > can't be part of a cache key, only values which "
+        "can be serialized to JSON, sets, enums, UUIDs, decimals & dates "
+        "are supported."
+    )
+
+
+def _dump_key(value: Any) -> str:
+    """
+    Serializes a cache key to JSON, independently of the order of the items
+    of its dictionaries & sets.
+    :param value: the key to serialize
+    :type value: Any
+    :return: the serialized key
+    :rtype: str
+    :raises TypeError: if a part of the key has no stable representation
+    """
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_encode_key_part,
+    )
+
+
+def compute_key_digest(value: Any) -> str:
+    """
+    Computes the digest of a cache key, which only depends on its content so
+    that it's stable across executions & processes (e.g. for shared stores).
+    :param value: the key from which to compute the digest
+    :type value: Any
+    :return: the hexadecimal SHA-256 digest of the key
+    :rtype: str
+    :raises TypeError: if a part of the key has no stable representation
+    """
+    return hashlib.sha256(_dump_key(value).encode("utf-8")).hexdigest()
+
+
+class CacheStore:
+    """
+    Base class of the stores of the field cache, which maps the string keys
+    computed by the `@cached` directive to resolved values. Methods are
+    coroutines so that remote stores (e.g. Redis) can be implemented.
+    """
+
+    async def get(self, key: str) -> Any:
+        """
+        Returns the value stored under the key, or UNDEFINED_VALUE if the
+        key is unknown or expired.
+        :param key: the key to look up
+        :type key: str
+        :return: the value stored under the key or UNDEFINED_VALUE
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Stores the value under the key for `ttl` seconds.
+        :param key: the key of the value
+        :param value: the value to store
+        :param ttl: number of seconds during which the value is valid
+        :type key: str
+        :type value: Any
+        :type ttl: float
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """
+        Removes the value stored under the key if any.
+        :param key: the key to remove
+        :type key: str
+        """
+        raise NotImplementedError
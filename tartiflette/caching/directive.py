@@ -0,0 +1,209 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional
+
+from tartiflette import Directive
+from tartiflette.caching.base import compute_key_digest
+from tartiflette.caching.memory import MemoryCacheStore
+from tartiflette.constants import UNDEFINED_VALUE
+
+__all__ = (
+    "CachedDirective",
+    "compute_field_cache_key",
+    "default_parent_key",
+    "bake",
+)
+
+
+def default_parent_key(parent: Any, info: "ResolveInfo") -> Optional[Any]:
+    """
+    Computes the identity of the parent of a cached field: fields of the
+    root types don't depend on their parent, other parents are identified
+    by their `id` key or attribute.
+    :param parent: field parent value
+    :param info: information related to the execution and the resolved field
+    :type parent: Any
+    :type info: ResolveInfo
+    :return: the identity of the parent or None if it can't be identified
+    :rtype: Optional[Any]
+    """
+    if info.parent_type is info.schema.get_operation_root_type(info.operation):
+        return ()
+
+    if isinstance(parent, Mapping):
+        return parent.get("id")
+    return getattr(parent, "id", None)
+
+
+def compute_field_cache_key(
+    info: "ResolveInfo",
+    parent_key: Any,
+    args: Dict[str, Any],
+    context_key: Optional[Any] = None,
+) -> str:
+    """
+    Computes the store key of the value of a field.
+    :param info: information related to the execution and the resolved field
+    :param parent_key: identity of the field parent value
+    :param args: computed arguments related to the resolved field
+    :param context_key: key derived from the context for private values
+    :type info: ResolveInfo
+    :type parent_key: Any
+    :type args: Dict[str, Any]
+    :type context_key: Optional[Any]
+    :return: the store key of the field value
+    :rtype: str
+    :raises TypeError: if the parent key, the arguments or the context key
+    can't be serialized to JSON (except sets, enums, UUIDs, decimals & dates)
+    """
+    digest = compute_key_digest([parent_key, args, context_key])
+    return f"{info.parent_type.name}.{info.field_name}:{digest}"
+
+
+class CachedDirective:
+    """
+    Directive caching the resolved values of a field in a store, per parent,
+    arguments and, for PRIVATE values, per key derived from the context.
+    """
+
+    def __init__(
+        self,
+        store: "CacheStore",
+        context_key: Optional[Callable[[Optional[Any]], Optional[Any]]] = None,
+        parent_key: Callable[
+            [Any, "ResolveInfo"], Optional[Any]
+        ] = default_parent_key,
+    ) -> None:
+        """
+        :param store: the store of the cached values
+        :param context_key: callable computing the key of private values
+        from the context
+        :param parent_key: callable computing the identity of a parent value
+        :type store: CacheStore
+        :type context_key: Optional[Callable[[Optional[Any]], Optional[Any]]]
+        :type parent_key: Callable[[Any, ResolveInfo], Optional[Any]]
+        """
+        self.store = store
+        self.context_key = context_key
+        self.parent_key = parent_key
+
+    def get_key(
+        self,
+        directive_args: Dict[str, Any],
+        parent: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> Optional[str]:
+        """
+        Computes the store key of the field value, if it can be cached (only
+        the values of query operations are cached).
+        :param directive_args: arguments passed to the directive
+        :param parent: field parent value
+        :param args: computed arguments related to the resolved field
+        :param ctx: context passed to the query execution
+        :param info: information related to the execution and the resolved
+        field
+        :type directive_args: Dict[str, Any]
+        :type parent: Optional[Any]
+        :type args: Dict[str, Any]
+        :type ctx: Optional[Any]
+        :type info: ResolveInfo
+        :return: the store key of the field value or None
+        :rtype: Optional[str]
+        """
+        # pylint: disable=too-many-arguments
+        if info.operation is None or info.operation.operation_type != "query":
+            return None
+
+        parent_key = self.parent_key(parent, info)
+        if parent_key is None:
+            return None
+
+        context_key = None
+        if directive_args["scope"] == "PRIVATE":
+            if self.context_key is None:
+                return None
+            context_key = self.context_key(ctx)
+            if context_key is None:
+                return None
+
+        return compute_field_cache_key(info, parent_key, args, context_key)
+
+    async def on_field_execution(
+        self,
+        directive_args: Dict[str, Any],
+        next_resolver: Callable,
+        parent: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> Any:
+        """
+        Returns the cached value of the field if any, otherwise resolves and
+        caches it.
+        :param directive_args: arguments passed to the directive
+        :param next_resolver: next resolver to call
+        :param parent: field parent value
+        :param args: computed arguments related to the resolved field
+        :param ctx: context passed to the query execution
+        :param info: information related to the execution and the resolved
+        field
+        :type directive_args: Dict[str, Any]
+        :type next_resolver: Callable
+        :type parent: Optional[Any]
+        :type args: Dict[str, Any]
+        :type ctx: Optional[Any]
+        :type info: ResolveInfo
+        :return: the value of the field
+        :rtype: Any
+        """
+        # pylint: disable=too-many-arguments
+        key = self.get_key(directive_args, parent, args, ctx, info)
+        if key is None:
+            return await next_resolver(parent, args, ctx, info)
+
+        value = await self.store.get(key)
+        if value is not UNDEFINED_VALUE:
+            return value
+
+        value = await next_resolver(parent, args, ctx, info)
+        await self.store.set(key, value, directive_args["ttl"])
+        return value
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive (`store`, `context_key`
+    and `parent_key`)
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    config = config or {}
+    store = config.get("store")
+    Directive("cached", schema_name=schema_name)(
+        CachedDirective(
+            store if store is not None else MemoryCacheStore(),
+            context_key=config.get("context_key"),
+            parent_key=config.get("parent_key") or default_parent_key,
+        )
+    )
+    return '''
+    """Scope of a cached value."""
+    enum CacheScope {
+        """The value is shared by every request."""
+        PUBLIC
+        """The value is specific to the key derived from the context."""
+        PRIVATE
+    }
+
+    """Caches the resolved values of the field for `ttl` seconds."""
+    directive @cached(
+        ttl: Int!
+        scope: CacheScope = PUBLIC
+    ) on FIELD_DEFINITION
+    '''
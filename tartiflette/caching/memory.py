@@ -0,0 +1,131 @@
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from tartiflette.caching.base import CacheStore
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.query_cache import get_retained_size
+
+__all__ = ("MemoryCacheStore",)
+
+
+class MemoryCacheStore(CacheStore):
+    """
+    In-process cache store expiring the values after their TTL and evicting
+    the least recently used values once `max_entries` is reached or, when
+    `max_size` is provided, once the size of the values, as computed by
+    `sizeof`, exceeds it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_size: Optional[int] = None,
+        sizeof: Callable[[Any], int] = get_retained_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_entries: maximum number of stored values
+        :param max_size: maximum size of the stored values (unbounded if
+        `None`)
+        :param sizeof: callable computing the size of a value when
+        `max_size` is provided, defaults to the approximate amount of memory,
+        in bytes, retained by the value (which walks through the whole value)
+        :param clock: callable returning the current time, in seconds
+        :type max_entries: int
+        :type max_size: Optional[int]
+        :type sizeof: Callable[[Any], int]
+        :type clock: Callable[[], float]
+        """
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._sizeof = sizeof
+        self._clock = clock
+        # Maps a key to a (value, expiration time, retained size) tuple
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored values, including expired ones which
+        haven't been looked up since their expiration.
+        :return: the number of stored values
+        :rtype: int
+        """
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any:
+        """
+        Returns the value stored under the key, or UNDEFINED_VALUE if the
+        key is unknown or expired.
+        :param key: the key to look up
+        :type key: str
+        :return: the value stored under the key or UNDEFINED_VALUE
+        :rtype: Any
+        """
+        try:
+            value, expires_at, _ = self._entries[key]
+        except KeyError:
+            return UNDEFINED_VALUE
+
+        if expires_at <= self._clock():
+            self._remove(key)
+            return UNDEFINED_VALUE
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Stores the value under the key for `ttl` seconds.
+        :param key: the key of the value
+        :param value: the value to store
+        :param ttl: number of seconds during which the value is valid
+        :type key: str
+        :type value: Any
+        :type ttl: float
+        """
+        self._remove(key)
+        if ttl <= 0:
+            return
+
+        size = self._sizeof(value) if self._max_size is not None else 0
+        if self._max_size is not None and size > self._max_size:
+            return
+
+        self._entries[key] = (value, self._clock() + ttl, size)
+        self._size += size
+        while len(self._entries) > self._max_entries or (
+            self._max_size is not None and self._size > self._max_size
+        ):
+            self._remove(next(iter(self._entries)))
+
+    async def delete(self, key: str) -> None:
+        """
+        Removes the value stored under the key if any.
+        :param key: the key to remove
+        :type key: str
+        """
+        self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Removes all the stored values.
+        """
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        """
+        Removes the entry of the key if any.
+        :param key: the key to remove
+        :type key: str
+        """
+        try:
+            _, _, size = self._entries.pop(key)
+        except KeyError:
+            return
+        self._size -= size
@@ -0,0 +1,110 @@
+from typing import Any, Dict, Optional, Tuple
+
+from tartiflette.language.ast import EnumValueNode, IntValueNode
+from tartiflette.types.helpers.definition import get_wrapped_type, is_leaf_type
+
+__all__ = ("CachePolicy", "compute_field_cache_hint")
+
+_CACHED_DIRECTIVE_NAME = "cached"
+
+
+def compute_field_cache_hint(
+    field_definition: "GraphQLField",
+) -> Optional[Tuple[Optional[int], Optional[str]]]:
+    """
+    Computes the cache hint of a field from its `@cached` SDL directive.
+    Fields returning composite types without directive get an empty hint,
+    which restricts the response to the default max age, while leaf fields
+    without directive don't restrict the response.
+    :param field_definition: the baked GraphQLField instance
+    :type field_definition: GraphQLField
+    :return: the max age & scope of the field or None
+    :rtype: Optional[Tuple[Optional[int], Optional[str]]]
+    """
+    for directive_node in field_definition.directives or []:
+        if directive_node.name.value != _CACHED_DIRECTIVE_NAME:
+            continue
+
+        max_age = None
+        scope = "PUBLIC"
+        for argument_node in directive_node.arguments or []:
+            if argument_node.name.value == "ttl" and isinstance(
+                argument_node.value, IntValueNode
+            ):
+                max_age = int(argument_node.value.value)
+            elif argument_node.name.value == "scope" and isinstance(
+                argument_node.value, EnumValueNode
+            ):
+                scope = argument_node.value.value
+        return max_age, scope
+
+    if is_leaf_type(get_wrapped_type(field_definition.graphql_type)):
+        return None
+    return None, None
+
+
+class CachePolicy:
+    """
+    Aggregates the cache hints of the fields resolved during an execution
+    into the max age & scope of the whole response: the minimum max age and
+    the most restrictive scope.
+    """
+
+    __slots__ = ("default_max_age", "max_age", "scope")
+
+    def __init__(self, default_max_age: int = 0) -> None:
+        """
+        :param default_max_age: max age of the root fields and of the fields
+        returning composite types which don't declare their own
+        :type default_max_age: int
+        """
+        self.default_max_age = default_max_age
+        self.max_age: Optional[int] = None
+        self.scope = "PUBLIC"
+
+    def restrict(self, max_age: Optional[int], scope: Optional[str]) -> None:
+        """
+        Restricts the policy with a cache hint.
+        :param max_age: max age of the hint, in seconds
+        :param scope: scope of the hint
+        :type max_age: Optional[int]
+        :type scope: Optional[str]
+        """
+        if max_age is not None and (
+            self.max_age is None or max_age < self.max_age
+        ):
+            self.max_age = max_age
+        if scope == "PRIVATE":
+            self.scope = scope
+
+    def add_field_hint(
+        self, field_definition: "GraphQLField", is_root_field: bool
+    ) -> None:
+        """
+        Restricts the policy with the cache hint of a resolved field.
+        :param field_definition: GraphQLField instance of the resolved field
+        :param is_root_field: whether or not the field is a root field
+        :type field_definition: GraphQLField
+        :type is_root_field: bool
+        """
+        hint = field_definition.cache_hint
+        if hint is None:
+            if not is_root_field:
+                return
+            hint = (None, None)
+
+        max_age, scope = hint
+        self.restrict(
+            max_age if max_age is not None else self.default_max_age, scope
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the `cacheControl` extension of the response.
+        :return: the max age & scope of the response
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "maxAge": self.max_age if self.max_age is not None else 0,
+            "scope": self.scope,
+        }
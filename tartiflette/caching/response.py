@@ -0,0 +1,141 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
+
+from tartiflette.caching.base import compute_key_digest
+from tartiflette.caching.memory import MemoryCacheStore
+from tartiflette.caching.policy import CachePolicy
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.helpers import get_operation_type
+from tartiflette.execution.response import copy_response
+from tartiflette.language.normalize import normalize_query
+
+__all__ = ("ResponseCache",)
+
+
+class ResponseCache:
+    """
+    Caches the whole responses of query operations, for the minimum max age
+    declared through `@cached` by the fields resolved during the execution.
+    Responses containing errors or PRIVATE fields aren't cached.
+    """
+
+    def __init__(
+        self,
+        store: Optional["CacheStore"] = None,
+        context_key: Optional[Callable[[Optional[Any]], Optional[Any]]] = None,
+        default_max_age: int = 0,
+        normalized_queries_maxsize: int = 1024,
+    ) -> None:
+        """
+        :param store: the store of the cached responses
+        :param context_key: callable computing the part of the key derived
+        from the context (e.g. the tenant)
+        :param default_max_age: max age of the root fields and of the fields
+        returning composite types which don't declare their own
+        :param normalized_queries_maxsize: maximum number of normalized
+        queries kept in memory
+        :type store: Optional[CacheStore]
+        :type context_key: Optional[Callable[[Optional[Any]], Optional[Any]]]
+        :type default_max_age: int
+        :type normalized_queries_maxsize: int
+        """
+        self.store = store if store is not None else MemoryCacheStore()
+        self.context_key = context_key
+        self.default_max_age = default_max_age
+        self._normalize_query = lru_cache(maxsize=normalized_queries_maxsize)(
+            normalize_query
+        )
+
+    def create_policy(self) -> "CachePolicy":
+        """
+        Creates the policy aggregating the cache hints of an execution.
+        :return: a new cache policy
+        :rtype: CachePolicy
+        """
+        return CachePolicy(self.default_max_age)
+
+    def get_key(
+        self,
+        document: "DocumentNode",
+        query: Optional[Union[str, bytes]],
+        query_id: Optional[str],
+        operation_name: Optional[str],
+        variables: Optional[Dict[str, Any]],
+        context: Optional[Any],
+    ) -> Optional[str]:
+        """
+        Computes the store key of the response of a request, if it can be
+        cached.
+        :param document: the DocumentNode instance linked to the GraphQL
+        request
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query_id: the persisted query identifier of the query
+        :param operation_name: the operation name to execute
+        :param variables: the variables provided in the GraphQL request
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :type document: DocumentNode
+        :type query: Optional[Union[str, bytes]]
+        :type query_id: Optional[str]
+        :type operation_name: Optional[str]
+        :type variables: Optional[Dict[str, Any]]
+        :type context: Optional[Any]
+        :return: the store key of the response or None
+        :rtype: Optional[str]
+        """
+        # pylint: disable=too-many-arguments
+        if get_operation_type(document, operation_name) != "query":
+            return None
+
+        if query is not None:
+            try:
+                query = self._normalize_query(query)
+            except TypeError:
+                # Unhashable query
+                return None
+            if isinstance(query, bytes):
+                query = query.decode("utf-8")
+
+        return "response:" + compute_key_digest(
+            [
+                query if query is not None else query_id,
+                operation_name,
+                variables or {},
+                self.context_key(context)
+                if self.context_key is not None
+                else None,
+            ]
+        )
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached response stored under the key if any.
+        :param key: the store key of the response
+        :type key: str
+        :return: a copy of the cached response if any
+        :rtype: Optional[Dict[str, Any]]
+        """
+        response = await self.store.get(key)
+        if response is UNDEFINED_VALUE:
+            return None
+        return copy_response(response)
+
+    async def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Stores a copy of the response under the key if it doesn't contain
+        errors and its cache hint allows it to be shared.
+        :param key: the store key of the response
+        :param response: the computed response
+        :type key: str
+        :type response: Dict[str, Any]
+        """
+        if response.get("errors"):
+            return
+
+        try:
+            hint = response["extensions"]["cacheControl"]
+        except (KeyError, TypeError):
+            return
+
+        if hint["scope"] == "PUBLIC" and hint["maxAge"] > 0:
+            await self.store.set(key, copy_response(response), hint["maxAge"])
@@ -1,3 +1,5 @@
+import asyncio
+
 from typing import Any, Callable, Dict, List
 
 from tartiflette.execution.collect import collect_subfields
@@ -77,6 +79,11 @@ async def complete_value_catching_error(
         return await output_coercer(
             result, info, execution_context, field_nodes, path
         )
+    except asyncio.CancelledError:
+        # The value is discarded, so are the errors its completion recorded,
+        # so that only the errors of completed values are reported
+        execution_context.drop_errors(path)
+        raise
     except Exception as raw_exception:  # pylint: disable=broad-except
         return handle_field_error(
             raw_exception, field_nodes, path, return_type, execution_context
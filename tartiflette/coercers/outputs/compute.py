@@ -1,51 +1,103 @@
 from functools import partial
-from typing import Callable
+from typing import Callable, Optional
 
+from tartiflette.coercers.outputs.enum_coercer import (
+    coerce_enum_output,
+    coerce_enum_outputs,
+)
 from tartiflette.coercers.outputs.list_coercer import (
+    leaf_list_coercer,
     list_coercer_concurrently,
     list_coercer_sequentially,
 )
 from tartiflette.coercers.outputs.non_null_coercer import non_null_coercer
+from tartiflette.coercers.outputs.scalar_coercer import (
+    coerce_scalar_output,
+    coerce_scalar_outputs,
+)
+from tartiflette.types.helpers.definition import (
+    get_wrapped_type,
+    is_enum_type,
+    is_plain_leaf_type,
+)
 
 __all__ = ("get_output_coercer",)
 
 
+def get_leaf_list_coercer(item_type: "GraphQLOutputType") -> Callable:
+    """
+    Computes and returns the output coercer to use for lists of scalar or
+    enum values on which no directive is applied.
+    :param item_type: the schema type of the list items
+    :type item_type: GraphQLOutputType
+    :return: the computed coercer
+    :rtype: Callable
+    """
+    leaf_type = get_wrapped_type(item_type)
+    if is_enum_type(leaf_type):
+        coerce_output = partial(coerce_enum_output, enum_type=leaf_type)
+        coerce_output_many = partial(coerce_enum_outputs, enum_type=leaf_type)
+    else:
+        coerce_output = partial(coerce_scalar_output, scalar_type=leaf_type)
+        coerce_output_many = partial(
+            coerce_scalar_outputs, scalar_type=leaf_type
+        )
+
+    return partial(
+        leaf_list_coercer,
+        item_type=item_type,
+        coerce_output=coerce_output,
+        coerce_output_many=coerce_output_many,
+    )
+
+
 def get_output_coercer(
-    graphql_type: "GraphQLType", concurrently: bool
+    graphql_type: "GraphQLType",
+    concurrently: bool,
+    max_concurrency: Optional[int] = None,
 ) -> Callable:
     """
     Computes and returns the output coercer to use for the filled in schema
     type.
     :param graphql_type: the schema type for which compute the coercer
     :param concurrently: whether list should be coerced concurrently
+    :param max_concurrency: maximum number of items of a list coerced
+    concurrently
     :type graphql_type: GraphQLType
     :type concurrently: bool
+    :type max_concurrency: Optional[int]
     :return: the computed coercer wrap with directives if defined
     :rtype: Callable
     """
     inner_type = graphql_type
     wrapper_coercers = []
+    coercer = None
     while inner_type.is_wrapping_type:
         wrapped_type = inner_type.wrapped_type
+        if inner_type.is_list_type and is_plain_leaf_type(wrapped_type):
+            coercer = get_leaf_list_coercer(wrapped_type)
+            break
         if inner_type.is_list_type:
             wrapper_coercers.append(
                 partial(
-                    list_coercer_concurrently
-                    if concurrently
-                    else list_coercer_sequentially,
+                    list_coercer_concurrently,
                     item_type=wrapped_type,
+                    max_concurrency=max_concurrency,
                 )
+                if concurrently
+                else partial(list_coercer_sequentially, item_type=wrapped_type)
             )
         elif inner_type.is_non_null_type:
             wrapper_coercers.append(non_null_coercer)
         inner_type = wrapped_type
 
-    try:
-        coercer = inner_type.output_coercer
-    except AttributeError:
-        # This case should never happen and raise an exception at schema
-        # validation time.
-        coercer = lambda *args, **kwargs: None
+    if coercer is None:
+        try:
+            coercer = inner_type.output_coercer
+        except AttributeError:
+            # This case should never happen and raise an exception at schema
+            # validation time.
+            coercer = lambda *args, **kwargs: None
 
     for wrapper_coercer in reversed(wrapper_coercers):
         coercer = partial(wrapper_coercer, inner_coercer=coercer)
@@ -4,7 +4,46 @@ from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.utils.values import is_invalid_value
 
-__all__ = ("enum_coercer",)
+__all__ = ("coerce_enum_output", "coerce_enum_outputs", "enum_coercer")
+
+
+def coerce_enum_output(result: Any, enum_type: "GraphQLEnumType") -> Any:
+    """
+    Coerces a resolved value of an enum type whose values don't have any
+    directive.
+    :param result: resolved value
+    :param enum_type: the GraphQLEnumType instance of the enum
+    :type result: Any
+    :type enum_type: GraphQLEnumType
+    :return: the coerced value
+    :rtype: Any
+    """
+    if result is None:
+        return None
+
+    try:
+        enum_type.get_value(result)
+    except KeyError:
+        raise ValueError(
+            f"Expected value of type {enum_type} but received {type(result)}."
+        )
+    return result
+
+
+def coerce_enum_outputs(
+    results: List[Any], enum_type: "GraphQLEnumType"
+) -> List[Any]:
+    """
+    Coerces a list of resolved values of an enum type whose values don't have
+    any directive.
+    :param results: resolved values
+    :param enum_type: the GraphQLEnumType instance of the enum
+    :type results: List[Any]
+    :type enum_type: GraphQLEnumType
+    :return: the coerced values
+    :rtype: List[Any]
+    """
+    return [coerce_enum_output(result, enum_type) for result in results]
 
 
 @null_coercer_wrapper
@@ -1,13 +1,132 @@
 import asyncio
 
-from typing import Any, Callable, List
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
 
 from tartiflette.coercers.common import Path
+from tartiflette.coercers.outputs.common import handle_field_error
 from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
+from tartiflette.resolver.batch import (
+    release_batch_entries,
+    reserve_batch_entries,
+)
 from tartiflette.resolver.factory import complete_value_catching_error
 from tartiflette.utils.errors import extract_exceptions_from_results
+from tartiflette.utils.tasks import gather_until_error
 
-__all__ = ("list_coercer_sequentially", "list_coercer_concurrently")
+__all__ = (
+    "leaf_list_coercer",
+    "list_coercer_sequentially",
+    "list_coercer_concurrently",
+)
+
+
+# Formats of the buffers whose items can be read as Python values
+_BUFFER_FORMATS = frozenset("?bBhHiIlLqQnNfd")
+
+
+def _get_buffer(result: Any) -> Optional[memoryview]:
+    """
+    Returns a one-dimensional view on the resolved value of a list field if it
+    implements the buffer protocol (`array.array`, `memoryview`, NumPy
+    arrays...) with a numeric or boolean format.
+    :param result: resolved value
+    :type result: Any
+    :return: a view on the buffer of the resolved value if any
+    :rtype: Optional[memoryview]
+    """
+    if isinstance(result, (str, bytes, bytearray)):
+        return None
+
+    try:
+        buffer = memoryview(result)
+    except TypeError:
+        return None
+
+    if buffer.ndim != 1 or buffer.format not in _BUFFER_FORMATS:
+        return None
+    return buffer
+
+
+async def _to_list(result: Any, info: "ResolveInfo") -> List[Any]:
+    """
+    Converts the resolved value of a list field into a list.
+    :param result: resolved value
+    :param info: information related to the execution and the resolved field
+    :type result: Any
+    :type info: ResolveInfo
+    :return: the items of the resolved value
+    :rtype: List[Any]
+    """
+    if not isinstance(result, (str, bytes, bytearray, Mapping)):
+        if hasattr(result, "__aiter__"):
+            return [item async for item in result]
+
+        if isinstance(result, memoryview) and result.ndim > 1:
+            # Sub-views of multi-dimensional memoryviews can't be iterated
+            return result.tolist()
+
+        try:
+            iterator = iter(result)
+        except TypeError:
+            pass
+        else:
+            # Errors raised while iterating (e.g. by a generator) propagate
+            return list(iterator)
+
+    raise TypeError(
+        "Expected Iterable, but did not find one for field "
+        f"{info.parent_type.name}.{info.field_name}."
+    )
+
+
+async def _complete_items(
+    items: Iterator[Tuple[int, Any]],
+    results: List[Any],
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    paths: List["Path"],
+    item_type: "GraphQLOutputType",
+    inner_coercer: Callable,
+) -> None:
+    """
+    Completes the items of a list one after the other, until there is no item
+    left to complete, and stores their value at their index in the results.
+    Stops at the first item whose error propagates to the list.
+    :param items: iterator of the indexes & items left to complete
+    :param results: list of the computed values
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param paths: the paths of the items
+    :param item_type: GraphQLType of list items
+    :param inner_coercer: the pre-computed coercer to use on the items
+    :type items: Iterator[Tuple[int, Any]]
+    :type results: List[Any]
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type paths: List[Path]
+    :type item_type: GraphQLOutputType
+    :type inner_coercer: Callable
+    """
+    # pylint: disable=too-many-arguments
+    for index, item in items:
+        try:
+            results[index] = await complete_value_catching_error(
+                item,
+                info,
+                execution_context,
+                field_nodes,
+                paths[index],
+                item_type,
+                inner_coercer,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            results[index] = e
+            raise
 
 
 @null_coercer_wrapper
@@ -41,26 +160,32 @@ async def list_coercer_sequentially(
     """
     # pylint: disable=too-many-locals
     if not isinstance(result, list):
-        raise TypeError(
-            "Expected Iterable, but did not find one for field "
-            f"{info.parent_type.name}.{info.field_name}."
-        )
+        result = await _to_list(result, info)
 
+    paths = [Path(path, index) for index in range(len(result))]
+    reserved = await reserve_batch_entries(
+        result, paths, info, execution_context, field_nodes, item_type
+    )
     results = []
-    for index, item in enumerate(result):
-        try:
-            value = await complete_value_catching_error(
-                item,
-                info,
-                execution_context,
-                field_nodes,
-                Path(path, index),
-                item_type,
-                inner_coercer,
-            )
-        except Exception as e:  # pylint: disable=broad-except
-            value = e
-        results.append(value)
+    try:
+        for item, item_path in zip(result, paths):
+            try:
+                value = await complete_value_catching_error(
+                    item,
+                    info,
+                    execution_context,
+                    field_nodes,
+                    item_path,
+                    item_type,
+                    inner_coercer,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                value = e
+            results.append(value)
+    finally:
+        release_batch_entries(execution_context, reserved)
 
     exceptions = extract_exceptions_from_results(results)
     if exceptions:
@@ -78,6 +203,7 @@ async def list_coercer_concurrently(
     path: "Path",
     item_type: "GraphQLOutputType",
     inner_coercer: Callable,
+    max_concurrency: Optional[int] = None,
 ) -> List[Any]:
     """
     Computes the value of a list.
@@ -88,6 +214,7 @@ async def list_coercer_concurrently(
     :param path: the path traveled until this resolver
     :param item_type: GraphQLType of list items
     :param inner_coercer: the pre-computed coercer to use on the result
+    :param max_concurrency: maximum number of items completed concurrently
     :type result: Any
     :type info: ResolveInfo
     :type execution_context: ExecutionContext
@@ -95,30 +222,206 @@ async def list_coercer_concurrently(
     :type path: Path
     :type item_type: GraphQLOutputType
     :type inner_coercer: Callable
+    :type max_concurrency: Optional[int]
     :return: the computed value
     :rtype: List[Any]
     """
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals,too-many-arguments
     if not isinstance(result, list):
-        raise TypeError(
-            "Expected Iterable, but did not find one for field "
-            f"{info.parent_type.name}.{info.field_name}."
-        )
-
-    results = await asyncio.gather(
-        *[
-            complete_value_catching_error(
-                item,
-                info,
-                execution_context,
-                field_nodes,
-                Path(path, index),
-                item_type,
-                inner_coercer,
+        result = await _to_list(result, info)
+
+    paths = [Path(path, index) for index in range(len(result))]
+    reserved = await reserve_batch_entries(
+        result, paths, info, execution_context, field_nodes, item_type
+    )
+    try:
+        if max_concurrency is not None and len(result) > max_concurrency:
+            # Only `max_concurrency` items are completed at a time, by as
+            # many tasks taking the next item to complete once they're done
+            results = [None] * len(result)
+            items = enumerate(result)
+            await gather_until_error(
+                [
+                    _complete_items(
+                        items,
+                        results,
+                        info,
+                        execution_context,
+                        field_nodes,
+                        paths,
+                        item_type,
+                        inner_coercer,
+                    )
+                    for _ in range(max_concurrency)
+                ],
+                execution_context.batch_scheduler.spawned,
+            )
+        else:
+            results = await gather_until_error(
+                [
+                    complete_value_catching_error(
+                        item,
+                        info,
+                        execution_context,
+                        field_nodes,
+                        item_path,
+                        item_type,
+                        inner_coercer,
+                    )
+                    for item, item_path in zip(result, paths)
+                ],
+                execution_context.batch_scheduler.spawned,
             )
-            for index, item in enumerate(result)
-        ],
-        return_exceptions=True,
+    finally:
+        release_batch_entries(execution_context, reserved)
+
+    exceptions = extract_exceptions_from_results(results)
+    if exceptions:
+        raise exceptions
+
+    return results
+
+
+def _coerce_leaf_items_at_once(
+    result: Any, item_type: "GraphQLOutputType", coerce_output_many: Callable
+) -> Optional[List[Any]]:
+    """
+    Coerces the items of a list of leaf values at once.
+    :param result: the items or the buffer to coerce
+    :param item_type: GraphQLType of list items
+    :param coerce_output_many: callable to use to coerce all the items
+    :type result: Any
+    :type item_type: GraphQLOutputType
+    :type coerce_output_many: Callable
+    :return: the coerced items or None if they have to be coerced one by one
+    in order to locate their errors
+    :rtype: Optional[List[Any]]
+    """
+    try:
+        results = coerce_output_many(result)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    if (
+        not item_type.is_non_null_type
+        or isinstance(results, memoryview)
+        or None not in results
+    ):
+        return results
+    return None
+
+
+def _coerce_leaf_items_one_by_one(
+    result: Any,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    coerce_output: Callable,
+) -> List[Any]:
+    """
+    Coerces the items of a list of leaf values one by one, in order to locate
+    their errors.
+    :param result: the items or the buffer to coerce
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param coerce_output: callable to use to coerce an item
+    :type result: Any
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type coerce_output: Callable
+    :return: the coerced items
+    :rtype: List[Any]
+    """
+    if isinstance(result, memoryview):
+        result = result.tolist()
+
+    results = []
+    for index, item in enumerate(result):
+        try:
+            value = coerce_output(item)
+            if value is None and item_type.is_non_null_type:
+                raise ValueError(
+                    "Cannot return null for non-nullable field "
+                    f"{info.parent_type.name}.{info.field_name}."
+                )
+        except Exception as raw_exception:  # pylint: disable=broad-except
+            # The item resolves to null when its error doesn't propagate
+            value = None
+            try:
+                handle_field_error(
+                    raw_exception,
+                    field_nodes,
+                    Path(path, index),
+                    item_type,
+                    execution_context,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                value = e
+        results.append(value)
+    return results
+
+
+@null_coercer_wrapper
+async def leaf_list_coercer(
+    result: Any,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    coerce_output: Callable,
+    coerce_output_many: Callable,
+) -> List[Any]:
+    """
+    Computes the value of a list of scalar or enum values on which no
+    directive is applied. The items are coerced at once, in a synchronous
+    loop, and are only coerced one by one to locate their errors if this
+    fails. Buffers (`array.array`, NumPy arrays...) are handed over as a
+    `memoryview` to `coerce_output_many`, without being converted into a
+    list first.
+    :param result: resolved value
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param coerce_output: callable to use to coerce an item
+    :param coerce_output_many: callable to use to coerce all the items
+    :type result: Any
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type coerce_output: Callable
+    :type coerce_output_many: Callable
+    :return: the computed value
+    :rtype: List[Any]
+    """
+    if not isinstance(result, list):
+        buffer = _get_buffer(result)
+        result = buffer if buffer is not None else await _to_list(result, info)
+
+    results = _coerce_leaf_items_at_once(result, item_type, coerce_output_many)
+    if results is not None:
+        return results
+
+    results = _coerce_leaf_items_one_by_one(
+        result,
+        info,
+        execution_context,
+        field_nodes,
+        path,
+        item_type,
+        coerce_output,
     )
 
     exceptions = extract_exceptions_from_results(results)
@@ -1,9 +1,48 @@
-from typing import Any, List
+from typing import Any, List, Union
 
 from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
 from tartiflette.utils.values import is_invalid_value
 
-__all__ = ("scalar_coercer",)
+__all__ = ("coerce_scalar_output", "coerce_scalar_outputs", "scalar_coercer")
+
+
+def coerce_scalar_output(result: Any, scalar_type: "GraphQLScalar") -> Any:
+    """
+    Coerces a resolved value of a scalar type.
+    :param result: resolved value
+    :param scalar_type: the GraphQLType instance of the scalar
+    :type result: Any
+    :type scalar_type: GraphQLScalar
+    :return: the coerced value
+    :rtype: Any
+    """
+    if result is None:
+        return None
+
+    coerced_result = scalar_type.coerce_output(result)
+    if is_invalid_value(coerced_result):
+        raise ValueError(
+            f"Expected value of type {scalar_type} but received {type(result)}."
+        )
+    return coerced_result
+
+
+def coerce_scalar_outputs(
+    results: Union[List[Any], memoryview], scalar_type: "GraphQLScalar"
+) -> List[Any]:
+    """
+    Coerces a list of resolved values of a scalar type at once, with the
+    `coerce_output_many` method of the scalar implementation if it has one.
+    :param results: resolved values
+    :param scalar_type: the GraphQLType instance of the scalar
+    :type results: Union[List[Any], memoryview]
+    :type scalar_type: GraphQLScalar
+    :return: the coerced values
+    :rtype: List[Any]
+    """
+    if scalar_type.coerce_output_many is not None:
+        return scalar_type.coerce_output_many(results)
+    return [coerce_scalar_output(result, scalar_type) for result in results]
 
 
 @null_coercer_wrapper
@@ -33,9 +72,4 @@ async def scalar_coercer(
     :rtype: Any
     """
     # pylint: disable=unused-argument
-    coerced_result = scalar_type.coerce_output(result)
-    if is_invalid_value(coerced_result):
-        raise ValueError(
-            f"Expected value of type {scalar_type} but received {type(result)}."
-        )
-    return coerced_result
+    return coerce_scalar_output(result, scalar_type)
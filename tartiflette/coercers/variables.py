@@ -1,11 +1,10 @@
-import asyncio
-
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from tartiflette.coercers.common import CoercionResult
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.types.exceptions.tartiflette import CoercionError
 from tartiflette.utils.errors import graphql_error_from_nodes
+from tartiflette.utils.tasks import gather_results
 from tartiflette.utils.values import is_invalid_value
 
 __all__ = ("variable_coercer", "coerce_variables")
@@ -112,12 +111,11 @@ async def coerce_variables(
     :rtype: Tuple[Dict[str, Any], List["TartifletteError"]]
     """
     # pylint: disable=too-many-locals
-    results = await asyncio.gather(
-        *[
+    results = await gather_results(
+        [
             executable_variable_definition.coercer(raw_variable_values, ctx)
             for executable_variable_definition in executable_variable_definitions
-        ],
-        return_exceptions=True,
+        ]
     )
 
     coercion_errors: List["TartifletteError"] = []
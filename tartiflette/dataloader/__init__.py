@@ -0,0 +1,3 @@
+from tartiflette.dataloader.loader import DataLoader, get_dataloader
+
+__all__ = ("DataLoader", "get_dataloader")
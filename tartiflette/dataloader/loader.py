@@ -0,0 +1,379 @@
+import asyncio
+
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from tartiflette.execution.scheduler import BatchScheduler
+from tartiflette.utils.errors import copy_exception
+
+__all__ = ("DataLoader", "get_dataloader")
+
+
+def _copy_future_state(
+    source: "asyncio.Future", target: "asyncio.Future"
+) -> None:
+    """
+    Sets the state of the source future to the target future unless it's
+    already done.
+    :param source: the done future to copy
+    :param target: the future to set
+    :type source: asyncio.Future
+    :type target: asyncio.Future
+    """
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+class _LoaderBatch:
+    """
+    Keys loaded through a DataLoader since its last dispatch, with the future
+    of their value.
+    """
+
+    __slots__ = ("keys", "futures", "task")
+
+    def __init__(self) -> None:
+        self.keys: List[Any] = []
+        self.futures: Dict[Hashable, "asyncio.Future"] = {}
+        self.task: Optional["asyncio.Task"] = None
+
+
+class DataLoader:
+    """
+    Coalesces the keys loaded during the same batch window into a single call
+    of the batch load function. The batch window of a loader retrieved
+    through `get_dataloader` is closed by the execution once every resolver
+    it has started is waiting for something, the batch window of a loader
+    created directly is closed at the next iteration of the event loop. In
+    both cases, it's closed early once the maximum batch size is reached.
+
+    Loaded values are cached per key for the lifetime of the loader, which
+    is the lifetime of the request when the loader is retrieved through
+    `get_dataloader`.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable,
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+        cache_key_fn: Optional[Callable[[Any], Hashable]] = None,
+        scheduler: Optional["BatchScheduler"] = None,
+    ) -> None:
+        """
+        :param batch_load_fn: coroutine function called with the list of
+        loaded keys and returning the list of their values in the same order
+        (values which are exception instances are raised to the loaders of
+        their key)
+        :param max_batch_size: maximum number of keys passed at once to the
+        batch load function
+        :param cache: whether or not values should be cached across batches
+        :param cache_key_fn: callable computing the cache key of a loaded key
+        :param scheduler: scheduler dispatching the batches of the loader
+        :type batch_load_fn: Callable
+        :type max_batch_size: Optional[int]
+        :type cache: bool
+        :type cache_key_fn: Optional[Callable[[Any], Hashable]]
+        :type scheduler: Optional[BatchScheduler]
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("< max_batch_size > should be greater than 0.")
+
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self.cache_key_fn = cache_key_fn
+        self._scheduler = scheduler or BatchScheduler()
+        self._cache: Dict[Hashable, "asyncio.Future"] = {}
+        self._batch: Optional["_LoaderBatch"] = None
+        self._waiters: Dict["asyncio.Future", int] = {}
+
+    def _get_cache_key(self, key: Any) -> Hashable:
+        """
+        Computes the cache key of a loaded key.
+        :param key: the loaded key
+        :type key: Any
+        :return: the cache key
+        :rtype: Hashable
+        """
+        return self.cache_key_fn(key) if self.cache_key_fn else key
+
+    def load(self, key: Any) -> "asyncio.Future":
+        """
+        Loads the value of a key, which is deduplicated with the loads of the
+        same key in the current batch (and in the previous ones when the
+        cache is enabled). Each call gets its own future, so that cancelling
+        it doesn't cancel the other loads of the key.
+        :param key: the key to load
+        :type key: Any
+        :return: the future of the value of the key
+        :rtype: asyncio.Future
+        """
+        return self._add_waiter(self._load(key))
+
+    def _add_waiter(self, future: "asyncio.Future") -> "asyncio.Future":
+        """
+        Returns a future chained to the shared future of a key. The shared
+        future is only cancelled once all of its waiters are cancelled.
+        :param future: the shared future of the key
+        :type future: asyncio.Future
+        :return: the future of the caller
+        :rtype: asyncio.Future
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        if future.done():
+            _copy_future_state(future, waiter)
+            return waiter
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        future.add_done_callback(partial(_copy_future_state, target=waiter))
+        waiter.add_done_callback(partial(self._on_waiter_done, future))
+        return waiter
+
+    def _on_waiter_done(
+        self, future: "asyncio.Future", waiter: "asyncio.Future"
+    ) -> None:
+        """
+        Cancels the shared future of a key once all of its waiters are
+        cancelled.
+        :param future: the shared future of the key
+        :param waiter: the done future of a caller
+        :type future: asyncio.Future
+        :type waiter: asyncio.Future
+        """
+        remaining = self._waiters.pop(future, 1) - 1
+        if future.done():
+            return
+        if remaining:
+            self._waiters[future] = remaining
+        elif waiter.cancelled():
+            future.cancel()
+
+    def _load(self, key: Any) -> "asyncio.Future":
+        """
+        Returns the future of the value of a key shared by all its loads.
+        :param key: the key to load
+        :type key: Any
+        :return: the shared future of the value of the key
+        :rtype: asyncio.Future
+        """
+        cache_key = self._get_cache_key(key)
+        future = self._cache.get(cache_key)
+        if future is not None and not future.cancelled():
+            return future
+
+        batch = self._batch
+        if batch is not None:
+            future = batch.futures.get(cache_key)
+            if future is not None and not future.cancelled():
+                return future
+
+        if batch is None:
+            batch = self._batch = _LoaderBatch()
+            self._scheduler.schedule(partial(self._flush, batch))
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(
+            partial(self._on_future_done, batch, cache_key)
+        )
+        if cache_key not in batch.futures:
+            batch.keys.append(key)
+            self._scheduler.entry_added()
+        batch.futures[cache_key] = future
+        if self.cache:
+            self._cache[cache_key] = future
+
+        if (
+            self.max_batch_size is not None
+            and len(batch.keys) >= self.max_batch_size
+        ):
+            self._dispatch(batch)
+        return future
+
+    async def load_many(self, keys: Iterable[Any]) -> List[Any]:
+        """
+        Loads the values of several keys in the same batch.
+        :param keys: the keys to load
+        :type keys: Iterable[Any]
+        :return: the values of the keys
+        :rtype: List[Any]
+        """
+        return await asyncio.gather(*[self.load(key) for key in keys])
+
+    def prime(self, key: Any, value: Any) -> None:
+        """
+        Caches the value of a key unless it's already cached.
+        :param key: the key to cache
+        :param value: the value of the key
+        :type key: Any
+        :type value: Any
+        """
+        if not self.cache:
+            return
+
+        cache_key = self._get_cache_key(key)
+        if cache_key in self._cache:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        if isinstance(value, Exception):
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+        self._cache[cache_key] = future
+
+    def clear(self, key: Any) -> None:
+        """
+        Removes the cached value of a key.
+        :param key: the key to remove from the cache
+        :type key: Any
+        """
+        self._cache.pop(self._get_cache_key(key), None)
+
+    def clear_all(self) -> None:
+        """
+        Removes all the cached values.
+        """
+        self._cache.clear()
+
+    def _on_future_done(
+        self,
+        batch: "_LoaderBatch",
+        cache_key: Hashable,
+        future: "asyncio.Future",
+    ) -> None:
+        """
+        Forgets the cancelled future of a key, and cancels the dispatch of
+        its batch once the future of every key of the batch is cancelled.
+        :param batch: the batch of the key
+        :param cache_key: the cache key of the key
+        :param future: the done future of the key
+        :type batch: _LoaderBatch
+        :type cache_key: Hashable
+        :type future: asyncio.Future
+        """
+        if not future.cancelled():
+            return
+
+        if self._cache.get(cache_key) is future:
+            del self._cache[cache_key]
+        if batch.task is not None and all(
+            batch_future.cancelled() for batch_future in batch.futures.values()
+        ):
+            batch.task.cancel()
+
+    def _flush(self, batch: "_LoaderBatch") -> None:
+        """
+        Dispatches the batch once its batch window is closed by the
+        scheduler.
+        :param batch: the batch to dispatch
+        :type batch: _LoaderBatch
+        """
+        if batch is self._batch:
+            # Otherwise, already dispatched because it reached the maximum
+            # batch size
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: "_LoaderBatch") -> None:
+        """
+        Closes the batch and calls the batch load function in a new task.
+        :param batch: the batch to dispatch
+        :type batch: _LoaderBatch
+        """
+        if batch is self._batch:
+            self._batch = None
+
+        batch.task = self._scheduler.create_task(self._dispatch_batch(batch))
+
+    async def _dispatch_batch(self, batch: "_LoaderBatch") -> None:
+        """
+        Calls the batch load function with the keys of the batch which are
+        still awaited and sets the value of each key.
+        :param batch: the batch to dispatch
+        :type batch: _LoaderBatch
+        """
+        keys = []
+        futures = {}
+        for key, (cache_key, future) in zip(batch.keys, batch.futures.items()):
+            if not future.cancelled():
+                keys.append(key)
+                futures[cache_key] = future
+        if not futures:
+            return
+
+        try:
+            values = await self.batch_load_fn(keys)
+            if not isinstance(values, list) or len(values) != len(futures):
+                raise TypeError(
+                    "DataLoader batch load function should return a list of "
+                    f"{len(futures)} values, got < {values!r} >."
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            # Each key gets its own error since errors are located by path
+            values = [e] + [copy_exception(e) for _ in keys[1:]]
+
+        for (cache_key, future), value in zip(futures.items(), values):
+            if isinstance(value, Exception):
+                # Failed keys are loaded again by the next batch
+                if self._cache.get(cache_key) is future:
+                    del self._cache[cache_key]
+                if not future.done():
+                    future.set_exception(value)
+            elif not future.done():
+                future.set_result(value)
+
+
+def get_dataloader(
+    info: "ResolveInfo",
+    batch_load_fn: Callable,
+    name: Optional[str] = None,
+    **kwargs,
+) -> "DataLoader":
+    """
+    Returns the DataLoader registered under the name (or the batch load
+    function when no name is given) on the execution context of the request,
+    creating it on the first call.
+    Functions defined inside another function (lambdas, closures...) or
+    partials are new objects at each call, which would give each resolver
+    its own loader: they have to be registered under a name.
+    :param info: information related to the execution and the resolved field
+    :param batch_load_fn: the batch load function of the loader
+    :param name: name under which the loader is registered
+    :param kwargs: options of the DataLoader to create
+    :type info: ResolveInfo
+    :type batch_load_fn: Callable
+    :type name: Optional[str]
+    :return: the DataLoader of the request
+    :rtype: DataLoader
+    """
+    if name is None and (
+        isinstance(batch_load_fn, partial)
+        or "<locals>" in getattr(batch_load_fn, "__qualname__", "")
+    ):
+        raise ValueError(
+            f"< {batch_load_fn!r} > is created at each call and can't "
+            "identify a DataLoader, a < name > should be given."
+        )
+
+    execution_context = info.execution_context
+    if execution_context is None:
+        return DataLoader(batch_load_fn, **kwargs)
+
+    key = batch_load_fn if name is None else name
+    dataloader = execution_context.dataloaders.get(key)
+    if dataloader is None:
+        dataloader = DataLoader(
+            batch_load_fn,
+            scheduler=execution_context.batch_scheduler,
+            **kwargs,
+        )
+        execution_context.dataloaders[key] = dataloader
+    return dataloader
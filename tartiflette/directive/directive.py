@@ -6,6 +6,7 @@ from tartiflette.types.exceptions.tartiflette import (
     MissingImplementation,
     UnknownDirectiveDefinition,
 )
+from tartiflette.types.helpers.get_directive_instances import get_callables
 
 __all__ = ("Directive",)
 
@@ -60,6 +61,7 @@ class Directive:
         try:
             directive = schema.find_directive(self.name)
             directive.implementation = self._implementation
+            directive.callables = get_callables(self._implementation)
             directive.arguments_coercer = (
                 self._arguments_coercer or schema.default_arguments_coercer
             )
@@ -0,0 +1,85 @@
+import asyncio
+
+from typing import Any, Callable, Dict, Optional
+
+from tartiflette import Directive
+from tartiflette.execution.deadline import call_until
+
+__all__ = ("TimeoutDirective", "bake")
+
+
+class TimeoutDirective:
+    """
+    Directive cancelling the resolver of a field which is still running
+    after `ms` milliseconds, the field resolving to null.
+    """
+
+    async def on_field_execution(
+        self,
+        directive_args: Dict[str, Any],
+        next_resolver: Callable,
+        parent: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> Any:
+        """
+        Narrows the deadline of the field & resolves it before this deadline.
+        :param directive_args: arguments passed to the directive
+        :param next_resolver: next resolver to call
+        :param parent: field parent value
+        :param args: computed arguments related to the resolved field
+        :param ctx: context passed to the query execution
+        :param info: information related to the execution and the resolved
+        field
+        :type directive_args: Dict[str, Any]
+        :type next_resolver: Callable
+        :type parent: Optional[Any]
+        :type args: Dict[str, Any]
+        :type ctx: Optional[Any]
+        :type info: ResolveInfo
+        :return: the value of the field
+        :rtype: Any
+        """
+        # pylint: disable=too-many-arguments
+        deadline = (
+            asyncio.get_running_loop().time() + directive_args["ms"] / 1000
+        )
+        if info.deadline is not None and info.deadline < deadline:
+            # The execution deadline expires first
+            return await next_resolver(parent, args, ctx, info)
+
+        info.deadline = deadline
+        return await call_until(
+            deadline,
+            f"Timeout of < {directive_args['ms']} > ms exceeded.",
+            next_resolver,
+            parent,
+            args,
+            ctx,
+            info,
+            on_spawn=(
+                info.execution_context.batch_scheduler.spawned
+                if info.execution_context is not None
+                else None
+            ),
+        )
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    # pylint: disable=unused-argument
+    Directive("timeout", schema_name=schema_name)(TimeoutDirective())
+    return '''
+    """Cancels the resolver of the field after `ms` milliseconds."""
+    directive @timeout(ms: Int!) on FIELD_DEFINITION
+    '''
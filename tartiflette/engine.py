@@ -1,8 +1,10 @@
+import asyncio
 import json as default_json_module
 import locale
 import logging
 
-from functools import lru_cache, partial
+from contextvars import ContextVar
+from functools import partial
 from importlib import import_module, invalidate_caches
 from inspect import isawaitable
 from typing import (
@@ -10,22 +12,34 @@ from typing import (
     AsyncIterable,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
 
+from tartiflette.caching.base import freeze_value
 from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.coalescing import InflightExecutions
 from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.execution.context import ExecutionOptions
 from tartiflette.execution.execute import create_source_event_stream, execute
-from tartiflette.execution.response import build_response
+from tartiflette.execution.helpers import get_operation_type
+from tartiflette.execution.limiter import ConcurrencyLimiter
+from tartiflette.execution.query_cache import QueryCache
+from tartiflette.execution.response import build_response, copy_response
+from tartiflette.instrumentation import Instrumentation
+from tartiflette.language.normalize import normalize_query
+from tartiflette.persisted_queries import compute_query_id, is_valid_query_id
 from tartiflette.schema.bakery import SchemaBakery
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
     ImproperlyConfigured,
     NonCallable,
     NonCoroutine,
+    PersistedQueryError,
     TartifletteError,
 )
 from tartiflette.utils.callables import is_valid_coroutine
@@ -36,6 +50,16 @@ from tartiflette.utils.errors import (
 
 logger = logging.getLogger(__name__)
 
+# State of the running execution, which has to go through the schema
+# directives wrapping `Engine._perform_query`
+_EXECUTION_DEADLINE = ContextVar(
+    "tartiflette_execution_deadline", default=None
+)
+_EXECUTION_TRACER = ContextVar("tartiflette_execution_tracer", default=None)
+_RESPONSE_CACHE_KEY = ContextVar(
+    "tartiflette_response_cache_key", default=None
+)
+
 _BUILTINS_MODULES = (
     "tartiflette.directive.builtins.deprecated",
     "tartiflette.directive.builtins.non_introspectable",
@@ -52,6 +76,25 @@ _BUILTINS_MODULES = (
     "tartiflette.schema.builtins.introspection",
 )
 
+_QUERY_PARSER_MODES = ("ast", "json")
+
+_PERSISTED_QUERY_NOT_FOUND = {
+    "message": "PersistedQueryNotFound",
+    "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+}
+_PERSISTED_QUERY_NOT_SUPPORTED = {
+    "message": "PersistedQueryNotSupported",
+    "extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+}
+_PERSISTED_QUERY_NOT_ALLOWED = {
+    "message": "PersistedQueryNotAllowed",
+    "extensions": {"code": "PERSISTED_QUERY_NOT_ALLOWED"},
+}
+_PERSISTED_QUERY_ID_MISMATCH = {
+    "message": "Provided query id does not match query",
+    "extensions": {"code": "PERSISTED_QUERY_ID_MISMATCH"},
+}
+
 
 async def _bake_module(
     module: object, schema_name: str, config: Optional[Dict[str, Any]] = None
@@ -136,6 +179,120 @@ async def _import_modules(
     return await _import_builtins(imported_modules, sdl, schema_name)
 
 
+def _build_error_coercer(
+    custom_error_coercer: Optional[Callable],
+    instrumentation: Optional["Instrumentation"],
+) -> Callable:
+    """
+    Builds the error coercer of the engine, notifying the instruments of the
+    coerced errors if any.
+    :param custom_error_coercer: callable in charge of transforming a couple
+    Exception/error into an error dictionary
+    :param instrumentation: the instruments of the engine if any
+    :type custom_error_coercer: Optional[Callable]
+    :type instrumentation: Optional[Instrumentation]
+    :return: the error coercer of the engine
+    :rtype: Callable
+    """
+    error_coercer = error_coercer_factory(
+        custom_error_coercer or default_error_coercer
+    )
+    if instrumentation is not None:
+        error_coercer = instrumentation.wrap_error_coercer(error_coercer)
+    return error_coercer
+
+
+def _build_query_cache_decorator(
+    query_cache_decorator: Optional[Callable], normalize_queries: bool
+) -> Optional[Callable]:
+    """
+    Returns the query cache decorator, defaulting to a `QueryCache` looking
+    queries up by their canonical representation when queries are
+    normalized.
+    :param query_cache_decorator: the query cache decorator, if not defined
+    the default `QueryCache` is used
+    :param normalize_queries: whether or not queries only differing by their
+    ignored tokens should share the same cache entry
+    :type query_cache_decorator: Optional[Callable]
+    :type normalize_queries: bool
+    :return: the query cache decorator
+    :rtype: Optional[Callable]
+    """
+    if query_cache_decorator is not UNDEFINED_VALUE:
+        return query_cache_decorator
+    return QueryCache(
+        normalizer=normalize_query if normalize_queries else None
+    )
+
+
+def _build_query_parser_mode(
+    query_parser_mode: Optional[str], json_loader: Callable[[str], Any]
+) -> str:
+    """
+    Validates the query parser mode, defaulting to the "json" mode when a
+    custom `json_loader` is provided & to the "ast" one otherwise.
+    :param query_parser_mode: the query parser mode if any
+    :param json_loader: callable loading the JSON representation of the AST
+    :type query_parser_mode: Optional[str]
+    :type json_loader: Callable[[str], Any]
+    :return: the query parser mode
+    :rtype: str
+    :raises ImproperlyConfigured: when the query parser mode is unknown
+    """
+    if query_parser_mode is None:
+        # A custom `json_loader` is only useful with the "json" mode
+        return "ast" if json_loader is default_json_module.loads else "json"
+    if query_parser_mode not in _QUERY_PARSER_MODES:
+        raise ImproperlyConfigured(
+            "Given < query_parser_mode > should be one of "
+            f"{_QUERY_PARSER_MODES}, got < {query_parser_mode} >."
+        )
+    return query_parser_mode
+
+
+def _validate_concurrency_limit(
+    name: str, value: Optional[int]
+) -> Optional[int]:
+    """
+    Validates that a concurrency limit is a positive integer, if any.
+    :param name: name of the engine parameter of the limit
+    :param value: the concurrency limit
+    :type name: str
+    :type value: Optional[int]
+    :return: the concurrency limit
+    :rtype: Optional[int]
+    :raises ImproperlyConfigured: when the limit isn't a positive integer
+    """
+    if value is not None and value < 1:
+        raise ImproperlyConfigured(
+            f"Given < {name} > should be a positive integer, got "
+            f"< {value} >."
+        )
+    return value
+
+
+def _validate_persisted_query_allowlist_only(
+    persisted_query_store: Optional["PersistedQueryStore"],
+    persisted_query_allowlist_only: bool,
+) -> None:
+    """
+    Validates that a persisted query store is provided when only the queries
+    it contains can be executed.
+    :param persisted_query_store: store of the persisted queries
+    :param persisted_query_allowlist_only: whether or not only the queries
+    already present in the persisted query store can be executed
+    :type persisted_query_store: Optional[PersistedQueryStore]
+    :type persisted_query_allowlist_only: bool
+    :raises ImproperlyConfigured: when the allowlist only mode is enabled
+    without any persisted query store
+    """
+    if persisted_query_allowlist_only and persisted_query_store is None:
+        raise ImproperlyConfigured(
+            "A < persisted_query_store > is required when "
+            "< persisted_query_allowlist_only > is enabled."
+        )
+
+
 class Engine:
     """
     Tartiflette GraphQL engine.
@@ -155,13 +312,24 @@ class Engine:
         json_loader=None,
         custom_default_arguments_coercer=None,
         coerce_list_concurrently=None,
+        list_max_concurrency=None,
+        max_concurrent_resolvers=None,
+        max_concurrent_resolvers_per_execution=None,
         coerce_parent_concurrently=None,
         sdl_file_encoding=None,
+        query_parser_mode=None,
+        persisted_query_store=None,
+        persisted_query_allowlist_only=None,
+        normalize_queries=None,
+        response_cache=None,
+        source_shapes=None,
+        tracing=None,
+        instruments=None,
     ) -> None:
         """
         Creates an uncooked Engine instance.
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments,too-many-locals
         self._schema = None
         self._schema_name = schema_name
         self._error_coercer = error_coercer
@@ -171,13 +339,14 @@ class Engine:
             custom_default_arguments_coercer
         )
         self._coerce_list_concurrently = coerce_list_concurrently
+        self._list_max_concurrency = list_max_concurrency
+        self._max_concurrent_resolvers = max_concurrent_resolvers
+        self._max_concurrent_resolvers_per_execution = (
+            max_concurrent_resolvers_per_execution
+        )
         self._coerce_parent_concurrently = coerce_parent_concurrently
         self._modules = modules
-        self._query_cache_decorator = (
-            query_cache_decorator
-            if query_cache_decorator is not UNDEFINED_VALUE
-            else lru_cache(maxsize=512)
-        )
+        self._query_cache_decorator = query_cache_decorator
         self._sdl = sdl
         self._cooked = False
         self._build_response = None
@@ -186,6 +355,17 @@ class Engine:
         self._cached_parse_and_validate_query = None
         self._json_loader = json_loader or default_json_module.loads
         self._sdl_file_encoding = sdl_file_encoding
+        self._query_parser_mode = query_parser_mode
+        self._persisted_query_store = persisted_query_store
+        self._persisted_query_allowlist_only = persisted_query_allowlist_only
+        self._normalize_queries = normalize_queries
+        self._response_cache = response_cache
+        self._source_shapes = source_shapes
+        self._tracing = tracing
+        self._instruments = instruments
+        self._inflight_queries = InflightExecutions()
+        self._instrumentation = None
+        self._resolver_limiter = None
 
     async def cook(
         self,
@@ -200,9 +380,20 @@ class Engine:
         json_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
         coerce_list_concurrently: Optional[bool] = None,
+        list_max_concurrency: Optional[int] = None,
+        max_concurrent_resolvers: Optional[int] = None,
+        max_concurrent_resolvers_per_execution: Optional[int] = None,
         coerce_parent_concurrently: Optional[bool] = None,
         schema_name: Optional[str] = None,
         sdl_file_encoding: Optional[str] = None,
+        query_parser_mode: Optional[str] = None,
+        persisted_query_store: Optional["PersistedQueryStore"] = None,
+        persisted_query_allowlist_only: Optional[bool] = None,
+        normalize_queries: Optional[bool] = None,
+        response_cache: Optional["ResponseCache"] = None,
+        source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        tracing: Optional["Tracing"] = None,
+        instruments: Optional[Sequence["Instrument"]] = None,
     ) -> None:
         """
         Cook the tartiflette, basically prepare the engine by binding it to
@@ -221,18 +412,45 @@ class Engine:
         want the engine to import, usually this modules contains your
         Resolvers, Directives, Scalar or Subscription code
         :param query_cache_decorator: callable that will replace the
-        tartiflette default lru_cache decorator to cache query parsing
+        tartiflette default QueryCache decorator to cache query parsing
         :param json_loader: A callable that will replace default python
-        json module.loads for ast_json loading
+        json module.loads for ast_json loading (only used with the "json"
+        query parser mode)
         :param custom_default_arguments_coercer: callable that will replace the
         tartiflette `default_arguments_coercer`
         :param coerce_list_concurrently: whether or not list will be coerced
         concurrently
+        :param list_max_concurrency: maximum number of items of a list
+        completed concurrently by default
+        :param max_concurrent_resolvers: maximum number of resolvers called
+        concurrently by all the executions of the engine
+        :param max_concurrent_resolvers_per_execution: maximum number of
+        resolvers called concurrently by a single execution
         :param coerce_parent_concurrently: whether or not field will be coerced
         concurrently
         :param schema_name: name of the SDL
         :param sdl_file_encoding: file encoding of the SDL, if different from
         `locale.getpreferredencoding(False)`
+        :param query_parser_mode: how the libgraphqlparser AST is transformed
+        into a DocumentNode, either "ast" to walk the C AST directly or "json"
+        to go through its JSON representation (defaults to "json" when a
+        custom `json_loader` is provided, "ast" otherwise)
+        :param persisted_query_store: store in charge of keeping the
+        validated documents of persisted queries by query id
+        :param persisted_query_allowlist_only: whether or not only the queries
+        already present in the persisted query store can be executed
+        :param normalize_queries: whether or not queries only differing by
+        their ignored tokens (whitespaces, commas, comments...) should share
+        the same cache entry & persisted query
+        :param response_cache: cache of the whole responses of query
+        operations, based on the cache hints declared by the resolved fields
+        :param source_shapes: shapes of the values resolved for each object
+        type, used to compile the default resolver of their fields into
+        synchronous getters
+        :param tracing: traces the timings of the parsing, the execution & the
+        resolvers of a sample of the executions
+        :param instruments: instruments notified of the parsing, validation,
+        execution, field resolution & coercion and errors of the executions
         :type sdl: Union[str, List[str]]
         :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
         :type custom_default_resolver: Optional[Callable]
@@ -242,9 +460,20 @@ class Engine:
         :type json_loader: Optional[Callable[[str], Dict[str, Any]]]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type coerce_list_concurrently: Optional[bool]
+        :type list_max_concurrency: Optional[int]
+        :type max_concurrent_resolvers: Optional[int]
+        :type max_concurrent_resolvers_per_execution: Optional[int]
         :type coerce_parent_concurrently: Optional[bool]
         :type schema_name: Optional[str]
         :type sdl_file_encoding: Optional[str]
+        :type query_parser_mode: Optional[str]
+        :type persisted_query_store: Optional[PersistedQueryStore]
+        :type persisted_query_allowlist_only: Optional[bool]
+        :type normalize_queries: Optional[bool]
+        :type response_cache: Optional[ResponseCache]
+        :type source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]]
+        :type tracing: Optional[Tracing]
+        :type instruments: Optional[Sequence[Instrument]]
         """
         # pylint: disable=too-many-arguments,too-many-locals
         if self._cooked:
@@ -302,8 +531,59 @@ class Engine:
                 "coroutine callable."
             )
 
-        self._error_coercer = error_coercer_factory(
-            custom_error_coercer or default_error_coercer
+        json_loader = json_loader or self._json_loader
+        query_parser_mode = _build_query_parser_mode(
+            query_parser_mode or self._query_parser_mode, json_loader
+        )
+
+        list_max_concurrency = _validate_concurrency_limit(
+            "list_max_concurrency",
+            list_max_concurrency
+            if list_max_concurrency is not None
+            else self._list_max_concurrency,
+        )
+        max_concurrent_resolvers = _validate_concurrency_limit(
+            "max_concurrent_resolvers",
+            max_concurrent_resolvers
+            if max_concurrent_resolvers is not None
+            else self._max_concurrent_resolvers,
+        )
+        self._max_concurrent_resolvers_per_execution = (
+            _validate_concurrency_limit(
+                "max_concurrent_resolvers_per_execution",
+                max_concurrent_resolvers_per_execution
+                if max_concurrent_resolvers_per_execution is not None
+                else self._max_concurrent_resolvers_per_execution,
+            )
+        )
+        self._resolver_limiter = (
+            ConcurrencyLimiter(max_concurrent_resolvers)
+            if max_concurrent_resolvers is not None
+            else None
+        )
+
+        persisted_query_store = (
+            persisted_query_store
+            if persisted_query_store is not None
+            else self._persisted_query_store
+        )
+        persisted_query_allowlist_only = bool(
+            persisted_query_allowlist_only
+            if persisted_query_allowlist_only is not None
+            else self._persisted_query_allowlist_only
+        )
+        _validate_persisted_query_allowlist_only(
+            persisted_query_store, persisted_query_allowlist_only
+        )
+
+        instruments = (
+            instruments if instruments is not None else self._instruments
+        )
+        self._instrumentation = (
+            Instrumentation(instruments) if instruments else None
+        )
+        self._error_coercer = _build_error_coercer(
+            custom_error_coercer, self._instrumentation
         )
 
         self._modules, modules_sdl = await _import_modules(
@@ -331,6 +611,13 @@ class Engine:
                 if coerce_parent_concurrently is not None
                 else self._coerce_parent_concurrently
             ),
+            (
+                source_shapes
+                if source_shapes is not None
+                else self._source_shapes
+            ),
+            list_max_concurrency,
+            self._instrumentation,
         )
         self._build_response = partial(
             build_response, error_coercer=self._error_coercer
@@ -343,8 +630,17 @@ class Engine:
             self._perform_query, self._perform_subscription
         )
 
+        normalize_queries = bool(
+            normalize_queries
+            if normalize_queries is not None
+            else self._normalize_queries
+        )
+
         if query_cache_decorator is UNDEFINED_VALUE:
             query_cache_decorator = self._query_cache_decorator
+        query_cache_decorator = _build_query_cache_decorator(
+            query_cache_decorator, normalize_queries
+        )
 
         self._cached_parse_and_validate_query = (
             query_cache_decorator(parse_and_validate_query)
@@ -352,9 +648,209 @@ class Engine:
             else parse_and_validate_query
         )
 
-        self._schema.json_loader = json_loader or self._json_loader
+        self._schema.json_loader = json_loader
+        self._schema.query_parser_mode = query_parser_mode
+
+        self._bake_persisted_query_store(
+            persisted_query_store, persisted_query_allowlist_only
+        )
+        self._normalize_queries = normalize_queries
+        self._response_cache = (
+            response_cache
+            if response_cache is not None
+            else self._response_cache
+        )
+        self._tracing = tracing if tracing is not None else self._tracing
         self._cooked = True
 
+    def _bake_persisted_query_store(
+        self,
+        persisted_query_store: Optional["PersistedQueryStore"],
+        persisted_query_allowlist_only: bool,
+    ) -> None:
+        """
+        Binds the persisted query store to the baked schema.
+        :param persisted_query_store: store of the persisted queries
+        :param persisted_query_allowlist_only: whether or not only the queries
+        already present in the persisted query store can be executed
+        :type persisted_query_store: Optional[PersistedQueryStore]
+        :type persisted_query_allowlist_only: bool
+        """
+        if persisted_query_store is not None:
+            persisted_query_store.bake(self._schema)
+        self._persisted_query_store = persisted_query_store
+        self._persisted_query_allowlist_only = persisted_query_allowlist_only
+
+    async def _get_persisted_document(
+        self,
+        store: "PersistedQueryStore",
+        query: Optional[Union[str, bytes]],
+        query_id: Optional[str],
+    ) -> Optional["DocumentNode"]:
+        """
+        Retrieves the document of a query from the persisted query store.
+        :param store: store of the persisted queries
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query_id: the persisted query identifier of the query
+        :type store: PersistedQueryStore
+        :type query: Optional[Union[str, bytes]]
+        :type query_id: Optional[str]
+        :return: the persisted document of the query if any
+        :rtype: Optional[DocumentNode]
+        """
+        document = (
+            await store.get(query_id) if is_valid_query_id(query_id) else None
+        )
+        if document is None and self._normalize_queries and query is not None:
+            # The query could have been persisted with another formatting
+            document = await store.get(
+                compute_query_id(normalize_query(query))
+            )
+        return document
+
+    async def _parse_and_validate_persisted_query(
+        self, query: Optional[Union[str, bytes]], query_id: Optional[str]
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Retrieves the document of a query from the persisted query store or
+        parses, validates & persists it if not already known.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query_id: the persisted query identifier of the query
+        :type query: Optional[Union[str, bytes]]
+        :type query_id: Optional[str]
+        :return: a DocumentNode representing the query or the errors which
+        prevent it from being executed
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        store = self._persisted_query_store
+        if store is None:
+            if query_id is None:
+                return self._cached_parse_and_validate_query(
+                    query, self._schema
+                )
+            return None, [
+                PersistedQueryError(**_PERSISTED_QUERY_NOT_SUPPORTED)
+            ]
+
+        if query_id is None:
+            if not self._persisted_query_allowlist_only:
+                return self._cached_parse_and_validate_query(
+                    query, self._schema
+                )
+            query_id = compute_query_id(query) if query is not None else None
+
+        document = await self._get_persisted_document(store, query, query_id)
+        if document is not None:
+            return document, None
+
+        # Unknown documents are refused before being parsed
+        if self._persisted_query_allowlist_only:
+            return None, [PersistedQueryError(**_PERSISTED_QUERY_NOT_ALLOWED)]
+
+        if query is None:
+            return None, [PersistedQueryError(**_PERSISTED_QUERY_NOT_FOUND)]
+
+        if compute_query_id(query) != query_id:
+            return None, [PersistedQueryError(**_PERSISTED_QUERY_ID_MISMATCH)]
+
+        document, errors = self._cached_parse_and_validate_query(
+            query, self._schema
+        )
+        if document is not None:
+            await store.set(query_id, query, document)
+        return document, errors
+
+    async def _parse_query(
+        self, query: Optional[Union[str, bytes]], query_id: Optional[str]
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates the query of a request, notifying the instruments
+        if any.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query_id: the persisted query identifier of the query
+        :type query: Optional[Union[str, bytes]]
+        :type query_id: Optional[str]
+        :return: a DocumentNode representing the query or the errors which
+        prevent it from being executed
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            return await self._parse_and_validate_persisted_query(
+                query, query_id
+            )
+
+        instrumentation.on_parse_start(query)
+        document, errors = await self._parse_and_validate_persisted_query(
+            query, query_id
+        )
+        instrumentation.on_parse_end(query, document, errors)
+        return document, errors
+
+    def query_cache_info(self) -> Optional[Any]:
+        """
+        Returns the statistics of the query cache, if the query cache
+        decorator exposes them through a `cache_info` method (as the default
+        `QueryCache` or `functools.lru_cache` do).
+        :return: the statistics of the query cache if any
+        :rtype: Optional[Any]
+        """
+        try:
+            return self._cached_parse_and_validate_query.cache_info()
+        except AttributeError:
+            return None
+
+    async def persist_query(self, query: Union[str, bytes]) -> str:
+        """
+        Parses, validates & stores a query into the persisted query store,
+        mainly used to fill in the allowlist of persisted queries.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :type query: Union[str, bytes]
+        :return: the persisted query identifier of the query
+        :rtype: str
+        """
+        if self._persisted_query_store is None:
+            raise ImproperlyConfigured(
+                "Can't persist a query without a < persisted_query_store >."
+            )
+
+        document, errors = self._cached_parse_and_validate_query(
+            query, self._schema
+        )
+        if errors:
+            raise errors[0]
+
+        query_id = compute_query_id(query)
+        await self._persisted_query_store.set(query_id, query, document)
+
+        if self._normalize_queries:
+            normalized_query = normalize_query(query)
+            if normalized_query != query:
+                await self._persisted_query_store.set(
+                    compute_query_id(normalized_query),
+                    normalized_query,
+                    document,
+                )
+        return query_id
+
+    def _get_resolver_limiters(self) -> Tuple["ConcurrencyLimiter", ...]:
+        """
+        Returns the limiters of the number of resolvers called concurrently
+        by a new execution.
+        :return: the limiters of the execution
+        :rtype: Tuple[ConcurrencyLimiter, ...]
+        """
+        limiters = ()
+        if self._max_concurrent_resolvers_per_execution is not None:
+            limiters += (
+                ConcurrencyLimiter(
+                    self._max_concurrent_resolvers_per_execution
+                ),
+            )
+        if self._resolver_limiter is not None:
+            limiters += (self._resolver_limiter,)
+        return limiters
+
     async def _perform_subscription(
         self,
         schema: "GraphQLSchema",
@@ -393,6 +889,9 @@ class Engine:
                 context,
                 variables,
                 operation_name,
+                ExecutionOptions(
+                    resolver_limiters=self._get_resolver_limiters()
+                ),
             )
 
     async def _perform_query(
@@ -408,7 +907,15 @@ class Engine:
         if request_parsing_errors:
             return await self._build_response(errors=request_parsing_errors)
 
-        return await execute(
+        # Looked up behind the schema directives, which are applied to cached
+        # responses too
+        cache_key = _RESPONSE_CACHE_KEY.get()
+        if cache_key is not None:
+            response = await self._response_cache.get(cache_key)
+            if response is not None:
+                return response
+
+        response = await execute(
             schema,
             document,
             self._build_response,
@@ -416,40 +923,69 @@ class Engine:
             context,
             variables,
             operation_name,
+            ExecutionOptions(
+                cache_policy=(
+                    self._response_cache.create_policy()
+                    if self._response_cache is not None
+                    else None
+                ),
+                resolver_limiters=self._get_resolver_limiters(),
+                deadline=_EXECUTION_DEADLINE.get(),
+                tracer=_EXECUTION_TRACER.get(),
+            ),
         )
+        if cache_key is not None:
+            await self._response_cache.set(cache_key, response)
+        return response
 
-    async def execute(
+    async def _execute_query(
         self,
-        query: Union[str, bytes],
-        operation_name: Optional[str] = None,
-        context: Optional[Any] = None,
-        variables: Optional[Dict[str, Any]] = None,
-        initial_value: Optional[Any] = None,
+        document: Optional["DocumentNode"],
+        errors: Optional[List["TartifletteError"]],
+        operation_name: Optional[str],
+        context: Optional[Any],
+        variables: Optional[Dict[str, Any]],
+        initial_value: Optional[Any],
+        cache_key: Optional[str],
+        deadline: Optional[float] = None,
+        tracer: Optional["ExecutionTracer"] = None,
     ) -> Dict[str, Any]:
         """
-        Parses and executes a GraphQL query/mutation request.
-        :param query: the GraphQL request / query as UTF8-encoded string
+        Executes a parsed GraphQL query/mutation request, unless its
+        response is found in the response cache if any.
+        :param document: the DocumentNode instance linked to the GraphQL
+        request
+        :param errors: the errors which prevent the request from being
+        executed
         :param operation_name: the operation name to execute
         :param context: value that can contain everything you need and that
         will be accessible from the resolvers
         :param variables: the variables provided in the GraphQL request
         :param initial_value: an initial value corresponding to the root type
         being executed
-        :type query: Union[str, bytes]
+        :param cache_key: the response cache key of the request if any
+        :param deadline: event loop time at which the resolvers still running
+        are cancelled
+        :param tracer: tracer of the execution, if it's traced
+        :type document: Optional[DocumentNode]
+        :type errors: Optional[List[TartifletteError]]
         :type operation_name: Optional[str]
         :type context: Optional[Any]
         :type variables: Optional[Dict[str, Any]]
         :type initial_value: Optional[Any]
+        :type cache_key: Optional[str]
+        :type deadline: Optional[float]
+        :type tracer: Optional[ExecutionTracer]
         :return: computed response corresponding to the request
         :rtype: Dict[str, Any]
         """
-        document, errors = self._cached_parse_and_validate_query(
-            query, self._schema
-        )
-
+        # pylint: disable=too-many-arguments
         # Goes through potential schema directives and finish in self._perform_query
+        token = _EXECUTION_DEADLINE.set(deadline)
+        tracer_token = _EXECUTION_TRACER.set(tracer)
+        cache_key_token = _RESPONSE_CACHE_KEY.set(cache_key)
         try:
-            return await self._query_executor(
+            response = await self._query_executor(
                 self._schema,
                 document,
                 errors,
@@ -459,8 +995,9 @@ class Engine:
                 initial_value,
                 context_coercer=context,
             )
-        # pylint: disable=broad-except
-        except Exception as e:
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception as e:  # pylint: disable=broad-except
             if not isinstance(e, TartifletteError):
                 e = TartifletteError(
                     message=str(e),
@@ -468,14 +1005,192 @@ class Engine:
                     original_error=e,
                 )
             return await self._build_response(errors=[e])
+        finally:
+            _EXECUTION_DEADLINE.reset(token)
+            _EXECUTION_TRACER.reset(tracer_token)
+            _RESPONSE_CACHE_KEY.reset(cache_key_token)
+        return response
+
+    async def execute(
+        self,
+        query: Optional[Union[str, bytes]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query_id: Optional[str] = None,
+        coalescing_key: Optional[Hashable] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Parses and executes a GraphQL query/mutation request.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param query_id: the persisted query identifier (hexadecimal SHA-256
+        digest) of the query, which can be provided instead of the query
+        :param coalescing_key: when provided, concurrent executions of the
+        same query operation with the same variables, operation name &
+        coalescing key share a single execution
+        :param timeout: number of seconds after which the resolvers still
+        running are cancelled, their fields resolving to null
+        :type query: Optional[Union[str, bytes]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type query_id: Optional[str]
+        :type coalescing_key: Optional[Hashable]
+        :type timeout: Optional[float]
+        :return: computed response corresponding to the request
+        :rtype: Dict[str, Any]
+        """
+        # pylint: disable=too-many-arguments
+        tracer = (
+            self._tracing.create_tracer()
+            if self._tracing is not None
+            else None
+        )
+        response = await self._execute(
+            query,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            query_id,
+            coalescing_key,
+            timeout,
+            tracer,
+        )
+        if tracer is None:
+            return response
+        return await self._tracing.emit(tracer, response)
+
+    def _get_coalescing_query_key(
+        self, query: Optional[Union[str, bytes]], query_id: Optional[str]
+    ) -> Union[str, bytes]:
+        """
+        Returns the part of the coalescing key identifying the query of a
+        request: its text, normalized when queries are normalized, or its
+        persisted query identifier when the query isn't provided.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query_id: the persisted query identifier of the query
+        :type query: Optional[Union[str, bytes]]
+        :type query_id: Optional[str]
+        :return: the part of the coalescing key identifying the query
+        :rtype: Union[str, bytes]
+        """
+        if query is None:
+            return query_id
+        return normalize_query(query) if self._normalize_queries else query
+
+    async def _execute(
+        self,
+        query: Optional[Union[str, bytes]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query_id: Optional[str] = None,
+        coalescing_key: Optional[Hashable] = None,
+        timeout: Optional[float] = None,
+        tracer: Optional["ExecutionTracer"] = None,
+    ) -> Dict[str, Any]:
+        """
+        Parses and executes a GraphQL query/mutation request.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param query_id: the persisted query identifier (hexadecimal SHA-256
+        digest) of the query, which can be provided instead of the query
+        :param coalescing_key: when provided, concurrent executions of the
+        same query operation with the same variables, operation name &
+        coalescing key share a single execution
+        :param timeout: number of seconds after which the resolvers still
+        running are cancelled, their fields resolving to null
+        :param tracer: tracer of the execution, if it's traced
+        :type query: Optional[Union[str, bytes]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type query_id: Optional[str]
+        :type coalescing_key: Optional[Hashable]
+        :type timeout: Optional[float]
+        :type tracer: Optional[ExecutionTracer]
+        :return: computed response corresponding to the request
+        :rtype: Dict[str, Any]
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        deadline = (
+            asyncio.get_running_loop().time() + timeout
+            if timeout is not None
+            else None
+        )
+        parsing_start = tracer.now() if tracer is not None else None
+        document, errors = await self._parse_query(query, query_id)
+        if tracer is not None:
+            tracer.parsing = (parsing_start, tracer.now())
+
+        cache_key = None
+        if self._response_cache is not None and not errors:
+            cache_key = self._response_cache.get_key(
+                document, query, query_id, operation_name, variables, context
+            )
+
+        execute_query = partial(
+            self._execute_query,
+            document,
+            errors,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            cache_key,
+            deadline,
+            tracer,
+        )
+
+        if (
+            coalescing_key is None
+            or errors
+            or get_operation_type(document, operation_name) != "query"
+        ):
+            return await execute_query()
+
+        key = (
+            self._get_coalescing_query_key(query, query_id),
+            operation_name,
+            freeze_value(variables or {}),
+            coalescing_key,
+            timeout,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return await execute_query()
+
+        # Each caller gets its own copy of the response
+        return copy_response(
+            await self._inflight_queries.run(key, execute_query)
+        )
 
     async def subscribe(
         self,
-        query: Union[str, bytes],
+        query: Optional[Union[str, bytes]] = None,
         operation_name: Optional[str] = None,
         context: Optional[Any] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        query_id: Optional[str] = None,
     ) -> AsyncIterable[Dict[str, Any]]:
         """
         Parses and executes a GraphQL subscription request.
@@ -486,17 +1201,18 @@ class Engine:
         :param variables: the variables provided in the GraphQL request
         :param initial_value: an initial value corresponding to the root type
         being executed
-        :type query: Union[str, bytes]
+        :param query_id: the persisted query identifier (hexadecimal SHA-256
+        digest) of the query, which can be provided instead of the query
+        :type query: Optional[Union[str, bytes]]
         :type operation_name: Optional[str]
         :type context: Optional[Any]
         :type variables: Optional[Dict[str, Any]]
         :type initial_value: Optional[Any]
+        :type query_id: Optional[str]
         :return: computed response corresponding to the request
         :rtype: AsyncIterable[Dict[str, Any]]
         """
-        document, errors = self._cached_parse_and_validate_query(
-            query, self._schema
-        )
+        document, errors = await self._parse_query(query, query_id)
 
         # Goes through potential schema directives and finish in self._perform_subscription
         async for payload in self._subscription_executor(
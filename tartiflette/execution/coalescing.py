@@ -0,0 +1,89 @@
+import asyncio
+
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+__all__ = ("InflightExecutions",)
+
+
+class _InflightExecution:
+    """
+    A running execution shared by several callers.
+    """
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task") -> None:
+        """
+        :param task: the task running the execution
+        :type task: asyncio.Task
+        """
+        self.task = task
+        self.waiters = 0
+
+
+class InflightExecutions:
+    """
+    Coalesces the concurrent executions sharing the same key: the execution
+    is run once and its result is returned to every caller waiting for it.
+    The shared execution is only cancelled once every caller waiting for it
+    has been cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._executions: Dict[Hashable, "_InflightExecution"] = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of running executions.
+        :return: the number of running executions
+        :rtype: int
+        """
+        return len(self._executions)
+
+    def _discard(
+        self,
+        key: Hashable,
+        execution: "_InflightExecution",
+        _task: "asyncio.Task",
+    ) -> None:
+        """
+        Forgets the execution of the key once it's done.
+        :param key: the key of the execution
+        :param execution: the done execution
+        :type key: Hashable
+        :type execution: _InflightExecution
+        """
+        if self._executions.get(key) is execution:
+            del self._executions[key]
+
+    async def run(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Returns the result of the running execution of the key, or runs
+        `func` if there is none.
+        :param key: the key of the execution
+        :param func: callable running the execution
+        :type key: Hashable
+        :type func: Callable[[], Awaitable[Any]]
+        :return: the result of the execution
+        :rtype: Any
+        """
+        execution = self._executions.get(key)
+        if execution is None:
+            execution = _InflightExecution(asyncio.ensure_future(func()))
+            self._executions[key] = execution
+            execution.task.add_done_callback(
+                partial(self._discard, key, execution)
+            )
+
+        execution.waiters += 1
+        try:
+            return await asyncio.shield(execution.task)
+        finally:
+            execution.waiters -= 1
+            if not execution.waiters and not execution.task.done():
+                # Every caller is gone, nobody needs the result anymore
+                execution.task.cancel()
+                self._discard(key, execution, execution.task)
@@ -1,12 +1,17 @@
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.directive.builtins.include import IncludeDirective
+from tartiflette.directive.builtins.skip import SkipDirective
 from tartiflette.execution.nodes.variable_definition import (
     variable_definition_node_to_executable,
 )
 from tartiflette.language.ast import (
+    BooleanValueNode,
     FieldNode,
     FragmentSpreadNode,
     InlineFragmentNode,
+    VariableNode,
 )
 from tartiflette.language.parsers.libgraphqlparser import parse_to_document
 from tartiflette.types.exceptions.tartiflette import (
@@ -27,6 +32,10 @@ __all__ = (
     "collect_subfields",
 )
 
+# Built-in directives evaluated natively during collection, unless their
+# implementation is overridden
+_BUILTIN_CONDITION_DIRECTIVES = (SkipDirective, IncludeDirective)
+
 
 def parse_and_validate_query(
     query: Union[str, bytes], schema: "GraphQLSchema"
@@ -53,6 +62,9 @@ def parse_and_validate_query(
     if document.validators.errors:
         return None, document.validators.errors
 
+    # Validation scratch state isn't needed anymore & shouldn't be retained
+    # by the caches
+    document.validators = None
     return document, None
 
 
@@ -81,6 +93,34 @@ def collect_executable_variable_definitions(
     ]
 
 
+def get_condition_value(
+    directive_node: "DirectiveNode", variable_values: Optional[Dict[str, Any]]
+) -> Any:
+    """
+    Returns the value of the `if` argument of a built-in @skip/@include
+    directive, read from its literal value or from the variable values.
+    :param directive_node: the AST directive node of the condition
+    :param variable_values: the variables provided in the GraphQL request
+    :type directive_node: DirectiveNode
+    :type variable_values: Optional[Dict[str, Any]]
+    :return: the value of the `if` argument or UNDEFINED_VALUE
+    :rtype: Any
+    """
+    for argument_node in directive_node.arguments or []:
+        if argument_node.name.value != "if":
+            continue
+
+        value_node = argument_node.value
+        if isinstance(value_node, BooleanValueNode):
+            return value_node.value
+        if isinstance(value_node, VariableNode):
+            return (variable_values or {}).get(
+                value_node.name.value, UNDEFINED_VALUE
+            )
+        break
+    return UNDEFINED_VALUE
+
+
 async def should_include_node(
     execution_context: "ExecutionContext",
     node: Union["FragmentSpreadNode", "FieldNode", "InlineFragmentNode"],
@@ -108,11 +148,33 @@ async def should_include_node(
         )
     )
 
+    collection_directive_nodes = []
+    for directive_node in node.directives:
+        directive = execution_context.schema.find_directive(
+            directive_node.name.value
+        )
+        implementation_type = type(directive.implementation)
+        if implementation_type in _BUILTIN_CONDITION_DIRECTIVES:
+            if_value = get_condition_value(
+                directive_node, execution_context.variable_values
+            )
+            # Invalid conditions fail the argument coercion of the generic
+            # pipeline, which skips the node
+            if not isinstance(if_value, bool):
+                return False
+            if if_value is (implementation_type is SkipDirective):
+                return False
+        elif hook_name in directive.callables:
+            collection_directive_nodes.append(directive_node)
+
+    if not collection_directive_nodes:
+        return True
+
     try:
         await wraps_with_directives(
             directives_definition=compute_directive_nodes(
                 execution_context.schema,
-                node.directives,
+                collection_directive_nodes,
                 execution_context.variable_values,
             ),
             directive_hook=hook_name,
@@ -203,6 +265,11 @@ async def collect_fields(
     :rtype: Dict[str, List[FieldNode]]
     """
     # pylint: disable=too-complex
+    if fields is None and visited_fragment_names is None:
+        return await _collect_planned_fields(
+            execution_context, runtime_type, [selection_set]
+        )
+
     if fields is None:
         fields: Dict[str, "FieldNode"] = {}
 
@@ -257,6 +324,50 @@ async def collect_fields(
     return fields
 
 
+async def _collect_planned_fields(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    selection_sets: List["SelectionSetNode"],
+) -> Dict[str, List["FieldNode"]]:
+    """
+    Collects the fields of the selection sets for the runtime type, reusing
+    the fields previously collected by the execution plan of the document
+    when possible. The returned dictionary may be shared across executions
+    and shouldn't be mutated.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: current runtime type of the selection sets
+    :param selection_sets: selection set nodes to collect
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type selection_sets: List[SelectionSetNode]
+    :return: the dictionary of collected fields
+    :rtype: Dict[str, List[FieldNode]]
+    """
+
+    async def collector() -> Dict[str, List["FieldNode"]]:
+        fields: Dict[str, List["FieldNode"]] = {}
+        visited_fragment_names: Set[str] = set()
+        for selection_set in selection_sets:
+            fields = await collect_fields(
+                execution_context,
+                runtime_type,
+                selection_set,
+                fields,
+                visited_fragment_names,
+            )
+        return fields
+
+    if execution_context.execution_plan is None:
+        return await collector()
+
+    return await execution_context.execution_plan.collect_fields(
+        runtime_type,
+        selection_sets,
+        execution_context.variable_values,
+        collector,
+    )
+
+
 async def collect_subfields(
     execution_context: "ExecutionContext",
     return_type: "GraphQLOutputType",
@@ -273,16 +384,12 @@ async def collect_subfields(
     :return: the dictionary of collected fields
     :rtype: Dict[str, List[FieldNode]]
     """
-    subfield_nodes: Dict[str, List["FieldNode"]] = {}
-    visited_fragment_names: Set[str] = set()
-    for field_node in field_nodes:
-        selection_set = field_node.selection_set
-        if selection_set:
-            subfield_nodes = await collect_fields(
-                execution_context,
-                return_type,
-                selection_set,
-                subfield_nodes,
-                visited_fragment_names,
-            )
-    return subfield_nodes
+    return await _collect_planned_fields(
+        execution_context,
+        return_type,
+        [
+            field_node.selection_set
+            for field_node in field_nodes
+            if field_node.selection_set
+        ],
+    )
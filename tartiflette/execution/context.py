@@ -1,9 +1,14 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+import logging
+
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from tartiflette.coercers.variables import coerce_variables
 from tartiflette.execution.collect import (
     collect_executable_variable_definitions,
 )
+from tartiflette.execution.plan import get_execution_plan
+from tartiflette.execution.scheduler import BatchScheduler
 from tartiflette.language.ast import OperationDefinitionNode
 from tartiflette.types.exceptions.tartiflette import (
     MultipleException,
@@ -11,7 +16,46 @@ from tartiflette.types.exceptions.tartiflette import (
 )
 from tartiflette.utils.errors import is_coercible_exception
 
-__all__ = ("build_execution_context",)
+__all__ = ("ExecutionOptions", "build_execution_context")
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionOptions:
+    """
+    Per-request options of an execution, provided by the engine.
+    """
+
+    __slots__ = ("cache_policy", "resolver_limiters", "deadline", "tracer")
+
+    def __init__(
+        self,
+        cache_policy: Optional["CachePolicy"] = None,
+        resolver_limiters: Tuple["ConcurrencyLimiter", ...] = (),
+        deadline: Optional[float] = None,
+        tracer: Optional["ExecutionTracer"] = None,
+    ) -> None:
+        """
+        :param cache_policy: policy aggregating the cache hints of the
+        resolved fields, if the response cache is enabled
+        :param resolver_limiters: limiters of the number of resolvers called
+        concurrently
+        :param deadline: event loop time at which the resolvers still running
+        are cancelled
+        :param tracer: tracer recording the timings of the resolvers, if the
+        execution is traced
+        :type cache_policy: Optional[CachePolicy]
+        :type resolver_limiters: Tuple[ConcurrencyLimiter, ...]
+        :type deadline: Optional[float]
+        :type tracer: Optional[ExecutionTracer]
+        """
+        self.cache_policy = cache_policy
+        self.resolver_limiters = resolver_limiters
+        self.deadline = deadline
+        self.tracer = tracer
+
+
+_DEFAULT_EXECUTION_OPTIONS = ExecutionOptions()
 
 
 class ExecutionContext:
@@ -28,6 +72,13 @@ class ExecutionContext:
         "root_value",
         "variable_values",
         "errors",
+        "execution_plan",
+        "field_batches",
+        "reserved_batch_entries",
+        "dataloaders",
+        "batch_scheduler",
+        "options",
+        "cleanup_callbacks",
     )
 
     def __init__(
@@ -38,6 +89,8 @@ class ExecutionContext:
         context: Optional[Any],
         root_value: Optional[Any],
         variable_values: Optional[Dict[str, Any]],
+        execution_plan: Optional["ExecutionPlan"] = None,
+        options: Optional["ExecutionOptions"] = None,
     ) -> None:
         """
         :param schema: the GraphQLSchema instance linked to the engine
@@ -49,12 +102,16 @@ class ExecutionContext:
         :param root_value: an initial value corresponding to the root type
         being executed
         :param variable_values: the variables provided in the GraphQL request
+        :param execution_plan: the execution plan of the document to execute
+        :param options: the per-request options of the execution
         :type schema: GraphQLSchema
         :type fragments: Dict[str, FragmentDefinitionNode]
         :type operation: OperationDefinitionNode
         :type context: Optional[Any]
         :type root_value: Optional[Any]
         :type variable_values: Optional[Dict[str, Any]]
+        :type execution_plan: Optional[ExecutionPlan]
+        :type options: Optional[ExecutionOptions]
         """
         # pylint: disable=too-many-arguments,too-many-locals
         self.schema = schema
@@ -64,6 +121,33 @@ class ExecutionContext:
         self.root_value = root_value
         self.variable_values = variable_values
         self.errors: List["TartifletteError"] = []
+        self.execution_plan = execution_plan
+        self.field_batches: Dict[Tuple[Any, ...], "FieldBatch"] = {}
+        self.reserved_batch_entries: Dict[
+            Tuple[Tuple[Any, ...], "Path"], "asyncio.Future"
+        ] = {}
+        self.dataloaders: Dict[Hashable, "DataLoader"] = {}
+        self.batch_scheduler = BatchScheduler()
+        self.options = (
+            options if options is not None else _DEFAULT_EXECUTION_OPTIONS
+        )
+        self.cleanup_callbacks: List[Callable[[], Any]] = []
+
+    async def cleanup(self) -> None:
+        """
+        Stops the batches still pending or running, then calls the cleanup
+        callbacks registered by the resolvers, in the reverse order of their
+        registration. Their errors are logged.
+        """
+        await self.batch_scheduler.close()
+        while self.cleanup_callbacks:
+            callback = self.cleanup_callbacks.pop()
+            try:
+                result = callback()
+                if isawaitable(result):
+                    await result
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Cleanup callback %r failed.", callback)
 
     def add_error(
         self,
@@ -99,6 +183,23 @@ class ExecutionContext:
 
             self.errors.append(graphql_error)
 
+    def drop_errors(self, path: "Path") -> None:
+        """
+        Removes the errors located under the path, e.g. once the completion
+        of its value has been cancelled.
+        :param path: the path under which to remove the errors
+        :type path: Path
+        """
+        if not self.errors:
+            return
+
+        prefix = path.as_list()
+        self.errors[:] = [
+            error
+            for error in self.errors
+            if (getattr(error, "path", None) or [])[: len(prefix)] != prefix
+        ]
+
 
 async def build_execution_context(
     schema: "GraphQLSchema",
@@ -107,6 +208,7 @@ async def build_execution_context(
     context: Optional[Any],
     raw_variable_values: Optional[Dict[str, Any]],
     operation_name: str,
+    options: Optional["ExecutionOptions"] = None,
 ) -> Tuple[Optional["ExecutionContext"], Optional[List["TartifletteError"]]]:
     """
     Factory function to build and return an ExecutionContext instance.
@@ -118,12 +220,14 @@ async def build_execution_context(
     accessible from the resolvers
     :param raw_variable_values: the variables provided in the GraphQL request
     :param operation_name: the operation name to execute
+    :param options: the per-request options of the execution
     :type schema: GraphQLSchema
     :type document: DocumentNode
     :type root_value: Optional[Any]
     :type context: Optional[Any]
     :type raw_variable_values: Optional[Dict[str, Any]]
     :type operation_name: str
+    :type options: Optional[ExecutionOptions]
     :return: an ExecutionContext instance
     :rtype: Tuple[Optional[ExecutionContext], Optional[List[TartifletteError]]]
     """
@@ -179,6 +283,8 @@ async def build_execution_context(
             context=context,
             root_value=root_value,
             variable_values=variable_values,
+            execution_plan=get_execution_plan(schema, document),
+            options=options,
         ),
         None,
     )
@@ -0,0 +1,75 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Optional
+
+from tartiflette.types.exceptions.tartiflette import TimeoutExceeded
+
+__all__ = ("check_deadline", "call_until", "remaining_time")
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """
+    Returns the number of seconds left until the deadline.
+    :param deadline: the deadline, in event loop time
+    :type deadline: Optional[float]
+    :return: the number of seconds left or None if there is no deadline
+    :rtype: Optional[float]
+    """
+    if deadline is None:
+        return None
+    return deadline - asyncio.get_running_loop().time()
+
+
+def check_deadline(deadline: Optional[float], message: str) -> None:
+    """
+    Raises a TimeoutExceeded exception if the deadline has expired.
+    :param deadline: the deadline, in event loop time
+    :param message: message of the raised exception
+    :type deadline: Optional[float]
+    :type message: str
+    """
+    if deadline is not None and remaining_time(deadline) <= 0:
+        raise TimeoutExceeded(message)
+
+
+async def call_until(
+    deadline: float,
+    message: str,
+    func: Callable[..., Awaitable[Any]],
+    *args,
+    on_spawn: Optional[Callable[[], None]] = None,
+    **kwargs,
+) -> Any:
+    """
+    Awaits the call of `func`, which is cancelled if it's still running when
+    the deadline expires.
+    :param deadline: the deadline, in event loop time
+    :param message: message of the exception raised once the deadline has
+    expired
+    :param func: the callable to call
+    :param args: positional arguments of the call
+    :param on_spawn: callable called once the task running the call is
+    created
+    :param kwargs: keyword arguments of the call
+    :type deadline: float
+    :type message: str
+    :type func: Callable[..., Awaitable[Any]]
+    :type on_spawn: Optional[Callable[[], None]]
+    :return: the result of the call
+    :rtype: Any
+    """
+    timeout = remaining_time(deadline)
+    if timeout <= 0:
+        raise TimeoutExceeded(message)
+
+    task = asyncio.ensure_future(func(*args, **kwargs))
+    if on_spawn is not None:
+        on_spawn()
+
+    try:
+        return await asyncio.wait_for(task, timeout)
+    except asyncio.TimeoutError:
+        if remaining_time(deadline) > 0:
+            # Raised by the callable itself
+            raise
+        raise TimeoutExceeded(message) from None
@@ -10,6 +10,7 @@ from tartiflette.execution.context import build_execution_context
 from tartiflette.execution.helpers import get_field_definition
 from tartiflette.execution.types import build_resolve_info
 from tartiflette.utils.errors import extract_exceptions_from_results
+from tartiflette.utils.tasks import gather_until_error
 from tartiflette.utils.values import is_invalid_value
 
 __all__ = (
@@ -158,8 +159,10 @@ async def execute_fields(
             results.append(await result)
 
     if to_await:
-        awaited = await asyncio.gather(
-            *list(to_await.values()), return_exceptions=True
+        # Siblings are cancelled as soon as a non-null field fails, since
+        # the whole parent is then null
+        awaited = await gather_until_error(
+            to_await.values(), execution_context.batch_scheduler.spawned
         )
         for index, result in zip(to_await, awaited):
             results[index] = result
@@ -217,6 +220,8 @@ async def execute_operation(
                 fields,
             )
         )
+    except asyncio.CancelledError:
+        raise
     except Exception as e:  # pylint: disable=broad-except
         execution_context.add_error(e)
         return None
@@ -230,6 +235,7 @@ async def execute(
     context: Optional[Any],
     variables: Optional[Dict[str, Any]],
     operation_name: Optional[str],
+    options: Optional["ExecutionOptions"] = None,
 ) -> Dict[str, Any]:
     """
     Runs the execution of the executable operation.
@@ -243,6 +249,7 @@ async def execute(
     accessible from the resolvers
     :param variables: the variables provided in the GraphQL request
     :param operation_name: the operation name to execute
+    :param options: the per-request options of the execution
     :type schema: GraphQLSchema
     :type document: DocumentNode
     :type response_builder: Callable
@@ -250,20 +257,60 @@ async def execute(
     :type context: Optional[Any]
     :type variables: Optional[Dict[str, Any]]
     :type operation_name: str
+    :type options: Optional[ExecutionOptions]
     :return: the GraphQL response linked to the operation execution
     :rtype: Dict[str, Any]
     """
+    # pylint: disable=too-many-locals
+    instrumentation = schema.instrumentation
+    if instrumentation is not None:
+        instrumentation.on_build_context_start(
+            document, operation_name, variables
+        )
+
+    tracer = options.tracer if options is not None else None
+    execution_start = tracer.now() if tracer is not None else None
     execution_context, errors = await build_execution_context(
-        schema, document, root_value, context, variables, operation_name
+        schema,
+        document,
+        root_value,
+        context,
+        variables,
+        operation_name,
+        options=options,
     )
 
+    if instrumentation is not None:
+        instrumentation.on_build_context_end(document, errors)
+
     if errors:
         return await response_builder(errors=errors)
 
-    data = await execute_operation(
-        execution_context, execution_context.operation, root_value
+    if instrumentation is not None:
+        instrumentation.on_execute_start(execution_context)
+
+    data = None
+    try:
+        data = await execute_operation(
+            execution_context, execution_context.operation, root_value
+        )
+    finally:
+        # Also called when the execution is cancelled
+        await execution_context.cleanup()
+        if instrumentation is not None:
+            instrumentation.on_execute_end(execution_context, data)
+    if tracer is not None:
+        tracer.execution = (execution_start, tracer.now())
+    cache_policy = execution_context.options.cache_policy
+    return await response_builder(
+        data=data,
+        errors=execution_context.errors,
+        extensions=(
+            {"cacheControl": cache_policy.to_dict()}
+            if cache_policy is not None
+            else None
+        ),
     )
-    return await response_builder(data=data, errors=execution_context.errors)
 
 
 async def create_source_event_stream(
@@ -1,9 +1,13 @@
-__all__ = ("get_field_definition",)
+from typing import Optional
+
+from tartiflette.language.ast import OperationDefinitionNode
+
+__all__ = ("get_field_definition", "get_operation_type")
 
 
 def get_field_definition(
     schema: "GraphQLSchema", parent_type: "GraphQLObjectType", field_name: str
-) -> "GraphQLField":
+) -> Optional["GraphQLField"]:
     """
     Returns the field corresponding to the parent type and field name.
     :param schema: the GraphQLSchema instance linked to the engine
@@ -12,11 +16,34 @@ def get_field_definition(
     :type schema: GraphQLSchema
     :type parent_type: GraphQLObjectType
     :type field_name: str
-    :return: the GraphQLField instance
-    :rtype: GraphQLField
+    :return: the GraphQLField instance if any
+    :rtype: Optional[GraphQLField]
+    """
+    # pylint: disable=unused-argument
+    return parent_type.get_field(field_name)
+
+
+def get_operation_type(
+    document: "DocumentNode", operation_name: Optional[str]
+) -> Optional[str]:
+    """
+    Returns the type of the operation of the document which will be
+    executed.
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :param operation_name: the operation name to execute
+    :type document: DocumentNode
+    :type operation_name: Optional[str]
+    :return: the operation type or None if the operation is unknown
+    :rtype: Optional[str]
     """
-    try:
-        return schema.get_field_by_name(f"{parent_type}.{field_name}")
-    except Exception:  # pylint: disable=broad-except
-        pass
-    return None
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    if operation_name:
+        for operation in operations:
+            if operation.name and operation.name.value == operation_name:
+                return operation.operation_type
+        return None
+    return operations[0].operation_type if len(operations) == 1 else None
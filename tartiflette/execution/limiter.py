@@ -0,0 +1,93 @@
+import asyncio
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Sequence
+
+__all__ = ("ConcurrencyLimiter", "run_limited")
+
+
+class ConcurrencyLimiter:
+    """
+    Limits the number of concurrent calls. Calls waiting for a slot are
+    served in their arrival order: a released slot is handed over to the
+    oldest waiting call, so that a later call can't take it first.
+    """
+
+    __slots__ = ("max_concurrency", "in_flight", "_waiters")
+
+    def __init__(self, max_concurrency: int) -> None:
+        """
+        :param max_concurrency: maximum number of concurrent calls
+        :type max_concurrency: int
+        """
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self._waiters: Deque["asyncio.Future"] = deque()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of calls waiting for a slot.
+        :return: the number of calls waiting for a slot
+        :rtype: int
+        """
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """
+        Waits for a free slot and takes it.
+        """
+        if self.in_flight < self.max_concurrency and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the cancellation
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """
+        Releases a slot, handing it over to the oldest waiting call if any.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot stays taken, by the waiting call
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+async def run_limited(
+    limiters: Sequence["ConcurrencyLimiter"],
+    func: Callable[..., Awaitable[Any]],
+    *args,
+    **kwargs,
+) -> Any:
+    """
+    Awaits the call of `func` once a slot is taken in every limiter.
+    :param limiters: the limiters to take a slot in, in order
+    :param func: the callable to call
+    :param args: positional arguments of the call
+    :param kwargs: keyword arguments of the call
+    :type limiters: Sequence[ConcurrencyLimiter]
+    :type func: Callable[..., Awaitable[Any]]
+    :return: the result of the call
+    :rtype: Any
+    """
+    acquired = []
+    try:
+        for limiter in limiters:
+            await limiter.acquire()
+            acquired.append(limiter)
+        return await func(*args, **kwargs)
+    finally:
+        for limiter in reversed(acquired):
+            limiter.release()
@@ -0,0 +1,391 @@
+import asyncio
+import sys
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.directive.builtins.include import IncludeDirective
+from tartiflette.directive.builtins.skip import SkipDirective
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentDefinitionNode,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+)
+
+__all__ = ("ExecutionPlan", "get_execution_plan")
+
+_COLLECTION_HOOKS = frozenset(
+    (
+        "on_field_collection",
+        "on_fragment_spread_collection",
+        "on_inline_fragment_collection",
+    )
+)
+
+# Directive implementations whose collection hooks only depend on their
+# arguments (and thus on the variable values)
+_DETERMINISTIC_COLLECTION_DIRECTIVES = (SkipDirective, IncludeDirective)
+
+
+def _iter_selections(
+    selection_set: Optional["SelectionSetNode"],
+) -> Iterator["SelectionNode"]:
+    """
+    Iterates recursively over the selections of a selection set, excluding
+    the selections of the fragment definitions targeted by fragment spreads.
+    :param selection_set: the selection set to iterate over
+    :type selection_set: Optional[SelectionSetNode]
+    :return: an iterator over the selections
+    :rtype: Iterator[SelectionNode]
+    """
+    if not selection_set:
+        return
+
+    for selection in selection_set.selections:
+        yield selection
+        if isinstance(selection, (FieldNode, InlineFragmentNode)):
+            yield from _iter_selections(selection.selection_set)
+
+
+def _iter_variable_names(value_node: "ValueNode") -> Iterator[str]:
+    """
+    Iterates over the names of the variables referenced by a value node.
+    :param value_node: the value node to inspect
+    :type value_node: ValueNode
+    :return: an iterator over the variable names
+    :rtype: Iterator[str]
+    """
+    if isinstance(value_node, VariableNode):
+        yield value_node.name.value
+    elif isinstance(value_node, ListValueNode):
+        for item_node in value_node.values:
+            yield from _iter_variable_names(item_node)
+    elif isinstance(value_node, ObjectValueNode):
+        for field_node in value_node.fields:
+            yield from _iter_variable_names(field_node.value)
+
+
+def _get_variable_values_key(
+    variable_names: Tuple[str, ...],
+    variable_values: Optional[Dict[str, Any]],
+) -> Tuple[Any, ...]:
+    """
+    Computes the part of a plan key related to the variable values.
+    :param variable_names: the names of the variables to take into account
+    :param variable_values: the variables provided in the GraphQL request
+    :type variable_names: Tuple[str, ...]
+    :type variable_values: Optional[Dict[str, Any]]
+    :return: the values of the variables
+    :rtype: Tuple[Any, ...]
+    """
+    if not variable_names:
+        return ()
+
+    variable_values = variable_values or {}
+    return tuple(
+        variable_values.get(variable_name, UNDEFINED_VALUE)
+        for variable_name in variable_names
+    )
+
+
+def _compile_directive_variable_names(
+    schema: "GraphQLSchema", document: "DocumentNode"
+) -> Tuple[Optional[Tuple[str, ...]], Tuple[str, ...]]:
+    """
+    Computes the names of the variables referenced by the directives of the
+    document selections, on which the field collection and the directive
+    chains of the fields depend.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the DocumentNode instance to inspect
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :return: the sorted variable names referenced by the collection
+    directives, or None if the field collection depends on something else
+    than the variable values, and the sorted variable names referenced by
+    the field directives
+    :rtype: Tuple[Optional[Tuple[str, ...]], Tuple[str, ...]]
+    """
+    is_collection_cacheable = True
+    collection_variable_names = set()
+    field_variable_names = set()
+    for definition in document.definitions:
+        if not isinstance(
+            definition, (OperationDefinitionNode, FragmentDefinitionNode)
+        ):
+            continue
+
+        for selection in _iter_selections(definition.selection_set):
+            for directive_node in selection.directives or []:
+                variable_names = {
+                    variable_name
+                    for argument_node in directive_node.arguments or []
+                    for variable_name in _iter_variable_names(
+                        argument_node.value
+                    )
+                }
+                if isinstance(selection, FieldNode):
+                    field_variable_names.update(variable_names)
+
+                directive = schema.find_directive(directive_node.name.value)
+                if not _COLLECTION_HOOKS.intersection(directive.callables):
+                    continue
+
+                if (
+                    type(directive.implementation)
+                    not in _DETERMINISTIC_COLLECTION_DIRECTIVES
+                ):
+                    is_collection_cacheable = False
+                collection_variable_names.update(variable_names)
+
+    return (
+        tuple(sorted(collection_variable_names))
+        if is_collection_cacheable
+        else None,
+        tuple(sorted(field_variable_names)),
+    )
+
+
+def _get_key_size(key: Tuple[Any, ...]) -> int:
+    """
+    Computes the approximate amount of memory, in bytes, retained by the key
+    of a plan entry, excluding the objects it shares with the document.
+    :param key: the key of the plan entry
+    :type key: Tuple[Any, ...]
+    :return: the approximate retained size of the key
+    :rtype: int
+    """
+    # The first part of the key (type name or resolver id) is tiny or shared
+    # with the schema, the other ones are tuples of ids & variable values
+    return sys.getsizeof(key) + sum(
+        sys.getsizeof(part) + sum(map(sys.getsizeof, part)) for part in key[1:]
+    )
+
+
+class ExecutionPlan:
+    """
+    Holds the execution computations of a document which only depend on the
+    document, the schema and the variable values referenced by the selection
+    directives. It's stored on the DocumentNode in order to be shared across
+    the executions of the document.
+
+    Collected fields are only cached when every directive used on selections
+    either doesn't collect or is the built-in @skip/@include, since other
+    collection hooks may depend on the execution context.
+    """
+
+    __slots__ = (
+        "schema",
+        "max_entries",
+        "collection_variable_names",
+        "field_variable_names",
+        "collected_fields",
+        "pending_collections",
+        "field_resolvers",
+        "on_growth",
+    )
+
+    def __init__(
+        self,
+        schema: "GraphQLSchema",
+        document: "DocumentNode",
+        max_entries: int = 1024,
+        on_growth: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param document: the DocumentNode instance to plan
+        :param max_entries: maximum number of entries of each cache of the
+        plan
+        :param on_growth: callable notified with the approximate amount of
+        memory, in bytes, retained by each new entry of the plan
+        :type schema: GraphQLSchema
+        :type document: DocumentNode
+        :type max_entries: int
+        :type on_growth: Optional[Callable[[int], None]]
+        """
+        # pylint: disable=too-many-arguments
+        self.schema = schema
+        self.max_entries = max_entries
+        self.on_growth = on_growth
+        (
+            self.collection_variable_names,
+            self.field_variable_names,
+        ) = _compile_directive_variable_names(schema, document)
+        self.collected_fields: Dict[
+            Tuple[Any, ...], Dict[str, List["FieldNode"]]
+        ] = {}
+        self.pending_collections: Dict[Tuple[Any, ...], "asyncio.Future"] = {}
+        self.field_resolvers: Dict[Tuple[Any, ...], Callable] = {}
+
+    def _get_collection_key(
+        self,
+        runtime_type: "GraphQLObjectType",
+        selection_sets: Sequence["SelectionSetNode"],
+        variable_values: Optional[Dict[str, Any]],
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Computes the key under which the fields collected from the selection
+        sets for the runtime type are cached.
+        :param runtime_type: current runtime type of the selection sets
+        :param selection_sets: selection set nodes to collect
+        :param variable_values: the variables provided in the GraphQL request
+        :type runtime_type: GraphQLObjectType
+        :type selection_sets: Sequence[SelectionSetNode]
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the key of the collected fields or None if they can't be
+        cached
+        :rtype: Optional[Tuple[Any, ...]]
+        """
+        if self.collection_variable_names is None:
+            return None
+
+        # Selection sets are retained by the document, their ids are stable
+        key = (
+            runtime_type.name,
+            tuple(map(id, selection_sets)),
+            _get_variable_values_key(
+                self.collection_variable_names, variable_values
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    async def collect_fields(
+        self,
+        runtime_type: "GraphQLObjectType",
+        selection_sets: Sequence["SelectionSetNode"],
+        variable_values: Optional[Dict[str, Any]],
+        collector: Callable[[], Awaitable[Dict[str, List["FieldNode"]]]],
+    ) -> Dict[str, List["FieldNode"]]:
+        """
+        Returns the fields collected from the selection sets for the runtime
+        type, calling the collector only once per planned key, even when
+        the same selection sets are collected concurrently (e.g. for the
+        items of a list).
+        :param runtime_type: current runtime type of the selection sets
+        :param selection_sets: selection set nodes to collect
+        :param variable_values: the variables provided in the GraphQL request
+        :param collector: callable collecting the fields
+        :type runtime_type: GraphQLObjectType
+        :type selection_sets: Sequence[SelectionSetNode]
+        :type variable_values: Optional[Dict[str, Any]]
+        :type collector: Callable[[], Awaitable[Dict[str, List[FieldNode]]]]
+        :return: the dictionary of collected fields
+        :rtype: Dict[str, List[FieldNode]]
+        """
+        key = self._get_collection_key(
+            runtime_type, selection_sets, variable_values
+        )
+        if key is None:
+            return await collector()
+
+        fields = self.collected_fields.get(key)
+        if fields is not None:
+            return fields
+
+        pending_collection = self.pending_collections.get(key)
+        if pending_collection is not None:
+            fields = await asyncio.shield(pending_collection)
+            # The collection failed, each caller collects on its own
+            return fields if fields is not None else await collector()
+
+        pending_collection = asyncio.get_running_loop().create_future()
+        self.pending_collections[key] = pending_collection
+        try:
+            fields = await collector()
+            if len(self.collected_fields) < self.max_entries:
+                self.collected_fields[key] = fields
+                if self.on_growth is not None:
+                    # Field nodes are retained by the document itself
+                    self.on_growth(
+                        _get_key_size(key)
+                        + sys.getsizeof(fields)
+                        + sum(map(sys.getsizeof, fields.values()))
+                    )
+        finally:
+            del self.pending_collections[key]
+            pending_collection.set_result(fields)
+        return fields
+
+    def get_field_resolver(
+        self,
+        field_nodes: List["FieldNode"],
+        resolver: Callable,
+        variable_values: Optional[Dict[str, Any]],
+        wrapper: Callable[[], Callable],
+    ) -> Callable:
+        """
+        Returns the resolver of the field nodes wrapped with their query
+        directives, calling the wrapper only once per field nodes, resolver
+        and values of the variables referenced by the field directives.
+        :param field_nodes: AST nodes related to the resolved field
+        :param resolver: callable to use to resolve the field
+        :param variable_values: the variables provided in the GraphQL request
+        :param wrapper: callable wrapping the resolver with the directives
+        :type field_nodes: List[FieldNode]
+        :type resolver: Callable
+        :type variable_values: Optional[Dict[str, Any]]
+        :type wrapper: Callable[[], Callable]
+        :return: the wrapped resolver
+        :rtype: Callable
+        """
+        # Field nodes are retained by the document & resolvers by the schema,
+        # their ids are stable
+        key = (
+            id(resolver),
+            tuple(map(id, field_nodes)),
+            _get_variable_values_key(
+                self.field_variable_names, variable_values
+            ),
+        )
+        try:
+            wrapped_resolver = self.field_resolvers.get(key)
+        except TypeError:
+            return wrapper()
+
+        if wrapped_resolver is None:
+            wrapped_resolver = wrapper()
+            if len(self.field_resolvers) < self.max_entries:
+                self.field_resolvers[key] = wrapped_resolver
+                if self.on_growth is not None:
+                    self.on_growth(
+                        _get_key_size(key) + sys.getsizeof(wrapped_resolver)
+                    )
+        return wrapped_resolver
+
+
+def get_execution_plan(
+    schema: "GraphQLSchema", document: "DocumentNode"
+) -> Optional["ExecutionPlan"]:
+    """
+    Returns the execution plan of the document for the schema if any. Plans
+    are only attached to the documents kept by the query cache, since the
+    other ones aren't executed again.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :return: the execution plan of the document if any
+    :rtype: Optional[ExecutionPlan]
+    """
+    execution_plan = document.execution_plan
+    if execution_plan is None or execution_plan.schema is not schema:
+        return None
+    return execution_plan
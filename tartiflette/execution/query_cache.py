@@ -0,0 +1,380 @@
+import gc
+import sys
+import time
+
+from collections import OrderedDict, namedtuple
+from functools import partial, wraps
+from types import FunctionType, ModuleType
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from tartiflette.execution.plan import ExecutionPlan
+from tartiflette.language.ast import DocumentNode
+
+__all__ = ("QueryCache", "QueryCacheInfo", "get_retained_size")
+
+QueryCacheInfo = namedtuple(
+    "QueryCacheInfo",
+    [
+        "hits",
+        "misses",
+        "negative_hits",
+        "evictions",
+        "expirations",
+        "entries",
+        "aliases",
+        "negative_entries",
+        "size",
+        "max_size",
+    ],
+)
+
+# Objects shared with the rest of the process which shouldn't be accounted
+_SHARED_TYPES = (type, ModuleType, FunctionType)
+
+
+def get_retained_size(obj: Any) -> int:
+    """
+    Computes the approximate amount of memory, in bytes, retained by an
+    object by walking through the objects it references. Objects reachable
+    several times are only counted once.
+    :param obj: object from which to compute the retained size
+    :type obj: Any
+    :return: the approximate retained size of the object
+    :rtype: int
+    """
+    size = 0
+    seen = set()
+    objects = [obj]
+    while objects:
+        referrers = []
+        for current in objects:
+            if isinstance(current, _SHARED_TYPES) or id(current) in seen:
+                continue
+            seen.add(id(current))
+            size += sys.getsizeof(current)
+            referrers.append(current)
+        objects = gc.get_referents(*referrers)
+    return size
+
+
+class QueryCache:
+    """
+    Cache decorator of the query parsing & validation step, bounded by the
+    approximate memory retained by the cached documents instead of their
+    number. Queries which can't be executed (syntax or validation errors) are
+    cached separately, for a limited amount of time.
+
+    When a `normalizer` is provided, queries only differing by their
+    formatting share the same document, cached under the normalized query
+    but parsed from the first query received with this normalized form.
+    Errors are still cached under the query itself, so that their locations
+    refer to it. The normalizer is only called when the query isn't already
+    known as is.
+
+    Cached documents get an execution plan, whose entries are charged to
+    the size of the document as they're added.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        max_size: int = 64 * 1024 * 1024,
+        negative_ttl: Optional[float] = 60.0,
+        negative_maxsize: int = 1024,
+        normalizer: Optional[
+            Callable[[Union[str, bytes]], Union[str, bytes]]
+        ] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_size: maximum amount of memory, in bytes, retained by the
+        cached documents
+        :param negative_ttl: number of seconds during which the errors of
+        a query are cached (errors aren't cached if `None` or `0`)
+        :param negative_maxsize: maximum number of cached query errors
+        :param normalizer: callable computing the canonical representation
+        of a query, used as cache key
+        :param clock: callable returning the current time, in seconds
+        :type max_size: int
+        :type negative_ttl: Optional[float]
+        :type negative_maxsize: int
+        :type normalizer: Optional[Callable[[Union[str, bytes]], Union[str, bytes]]]
+        :type clock: Callable[[], float]
+        """
+        # pylint: disable=too-many-arguments
+        self._max_size = max_size
+        self._negative_ttl = negative_ttl
+        self._negative_maxsize = negative_maxsize
+        self._normalizer = normalizer
+        self._clock = clock
+        # Maps a key to a (result, size, normalized key) tuple, where the
+        # normalized key is only set for aliases of a normalized query
+        self._entries: "OrderedDict[Any, Tuple[Any, int, Any]]" = OrderedDict()
+        self._negative_entries: "OrderedDict[Any, Tuple[Any, float]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._aliases = 0
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Decorates the parsing & validation function with the cache.
+        :param func: the function to decorate, returning a couple
+        DocumentNode/errors
+        :type func: Callable
+        :return: the decorated function
+        :rtype: Callable
+        """
+
+        @wraps(func)
+        def wrapper(
+            query: Union[str, bytes], schema: "GraphQLSchema"
+        ) -> Tuple[
+            Optional["DocumentNode"], Optional[List["TartifletteError"]]
+        ]:
+            key = (query, schema)
+            result = self._lookup(key)
+            if result is not None:
+                return result
+
+            if self._normalizer is not None:
+                normalized_query = self._normalizer(query)
+                if normalized_query != query:
+                    normalized_key = (normalized_query, schema)
+                    result = self._lookup(normalized_key)
+                    if result is None:
+                        self._misses += 1
+                        # The query is parsed as sent by the client, so that
+                        # the locations of its errors refer to it
+                        result = func(query, schema)
+                        if result[1] or result[0] is None:
+                            self.set(key, result)
+                            return result
+                        self.set(normalized_key, result)
+                    self._set_alias(key, normalized_key, result)
+                    return result
+
+            self._misses += 1
+            result = func(query, schema)
+            self.set(key, result)
+            return result
+
+        wrapper.cache_info = self.info
+        wrapper.cache_clear = self.clear
+        return wrapper
+
+    def _lookup(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """
+        Returns the cached result for the key if any and updates the
+        statistics of the cache accordingly.
+        :param key: the key to look up
+        :type key: Any
+        :return: the cached couple DocumentNode/errors if any
+        :rtype: Optional[Tuple[Any, Any]]
+        """
+        try:
+            result, _, normalized_key = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            if normalized_key is not None:
+                try:
+                    result, _, _ = self._entries[normalized_key]
+                except KeyError:
+                    # The aliased document has been evicted
+                    self._remove(key)
+                    return None
+                self._entries.move_to_end(normalized_key)
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+        try:
+            result, expires_at = self._negative_entries[key]
+        except KeyError:
+            return None
+
+        if expires_at > self._clock():
+            self._negative_hits += 1
+            return result
+
+        del self._negative_entries[key]
+        self._expirations += 1
+        return None
+
+    def get(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """
+        Returns the cached result for the key if any.
+        :param key: the key to look up
+        :type key: Any
+        :return: the cached couple DocumentNode/errors if any
+        :rtype: Optional[Tuple[Any, Any]]
+        """
+        result = self._lookup(key)
+        if result is None:
+            self._misses += 1
+        return result
+
+    def _remove(self, key: Any) -> None:
+        """
+        Removes an entry from the cache.
+        :param key: the key of the entry to remove
+        :type key: Any
+        """
+        _, size, normalized_key = self._entries.pop(key)
+        self._size -= size
+        if normalized_key is not None:
+            self._aliases -= 1
+
+    def _evict(self) -> None:
+        """
+        Evicts the least recently used entries until the cache isn't full.
+        """
+        while self._size > self._max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _insert(self, key: Any, entry: Tuple[Any, int, Any]) -> None:
+        """
+        Inserts an entry into the cache and evicts the least recently used
+        entries if the cache is full.
+        :param key: the key of the entry
+        :param entry: the (result, size, normalized key) tuple to insert
+        :type key: Any
+        :type entry: Tuple[Any, int, Any]
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = entry
+        self._size += entry[1]
+        if entry[2] is not None:
+            self._aliases += 1
+
+        self._evict()
+
+    def _set_negative(self, key: Any, result: Tuple[Any, Any]) -> None:
+        """
+        Caches the errors of a query which can't be executed.
+        :param key: the key under which to cache the errors
+        :param result: the couple DocumentNode/errors to cache
+        :type key: Any
+        :type result: Tuple[Any, Any]
+        """
+        if not self._negative_ttl:
+            return
+
+        self._negative_entries[key] = (
+            result,
+            self._clock() + self._negative_ttl,
+        )
+        self._negative_entries.move_to_end(key)
+        while len(self._negative_entries) > self._negative_maxsize:
+            self._negative_entries.popitem(last=False)
+            self._evictions += 1
+
+    def _set_alias(
+        self, key: Any, normalized_key: Any, result: Tuple[Any, Any]
+    ) -> None:
+        """
+        Links a query to the cached result of its normalized query.
+        :param key: the key of the query
+        :param normalized_key: the key of the normalized query
+        :param result: the couple DocumentNode/errors of the normalized query
+        :type key: Any
+        :type normalized_key: Any
+        :type result: Tuple[Any, Any]
+        """
+        document, errors = result
+        if errors or document is None:
+            self._set_negative(key, result)
+        elif normalized_key in self._entries:
+            size = get_retained_size(key[0])
+            if size <= self._max_size:
+                self._insert(key, (None, size, normalized_key))
+
+    def set(self, key: Any, result: Tuple[Any, Any]) -> None:
+        """
+        Caches the result of the parsing & validation of a query.
+        :param key: the key under which to cache the result
+        :param result: the couple DocumentNode/errors to cache
+        :type key: Any
+        :type result: Tuple[Any, Any]
+        """
+        document, errors = result
+        if errors or document is None:
+            self._set_negative(key, result)
+            return
+
+        size = get_retained_size(document)
+        if size <= self._max_size:
+            if isinstance(document, DocumentNode):
+                document.execution_plan = ExecutionPlan(
+                    key[1],
+                    document,
+                    on_growth=partial(self._charge, key, document),
+                )
+            self._insert(key, (result, size, None))
+
+    def _charge(self, key: Any, document: Any, size: int) -> None:
+        """
+        Charges the growth of the execution plan of a cached document to its
+        entry, evicting the least recently used entries if the cache is full.
+        :param key: the key of the entry of the document
+        :param document: the document whose execution plan grew
+        :param size: the approximate size of the new entry of the plan
+        :type key: Any
+        :type document: Any
+        :type size: int
+        """
+        try:
+            result, entry_size, normalized_key = self._entries[key]
+        except KeyError:
+            # The document has been evicted, its plan is no longer accounted
+            return
+
+        if result[0] is not document:
+            return
+
+        self._entries[key] = (result, entry_size + size, normalized_key)
+        self._size += size
+        self._evict()
+
+    def info(self) -> QueryCacheInfo:
+        """
+        Returns the statistics of the cache.
+        :return: the statistics of the cache
+        :rtype: QueryCacheInfo
+        """
+        return QueryCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            negative_hits=self._negative_hits,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            entries=len(self._entries) - self._aliases,
+            aliases=self._aliases,
+            negative_entries=len(self._negative_entries),
+            size=self._size,
+            max_size=self._max_size,
+        )
+
+    def clear(self) -> None:
+        """
+        Removes every cached result and resets the statistics.
+        """
+        self._entries.clear()
+        self._negative_entries.clear()
+        self._size = 0
+        self._aliases = 0
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._evictions = 0
+        self._expirations = 0
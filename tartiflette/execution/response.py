@@ -2,13 +2,14 @@ import asyncio
 
 from typing import Any, Callable, Dict, List, Optional
 
-__all__ = ("build_response",)
+__all__ = ("build_response", "copy_response")
 
 
 async def build_response(
     error_coercer: Callable,
     data: Optional[Dict[str, Any]] = None,
     errors: Optional[List["TartifletteError"]] = None,
+    extensions: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Returns and formats the data and errors into a proper GraphQL response.
@@ -16,9 +17,11 @@ async def build_response(
     Exception/error into an error dictionary
     :param data: the data from fields execution
     :param errors: the errors encountered during the request execution
+    :param extensions: the extensions of the response
     :type error_coercer: Callable
     :type data: Optional[Dict[str, Any]]
     :type errors: Optional[List[TartifletteError]]
+    :type extensions: Optional[Dict[str, Any]]
     :return: a GraphQL response
     :rtype: Dict[str, Any]
     """
@@ -27,6 +30,26 @@ async def build_response(
         if errors
         else None
     )
+    response = {"data": data}
     if coerced_errors:
-        return {"data": data, "errors": coerced_errors}
-    return {"data": data}
+        response["errors"] = coerced_errors
+    if extensions:
+        response["extensions"] = extensions
+    return response
+
+
+def copy_response(value: Any) -> Any:
+    """
+    Returns a deep copy of the dictionaries & lists of a GraphQL response, so
+    that a response shared by several requests can't be mutated by one of
+    them. Other values, which are coerced leaf values, are shared.
+    :param value: the response or one of its values
+    :type value: Any
+    :return: the copy of the value
+    :rtype: Any
+    """
+    if isinstance(value, dict):
+        return {key: copy_response(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_response(item) for item in value]
+    return value
@@ -0,0 +1,127 @@
+import asyncio
+
+from typing import Awaitable, Callable, List, Set
+
+__all__ = ("BatchScheduler",)
+
+
+class BatchScheduler:
+    """
+    Dispatches the pending batches of an execution (batch resolvers and
+    DataLoaders) at the point where the execution would block, i.e. once
+    every task spawned by the executor has run until it waits for something.
+
+    The executor notifies the scheduler each time it spawns tasks, right
+    after their creation: since the event loop runs its callbacks in their
+    scheduling order, the callback scheduled at that moment runs after the
+    first step of each spawned task. Once no spawned task is left to start,
+    all the keys which could be loaded without waiting have been added to
+    their batch, which are then dispatched.
+
+    Batches filled outside of the first step of a spawned task (e.g. after
+    an I/O, or by loaders used outside of an execution) are dispatched once
+    no entry has been added to any batch during a whole iteration of the
+    event loop.
+    """
+
+    __slots__ = (
+        "_starting",
+        "_flushes",
+        "_entries",
+        "_checked_entries",
+        "_check_scheduled",
+        "_tasks",
+    )
+
+    def __init__(self) -> None:
+        self._starting = 0
+        self._flushes: List[Callable[[], None]] = []
+        self._entries = 0
+        self._checked_entries = 0
+        self._check_scheduled = False
+        self._tasks: Set["asyncio.Task"] = set()
+
+    def spawned(self) -> None:
+        """
+        Notifies the scheduler that tasks have just been spawned, so that no
+        batch is dispatched until they have all been started.
+        """
+        self._starting += 1
+        asyncio.get_running_loop().call_soon(self._on_spawned_started)
+
+    def _on_spawned_started(self) -> None:
+        """
+        Dispatches the pending batches once the last spawned tasks have been
+        started.
+        """
+        self._starting -= 1
+        self._flush()
+
+    def schedule(self, flush: Callable[[], None]) -> None:
+        """
+        Registers the callable dispatching a new batch, whose entries are
+        notified through `entry_added`.
+        :param flush: the callable dispatching the batch
+        :type flush: Callable[[], None]
+        """
+        self._flushes.append(flush)
+
+    def entry_added(self) -> None:
+        """
+        Notifies the scheduler that an entry has been added to a batch.
+        """
+        self._entries += 1
+        if not self._check_scheduled:
+            self._check_scheduled = True
+            asyncio.get_running_loop().call_soon(self._on_check)
+
+    def _on_check(self) -> None:
+        """
+        Dispatches the pending batches once no entry has been added during a
+        whole iteration of the event loop.
+        """
+        if self._entries != self._checked_entries:
+            self._checked_entries = self._entries
+            asyncio.get_running_loop().call_soon(self._on_check)
+            return
+
+        self._check_scheduled = False
+        self._flush()
+
+    def _flush(self) -> None:
+        """
+        Dispatches the pending batches if no spawned task is left to start.
+        """
+        if self._starting or not self._flushes:
+            return
+
+        flushes, self._flushes = self._flushes, []
+        for flush in flushes:
+            flush()
+
+    def create_task(self, coroutine: Awaitable[None]) -> "asyncio.Task":
+        """
+        Runs the dispatch of a batch in a task referenced by the scheduler
+        until it's done, since nothing else awaits it directly.
+        :param coroutine: the dispatch to run
+        :type coroutine: Awaitable[None]
+        :return: the task running the dispatch
+        :rtype: asyncio.Task
+        """
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def close(self) -> None:
+        """
+        Drops the batches which haven't been dispatched yet, then cancels
+        the dispatches which are still running and waits for them to be
+        done.
+        """
+        self._flushes.clear()
+        tasks = [task for task in self._tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
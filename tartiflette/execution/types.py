@@ -1,80 +1,148 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from tartiflette.execution.deadline import remaining_time
 
 __all__ = ("build_resolve_info",)
 
 
 class ResolveInfo:
     """
-    Class containing the information related to a resolved field.
+    Class containing the information related to a resolved field. It's a
+    view over the execution context of the request and the definition of the
+    field: the information it exposes is only looked up when it's read,
+    except the deadline of the field, which is narrowed by the `@timeout`
+    directive.
     """
 
     __slots__ = (
-        "field_name",
+        "execution_context",
+        "field_definition",
         "field_nodes",
-        "return_type",
         "parent_type",
         "path",
-        "schema",
-        "fragments",
-        "root_value",
-        "operation",
-        "variable_values",
         "is_introspection",
+        "deadline",
     )
 
     def __init__(
         self,
-        field_name: str,
+        execution_context: "ExecutionContext",
+        field_definition: "GraphQLField",
         field_nodes: List["FieldNodes"],
-        return_type: "GraphQLOutputType",
         parent_type: "GraphQLObjectType",
         path: "Path",
-        schema: "GraphQLSchema",
-        fragments: Dict[str, "FragmentDefinitionNode"],
-        root_value: Optional[Any],
-        operation: "OperationDefinitionNode",
-        variable_values: Optional[Dict[str, Any]],
         is_introspection_context: bool,
-    ):
+    ) -> None:
         """
-        :param field_name: name of the resolved field
+        :param execution_context: instance of the query execution context
+        :param field_definition: GraphQLField instance of the resolved field
         :param field_nodes: AST nodes related to the resolved field
-        :param return_type: GraphQLOutputType instance of the resolved field
         :param parent_type: GraphQLObjectType of the field's parent
         :param path: the path traveled until this field
-        :param schema: the GraphQLSchema instance linked to the engine
-        :param fragments: a dictionary of fragment definition AST nodes
-        contained in the request
-        :param root_value: the initial value corresponding to the root type
-        being executed
-        :param operation: the AST operation definition node to execute
-        :param variable_values: the variables provided in the GraphQL request
         :param is_introspection_context: determines whether or not the resolved
         field is in a context of an introspection query
-        :type field_name: str
+        :type execution_context: ExecutionContext
+        :type field_definition: GraphQLField
         :type field_nodes: List[FieldNodes]
-        :type return_type: GraphQLOutputType
         :type parent_type: GraphQLObjectType
         :type path: Path
-        :type schema: GraphQLSchema
-        :type fragments: Dict[str, FragmentDefinitionNode]
-        :type root_value: Optional[Any]
-        :type operation: OperationDefinitionNode
-        :type variable_values: Optional[Dict[str, Any]]
         :type is_introspection_context: bool
         """
-        # pylint: disable=too-many-arguments,too-many-locals
-        self.field_name = field_name
+        # pylint: disable=too-many-arguments
+        self.execution_context = execution_context
+        self.field_definition = field_definition
         self.field_nodes = field_nodes
-        self.return_type = return_type
         self.parent_type = parent_type
         self.path = path
-        self.schema = schema
-        self.fragments = fragments
-        self.root_value = root_value
-        self.operation = operation
-        self.variable_values = variable_values
         self.is_introspection: bool = is_introspection_context
+        self.deadline: Optional[float] = (
+            execution_context.options.deadline
+            if execution_context is not None
+            else None
+        )
+
+    def add_cleanup(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a callable to call once the execution is done, whether
+        it's completed or cancelled (e.g. once the client went away).
+        :param callback: the callable to call, which can return an awaitable
+        :type callback: Callable[[], Any]
+        """
+        self.execution_context.cleanup_callbacks.append(callback)
+
+    @property
+    def remaining_time(self) -> Optional[float]:
+        """
+        Returns the number of seconds left until the deadline of the
+        resolved field.
+        :return: the number of seconds left or None if there is no deadline
+        :rtype: Optional[float]
+        """
+        return remaining_time(self.deadline)
+
+    @property
+    def field_name(self) -> str:
+        """
+        Returns the name of the resolved field.
+        :return: the name of the resolved field
+        :rtype: str
+        """
+        return self.field_definition.name
+
+    @property
+    def return_type(self) -> "GraphQLOutputType":
+        """
+        Returns the GraphQLOutputType instance of the resolved field.
+        :return: the GraphQLOutputType instance of the resolved field
+        :rtype: GraphQLOutputType
+        """
+        return self.field_definition.graphql_type
+
+    @property
+    def schema(self) -> "GraphQLSchema":
+        """
+        Returns the GraphQLSchema instance linked to the engine.
+        :return: the GraphQLSchema instance linked to the engine
+        :rtype: GraphQLSchema
+        """
+        return self.execution_context.schema
+
+    @property
+    def fragments(self) -> Dict[str, "FragmentDefinitionNode"]:
+        """
+        Returns the fragment definition AST nodes contained in the request.
+        :return: the fragment definition AST nodes contained in the request
+        :rtype: Dict[str, FragmentDefinitionNode]
+        """
+        return self.execution_context.fragments
+
+    @property
+    def root_value(self) -> Optional[Any]:
+        """
+        Returns the initial value corresponding to the root type being
+        executed.
+        :return: the initial value corresponding to the root type
+        :rtype: Optional[Any]
+        """
+        return self.execution_context.root_value
+
+    @property
+    def operation(self) -> "OperationDefinitionNode":
+        """
+        Returns the AST operation definition node to execute.
+        :return: the AST operation definition node to execute
+        :rtype: OperationDefinitionNode
+        """
+        return self.execution_context.operation
+
+    @property
+    def variable_values(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the variables provided in the GraphQL request.
+        :return: the variables provided in the GraphQL request
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self.execution_context.variable_values
 
 
 def build_resolve_info(
@@ -104,15 +172,10 @@ def build_resolve_info(
     :rtype: ResolveInfo
     """
     return ResolveInfo(
-        field_definition.name,
+        execution_context,
+        field_definition,
         field_nodes,
-        field_definition.graphql_type,
         parent_type,
         path,
-        execution_context.schema,
-        execution_context.fragments,
-        execution_context.root_value,
-        execution_context.operation,
-        execution_context.variable_values,
         is_introspection_context,
     )
@@ -0,0 +1,3 @@
+from tartiflette.instrumentation.instrument import Instrument, Instrumentation
+
+__all__ = ("Instrument", "Instrumentation")
@@ -0,0 +1,273 @@
+import logging
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+__all__ = ("Instrument", "Instrumentation")
+
+logger = logging.getLogger(__name__)
+
+_FIELD_EVENTS = (
+    "on_resolve_field_start",
+    "on_resolve_field_end",
+    "on_coerce_start",
+    "on_coerce_end",
+)
+
+_EVENTS = (
+    "on_parse_start",
+    "on_parse_end",
+    "on_validate_start",
+    "on_validate_end",
+    "on_build_context_start",
+    "on_build_context_end",
+    "on_execute_start",
+    "on_execute_end",
+    *_FIELD_EVENTS,
+    "on_error",
+)
+
+
+class Instrument:
+    """
+    Base class of the instruments observing the executions of an engine.
+    Only the hooks overridden by an instrument are called. Hooks are
+    synchronous & called in the hot path of the execution: they shouldn't
+    block. Their exceptions are logged.
+    """
+
+    # pylint: disable=no-self-use,unused-argument
+
+    def on_parse_start(self, query: Optional[Union[str, bytes]]) -> None:
+        """
+        Called before the query of a request is parsed & validated.
+        :param query: the GraphQL request / query
+        :type query: Optional[Union[str, bytes]]
+        """
+
+    def on_parse_end(
+        self,
+        query: Optional[Union[str, bytes]],
+        document: Optional["DocumentNode"],
+        errors: Optional[List["TartifletteError"]],
+    ) -> None:
+        """
+        Called once the query of a request is parsed & validated, even when
+        the document was retrieved from a cache.
+        :param query: the GraphQL request / query
+        :param document: the validated document of the query
+        :param errors: the errors which prevent the query from being executed
+        :type query: Optional[Union[str, bytes]]
+        :type document: Optional[DocumentNode]
+        :type errors: Optional[List[TartifletteError]]
+        """
+
+    def on_validate_start(self, query: Union[str, bytes]) -> None:
+        """
+        Called before the document of a query is validated, once it's
+        parsed. Documents retrieved from a cache aren't validated again.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes]
+        """
+
+    def on_validate_end(
+        self,
+        query: Union[str, bytes],
+        errors: Optional[List["TartifletteError"]],
+    ) -> None:
+        """
+        Called once the document of a query is validated.
+        :param query: the GraphQL request / query
+        :param errors: the validation errors of the document
+        :type query: Union[str, bytes]
+        :type errors: Optional[List[TartifletteError]]
+        """
+
+    def on_build_context_start(
+        self,
+        document: "DocumentNode",
+        operation_name: Optional[str],
+        variables: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Called before the operation to execute is selected & its variables
+        are coerced.
+        :param document: the validated document of the query
+        :param operation_name: the operation name to execute
+        :param variables: the variables provided in the GraphQL request
+        :type document: DocumentNode
+        :type operation_name: Optional[str]
+        :type variables: Optional[Dict[str, Any]]
+        """
+
+    def on_build_context_end(
+        self,
+        document: "DocumentNode",
+        errors: Optional[List["TartifletteError"]],
+    ) -> None:
+        """
+        Called once the operation to execute is selected & its variables are
+        coerced.
+        :param document: the validated document of the query
+        :param errors: the errors which prevent the operation from being
+        executed
+        :type document: DocumentNode
+        :type errors: Optional[List[TartifletteError]]
+        """
+
+    def on_execute_start(self, execution_context: "ExecutionContext") -> None:
+        """
+        Called before the operation is executed.
+        :param execution_context: the execution context of the request
+        :type execution_context: ExecutionContext
+        """
+
+    def on_execute_end(
+        self,
+        execution_context: "ExecutionContext",
+        data: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Called once the operation is executed, including when the execution
+        is cancelled.
+        :param execution_context: the execution context of the request
+        :param data: the data of the response
+        :type execution_context: ExecutionContext
+        :type data: Optional[Dict[str, Any]]
+        """
+
+    def on_resolve_field_start(self, info: "ResolveInfo") -> None:
+        """
+        Called before the arguments of a field are coerced & its resolver is
+        called.
+        :param info: information related to the execution and the resolved
+        field
+        :type info: ResolveInfo
+        """
+
+    def on_resolve_field_end(
+        self, info: "ResolveInfo", result: Union[Exception, Any]
+    ) -> None:
+        """
+        Called once the resolver of a field returned.
+        :param info: information related to the execution and the resolved
+        field
+        :param result: the resolved value or the raised exception
+        :type info: ResolveInfo
+        :type result: Union[Exception, Any]
+        """
+
+    def on_coerce_start(
+        self, info: "ResolveInfo", value: Union[Exception, Any]
+    ) -> None:
+        """
+        Called before the resolved value of a field is completed, which
+        includes the resolution of the fields of its objects.
+        :param info: information related to the execution and the resolved
+        field
+        :param value: the resolved value or the raised exception
+        :type info: ResolveInfo
+        :type value: Union[Exception, Any]
+        """
+
+    def on_coerce_end(self, info: "ResolveInfo", result: Any) -> None:
+        """
+        Called once the resolved value of a field is completed.
+        :param info: information related to the execution and the resolved
+        field
+        :param result: the completed value
+        :type info: ResolveInfo
+        :type result: Any
+        """
+
+    def on_error(
+        self, error: Exception, coerced_error: Dict[str, Any]
+    ) -> None:
+        """
+        Called once an error of a response is coerced.
+        :param error: the exception to report
+        :param coerced_error: the error dictionary of the response
+        :type error: Exception
+        :type coerced_error: Dict[str, Any]
+        """
+
+
+def _noop(*_args) -> None:
+    """
+    Hook of the events which aren't observed by any instrument.
+    """
+
+
+def _compile_hooks(hooks: List[Callable[..., None]]) -> Callable[..., None]:
+    """
+    Returns a callable calling the hooks of an event.
+    :param hooks: the hooks to call
+    :type hooks: List[Callable[..., None]]
+    :return: a callable calling the hooks
+    :rtype: Callable[..., None]
+    """
+    if not hooks:
+        return _noop
+
+    def call_hooks(*args) -> None:
+        for hook in hooks:
+            try:
+                hook(*args)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Instrument hook %r failed.", hook)
+
+    return call_hooks
+
+
+class Instrumentation:
+    """
+    Dispatches the events of the executions to the hooks of the instruments
+    implementing them. Each event is compiled once, into a no-op when no
+    instrument observes it.
+    """
+
+    __slots__ = (*_EVENTS, "instruments", "instruments_fields")
+
+    def __init__(self, instruments: Sequence["Instrument"]) -> None:
+        """
+        :param instruments: the instruments to notify
+        :type instruments: Sequence[Instrument]
+        """
+        self.instruments = tuple(instruments)
+        for event in _EVENTS:
+            setattr(
+                self,
+                event,
+                _compile_hooks(
+                    [
+                        getattr(instrument, event)
+                        for instrument in self.instruments
+                        if getattr(type(instrument), event, None)
+                        not in (None, getattr(Instrument, event))
+                    ]
+                ),
+            )
+        self.instruments_fields = any(
+            getattr(self, event) is not _noop for event in _FIELD_EVENTS
+        )
+
+    def wrap_error_coercer(self, error_coercer: Callable) -> Callable:
+        """
+        Returns the error coercer notifying the instruments of the coerced
+        errors.
+        :param error_coercer: the error coercer of the engine
+        :type error_coercer: Callable
+        :return: the error coercer to use
+        :rtype: Callable
+        """
+        on_error = self.on_error  # pylint: disable=no-member
+        if on_error is _noop:
+            return error_coercer
+
+        async def instrumented_error_coercer(
+            exception: Exception,
+        ) -> Dict[str, Any]:
+            coerced_error = await error_coercer(exception)
+            on_error(exception, coerced_error)
+            return coerced_error
+
+        return instrumented_error_coercer
@@ -10,7 +10,13 @@ class DocumentNode(Node):
     AST node representing a GraphQL document.
     """
 
-    __slots__ = ("definitions", "location", "_hash_id", "validators")
+    __slots__ = (
+        "definitions",
+        "location",
+        "_hash_id",
+        "validators",
+        "execution_plan",
+    )
 
     def __init__(
         self,
@@ -33,6 +39,7 @@ class DocumentNode(Node):
         self.location = location
         self._hash_id = hash_id
         self.validators = validators
+        self.execution_plan: Optional["ExecutionPlan"] = None
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -0,0 +1,87 @@
+import re
+
+from itertools import chain
+from typing import List, Union
+
+__all__ = ("normalize_query",)
+
+_STRINGS_AND_COMMENTS_REGEX = re.compile(
+    r"""
+    \"\"\"(?:\\\"\"\"|[^"\\]|\\|"(?!""))*\"\"\"
+    |"(?:[^"\\\n\r]|\\.)*"
+    |\#[^\n\r]*
+    """,
+    re.VERBOSE,
+)
+
+# Ignored tokens are only required to separate names, numbers & strings
+_SEPARATOR_TOKENS_REGEX = re.compile(
+    r'(?<=[\w.+\-"])[\t\n\r ,\ufeff]+(?=[\w.+\-"])'
+)
+_IGNORED_TOKENS_TABLE = str.maketrans(dict.fromkeys("\t\n\r ,\ufeff"))
+
+_STRING_PLACEHOLDER = '"\x00"'
+_SEPARATOR_PLACEHOLDER = "\x01"
+
+
+def _extract_strings(query: str, strings: List[str]) -> str:
+    """
+    Replaces the strings of the query by placeholders (in order to leave them
+    untouched) and strips its comments.
+    :param query: the GraphQL request / query
+    :param strings: list to fill in with the extracted strings
+    :type query: str
+    :type strings: List[str]
+    :return: the query without strings & comments
+    :rtype: str
+    """
+
+    def replace(match: "re.Match") -> str:
+        token = match.group()
+        if token[0] == "#":
+            return " "
+        strings.append(token)
+        return _STRING_PLACEHOLDER
+
+    return _STRINGS_AND_COMMENTS_REGEX.sub(replace, query)
+
+
+def normalize_query(query: Union[str, bytes]) -> Union[str, bytes]:
+    """
+    Computes the canonical representation of a query by stripping its ignored
+    tokens (whitespaces, line terminators, commas & comments), so that queries
+    only differing by their formatting share the same representation. Queries
+    which can't be tokenized are returned unchanged.
+    :param query: the GraphQL request / query as UTF8-encoded string
+    :type query: Union[str, bytes]
+    :return: the canonical representation of the query
+    :rtype: Union[str, bytes]
+    """
+    if isinstance(query, bytes):
+        try:
+            decoded_query = query.decode("utf-8")
+        except UnicodeDecodeError:
+            return query
+    else:
+        decoded_query = query
+
+    if "\x00" in decoded_query or _SEPARATOR_PLACEHOLDER in decoded_query:
+        return query
+
+    strings = []
+    code = _extract_strings(decoded_query, strings)
+    if code.count('"') != 2 * len(strings):
+        # Unterminated string
+        return query
+
+    code = (
+        _SEPARATOR_TOKENS_REGEX.sub(_SEPARATOR_PLACEHOLDER, code)
+        .translate(_IGNORED_TOKENS_TABLE)
+        .replace(_SEPARATOR_PLACEHOLDER, " ")
+    )
+    if not strings:
+        return code
+
+    parts = code.split(_STRING_PLACEHOLDER)
+    strings.append("")
+    return "".join(chain.from_iterable(zip(parts, strings)))
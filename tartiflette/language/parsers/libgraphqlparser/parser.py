@@ -1,17 +1,89 @@
 import os
 
 from types import TracebackType
-from typing import Optional, Type, Union
+from typing import Callable, List, Optional, Type, Union
 
 from cffi import FFI
 
+from tartiflette.language.ast import (
+    ArgumentNode,
+    BooleanValueNode,
+    DirectiveNode,
+    DocumentNode,
+    EnumValueNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListTypeNode,
+    ListValueNode,
+    Location,
+    NamedTypeNode,
+    NameNode,
+    NonNullTypeNode,
+    NullValueNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    StringValueNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
 from tartiflette.language.parsers.libgraphqlparser.transformers import (
     document_from_ast_json,
 )
+from tartiflette.language.parsers.libgraphqlparser.validation import (
+    validate_document,
+)
 from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
 
 __all__ = ("parse_to_document",)
 
+# Concrete AST node types handled by the libgraphqlparser visitor, in the
+# order defined by the `FOR_EACH_CONCRETE_TYPE` macro of the C API.
+_CONCRETE_TYPES = (
+    "document",
+    "operation_definition",
+    "variable_definition",
+    "selection_set",
+    "field",
+    "argument",
+    "fragment_spread",
+    "inline_fragment",
+    "fragment_definition",
+    "variable",
+    "int_value",
+    "float_value",
+    "string_value",
+    "boolean_value",
+    "null_value",
+    "enum_value",
+    "list_value",
+    "object_value",
+    "object_field",
+    "directive",
+    "named_type",
+    "list_type",
+    "non_null_type",
+    "name",
+    "schema_definition",
+    "operation_type_definition",
+    "scalar_type_definition",
+    "object_type_definition",
+    "field_definition",
+    "input_value_definition",
+    "interface_type_definition",
+    "union_type_definition",
+    "enum_type_definition",
+    "enum_value_definition",
+    "input_object_type_definition",
+    "type_extension_definition",
+    "directive_definition",
+)
+
 # TODO: automatize read from headers files
 _FFI = FFI()
 _FFI.cdef(
@@ -24,7 +96,38 @@ void graphql_error_free(const char *error);
 void graphql_node_free(struct GraphQLAstNode *node);
 
 const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
+
+/* `struct GraphQLAstLocation` is read as an array of its 4 members */
+void graphql_node_get_location(const void *node, unsigned int *location);
+
+const char *GraphQLAstOperationDefinition_get_operation(const void *node);
+const void *GraphQLAstVariableDefinition_get_default_value(const void *node);
+const char *GraphQLAstName_get_value(const void *node);
+const char *GraphQLAstIntValue_get_value(const void *node);
+const char *GraphQLAstFloatValue_get_value(const void *node);
+const char *GraphQLAstStringValue_get_value(const void *node);
+int GraphQLAstBooleanValue_get_value(const void *node);
+const char *GraphQLAstEnumValue_get_value(const void *node);
+
+typedef int (*visit_func)(const void *node, void *user_data);
+typedef void (*end_visit_func)(const void *node, void *user_data);
+
+struct GraphQLAstVisitorCallbacks {
+%s
+};
+
+void graphql_node_visit(
+    const struct GraphQLAstNode *node,
+    const struct GraphQLAstVisitorCallbacks *callbacks,
+    void *user_data);
+
+void free(void *ptr);
 """
+    % "\n".join(
+        f"  visit_func visit_{concrete_type};\n"
+        f"  end_visit_func end_visit_{concrete_type};"
+        for concrete_type in _CONCRETE_TYPES
+    )
 )
 
 # TODO: use importlib.resource in Python 3.7
@@ -36,6 +139,9 @@ try:
 except OSError:
     _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
 
+# Needed to release the JSON string allocated by `graphql_ast_to_json`
+_LIBC = _FFI.dlopen(None)
+
 
 class ParsedData:
     """
@@ -95,11 +201,18 @@ def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
     if isinstance(query, str):
         query = query.encode("UTF-8")
 
+    # libgraphqlparser expects a NUL-terminated string: an already terminated
+    # buffer is directly shared with the library, otherwise the query is
+    # copied once into a NUL-terminated buffer allocated by cffi.
+    if query.endswith(b"\x00"):
+        c_query = _FFI.from_buffer("char[]", query)
+    else:
+        c_query = _FFI.new("char[]", query)
+
     errors = _FFI.new("char **")
 
     parsed_data = ParsedData(
-        _LIB.graphql_parse_string(_FFI.new("char[]", query), errors),
-        _LIB.graphql_node_free,
+        _LIB.graphql_parse_string(c_query, errors), _LIB.graphql_node_free
     )
 
     if errors[0] != _FFI.NULL:
@@ -122,7 +235,604 @@ def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
     with _parse_context_manager(query) as parsed:
-        return _FFI.string(_LIB.graphql_ast_to_json(parsed))
+        json_ast = _LIB.graphql_ast_to_json(parsed)
+        try:
+            return _FFI.string(json_ast)
+        finally:
+            _LIBC.free(_FFI.cast("void *", json_ast))
+
+
+class _AstBuilder:
+    """
+    State shared across the libgraphqlparser visitor callbacks while walking
+    the C AST of a query. Each visited node which has children pushes a new
+    list on the stack, which is popped and transformed into the node's AST
+    representation once all its children have been visited.
+    """
+
+    __slots__ = ("stack", "location", "error")
+
+    def __init__(self) -> None:
+        self.stack: List[List["Node"]] = [[]]
+        self.location = _FFI.new("unsigned int[4]")
+        self.error: Optional[Exception] = None
+
+    def parse_location(self, node: "CData") -> "Location":
+        """
+        Returns the location of the C AST node.
+        :param node: the C AST node from which retrieve the location
+        :type node: CData
+        :return: the location of the C AST node
+        :rtype: Location
+        """
+        _LIB.graphql_node_get_location(node, self.location)
+        return Location(*_FFI.unpack(self.location, 4))
+
+
+def _of_type(children: List["Node"], node_type: type) -> List["Node"]:
+    """
+    Returns the children which are instances of the filled in node type.
+    :param children: visited children of a node
+    :param node_type: type of the children to return
+    :type children: List[Node]
+    :type node_type: type
+    :return: the children of the filled in node type
+    :rtype: List[Node]
+    """
+    return [child for child in children if isinstance(child, node_type)]
+
+
+def _c_string(c_string: "CData") -> str:
+    """
+    Decodes a C string returned by the libgraphqlparser accessors.
+    :param c_string: the `const char *` to decode
+    :type c_string: CData
+    :return: the decoded string
+    :rtype: str
+    """
+    return _FFI.string(c_string).decode("UTF-8")
+
+
+def _build_document(
+    children: List[Union["FragmentDefinitionNode", "OperationDefinitionNode"]],
+    location: "Location",
+) -> "DocumentNode":
+    """
+    Builds the DocumentNode of the query from its visited definitions.
+    :param children: visited definitions of the document
+    :param location: location of the document in the query
+    :type children: List[Union[FragmentDefinitionNode, OperationDefinitionNode]]
+    :type location: Location
+    :return: the DocumentNode of the query
+    :rtype: DocumentNode
+    """
+    return DocumentNode(definitions=children, location=location)
+
+
+def _build_operation_definition(
+    node: "CData", children: List["Node"], location: "Location"
+) -> "OperationDefinitionNode":
+    """
+    Builds an OperationDefinitionNode from its visited children.
+    :param node: the C AST node, used to retrieve the operation type
+    :param children: name, variable definitions, directives & selection set
+    of the operation definition
+    :param location: location of the operation definition in the query
+    :type node: CData
+    :type children: List[Node]
+    :type location: Location
+    :return: the OperationDefinitionNode
+    :rtype: OperationDefinitionNode
+    """
+    return OperationDefinitionNode(
+        operation_type=_c_string(
+            _LIB.GraphQLAstOperationDefinition_get_operation(node)
+        ),
+        name=children[0] if isinstance(children[0], NameNode) else None,
+        variable_definitions=_of_type(children, VariableDefinitionNode),
+        directives=_of_type(children, DirectiveNode),
+        selection_set=children[-1],
+        location=location,
+    )
+
+
+def _build_variable_definition(
+    children: List["Node"], location: "Location"
+) -> "VariableDefinitionNode":
+    """
+    Builds a VariableDefinitionNode from its visited children.
+    :param children: variable, type & default value of the definition
+    :param location: location of the variable definition in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the VariableDefinitionNode
+    :rtype: VariableDefinitionNode
+    """
+    return VariableDefinitionNode(
+        variable=children[0],
+        type=children[1],
+        default_value=children[2] if len(children) > 2 else None,
+        location=location,
+    )
+
+
+def _build_selection_set(
+    children: List[
+        Union["FieldNode", "FragmentSpreadNode", "InlineFragmentNode"]
+    ],
+    location: "Location",
+) -> "SelectionSetNode":
+    """
+    Builds a SelectionSetNode from its visited selections.
+    :param children: selections of the selection set
+    :param location: location of the selection set in the query
+    :type children: List[Union[FieldNode, FragmentSpreadNode, InlineFragmentNode]]
+    :type location: Location
+    :return: the SelectionSetNode
+    :rtype: SelectionSetNode
+    """
+    return SelectionSetNode(selections=children, location=location)
+
+
+def _build_field(children: List["Node"], location: "Location") -> "FieldNode":
+    """
+    Builds a FieldNode from its visited children.
+    :param children: alias, name, arguments, directives & selection set of
+    the field
+    :param location: location of the field in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the FieldNode
+    :rtype: FieldNode
+    """
+    has_alias = len(children) > 1 and isinstance(children[1], NameNode)
+    return FieldNode(
+        alias=children[0] if has_alias else None,
+        name=children[1] if has_alias else children[0],
+        arguments=_of_type(children, ArgumentNode),
+        directives=_of_type(children, DirectiveNode),
+        selection_set=(
+            children[-1]
+            if isinstance(children[-1], SelectionSetNode)
+            else None
+        ),
+        location=location,
+    )
+
+
+def _build_argument(
+    children: List["Node"], location: "Location"
+) -> "ArgumentNode":
+    """
+    Builds an ArgumentNode from its visited children.
+    :param children: name & value of the argument
+    :param location: location of the argument in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the ArgumentNode
+    :rtype: ArgumentNode
+    """
+    return ArgumentNode(name=children[0], value=children[1], location=location)
+
+
+def _build_fragment_spread(
+    children: List["Node"], location: "Location"
+) -> "FragmentSpreadNode":
+    """
+    Builds a FragmentSpreadNode from its visited children.
+    :param children: name & directives of the fragment spread
+    :param location: location of the fragment spread in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the FragmentSpreadNode
+    :rtype: FragmentSpreadNode
+    """
+    return FragmentSpreadNode(
+        name=children[0], directives=children[1:], location=location
+    )
+
+
+def _build_inline_fragment(
+    children: List["Node"], location: "Location"
+) -> "InlineFragmentNode":
+    """
+    Builds an InlineFragmentNode from its visited children.
+    :param children: type condition, directives & selection set of the
+    inline fragment
+    :param location: location of the inline fragment in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the InlineFragmentNode
+    :rtype: InlineFragmentNode
+    """
+    return InlineFragmentNode(
+        type_condition=(
+            children[0] if isinstance(children[0], NamedTypeNode) else None
+        ),
+        directives=_of_type(children, DirectiveNode),
+        selection_set=children[-1],
+        location=location,
+    )
+
+
+def _build_fragment_definition(
+    children: List["Node"], location: "Location"
+) -> "FragmentDefinitionNode":
+    """
+    Builds a FragmentDefinitionNode from its visited children.
+    :param children: name, type condition, directives & selection set of the
+    fragment definition
+    :param location: location of the fragment definition in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the FragmentDefinitionNode
+    :rtype: FragmentDefinitionNode
+    """
+    return FragmentDefinitionNode(
+        name=children[0],
+        type_condition=children[1],
+        directives=children[2:-1],
+        selection_set=children[-1],
+        location=location,
+    )
+
+
+def _build_variable(
+    children: List["NameNode"], location: "Location"
+) -> "VariableNode":
+    """
+    Builds a VariableNode from its visited name.
+    :param children: name of the variable
+    :param location: location of the variable in the query
+    :type children: List[NameNode]
+    :type location: Location
+    :return: the VariableNode
+    :rtype: VariableNode
+    """
+    return VariableNode(name=children[0], location=location)
+
+
+def _build_list_value(
+    children: List["ValueNode"], location: "Location"
+) -> "ListValueNode":
+    """
+    Builds a ListValueNode from its visited values.
+    :param children: values of the list
+    :param location: location of the list value in the query
+    :type children: List[ValueNode]
+    :type location: Location
+    :return: the ListValueNode
+    :rtype: ListValueNode
+    """
+    return ListValueNode(values=children, location=location)
+
+
+def _build_object_value(
+    children: List["ObjectFieldNode"], location: "Location"
+) -> "ObjectValueNode":
+    """
+    Builds an ObjectValueNode from its visited fields.
+    :param children: fields of the object value
+    :param location: location of the object value in the query
+    :type children: List[ObjectFieldNode]
+    :type location: Location
+    :return: the ObjectValueNode
+    :rtype: ObjectValueNode
+    """
+    return ObjectValueNode(fields=children, location=location)
+
+
+def _build_object_field(
+    children: List["Node"], location: "Location"
+) -> "ObjectFieldNode":
+    """
+    Builds an ObjectFieldNode from its visited children.
+    :param children: name & value of the object field
+    :param location: location of the object field in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the ObjectFieldNode
+    :rtype: ObjectFieldNode
+    """
+    return ObjectFieldNode(
+        name=children[0], value=children[1], location=location
+    )
+
+
+def _build_directive(
+    children: List["Node"], location: "Location"
+) -> "DirectiveNode":
+    """
+    Builds a DirectiveNode from its visited children.
+    :param children: name & arguments of the directive
+    :param location: location of the directive in the query
+    :type children: List[Node]
+    :type location: Location
+    :return: the DirectiveNode
+    :rtype: DirectiveNode
+    """
+    return DirectiveNode(
+        name=children[0], arguments=children[1:], location=location
+    )
+
+
+def _build_named_type(
+    children: List["NameNode"], location: "Location"
+) -> "NamedTypeNode":
+    """
+    Builds a NamedTypeNode from its visited name.
+    :param children: name of the type
+    :param location: location of the named type in the query
+    :type children: List[NameNode]
+    :type location: Location
+    :return: the NamedTypeNode
+    :rtype: NamedTypeNode
+    """
+    return NamedTypeNode(name=children[0], location=location)
+
+
+def _build_list_type(
+    children: List["TypeNode"], location: "Location"
+) -> "ListTypeNode":
+    """
+    Builds a ListTypeNode from its visited wrapped type.
+    :param children: wrapped type of the list type
+    :param location: location of the list type in the query
+    :type children: List[TypeNode]
+    :type location: Location
+    :return: the ListTypeNode
+    :rtype: ListTypeNode
+    """
+    return ListTypeNode(type=children[0], location=location)
+
+
+def _build_non_null_type(
+    children: List["TypeNode"], location: "Location"
+) -> "NonNullTypeNode":
+    """
+    Builds a NonNullTypeNode from its visited wrapped type.
+    :param children: wrapped type of the non null type
+    :param location: location of the non null type in the query
+    :type children: List[TypeNode]
+    :type location: Location
+    :return: the NonNullTypeNode
+    :rtype: NonNullTypeNode
+    """
+    return NonNullTypeNode(type=children[0], location=location)
+
+
+def _build_name(node: "CData", location: "Location") -> "NameNode":
+    """
+    Builds a NameNode from the C AST node.
+    :param node: the C AST node
+    :param location: location of the name in the query
+    :type node: CData
+    :type location: Location
+    :return: the NameNode
+    :rtype: NameNode
+    """
+    return NameNode(
+        value=_c_string(_LIB.GraphQLAstName_get_value(node)),
+        location=location,
+    )
+
+
+def _build_int_value(node: "CData", location: "Location") -> "IntValueNode":
+    """
+    Builds an IntValueNode from the C AST node.
+    :param node: the C AST node
+    :param location: location of the value in the query
+    :type node: CData
+    :type location: Location
+    :return: the IntValueNode
+    :rtype: IntValueNode
+    """
+    return IntValueNode(
+        value=_c_string(_LIB.GraphQLAstIntValue_get_value(node)),
+        location=location,
+    )
+
+
+def _build_float_value(
+    node: "CData", location: "Location"
+) -> "FloatValueNode":
+    """
+    Builds a FloatValueNode from the C AST node.
+    :param node: the C AST node
+    :param location: location of the value in the query
+    :type node: CData
+    :type location: Location
+    :return: the FloatValueNode
+    :rtype: FloatValueNode
+    """
+    return FloatValueNode(
+        value=_c_string(_LIB.GraphQLAstFloatValue_get_value(node)),
+        location=location,
+    )
+
+
+def _build_string_value(
+    node: "CData", location: "Location"
+) -> "StringValueNode":
+    """
+    Builds a StringValueNode from the C AST node.
+    :param node: the C AST node
+    :param location: location of the value in the query
+    :type node: CData
+    :type location: Location
+    :return: the StringValueNode
+    :rtype: StringValueNode
+    """
+    return StringValueNode(
+        value=_c_string(_LIB.GraphQLAstStringValue_get_value(node)),
+        location=location,
+    )
+
+
+def _build_boolean_value(
+    node: "CData", location: "Location"
+) -> "BooleanValueNode":
+    """
+    Builds a BooleanValueNode from the C AST node.
+    :param node: the C AST node
+    :param location: location of the value in the query
+    :type node: CData
+    :type location: Location
+    :return: the BooleanValueNode
+    :rtype: BooleanValueNode
+    """
+    return BooleanValueNode(
+        value=bool(_LIB.GraphQLAstBooleanValue_get_value(node)),
+        location=location,
+    )
+
+
+def _build_null_value(_node: "CData", location: "Location") -> "NullValueNode":
+    """
+    Builds a NullValueNode.
+    :param _node: the C AST node, ignored
+    :param location: location of the value in the query
+    :type _node: CData
+    :type location: Location
+    :return: the NullValueNode
+    :rtype: NullValueNode
+    """
+    return NullValueNode(location=location)
+
+
+def _build_enum_value(node: "CData", location: "Location") -> "EnumValueNode":
+    """
+    Builds an EnumValueNode from the C AST node.
+    :param node: the C AST node
+    :param location: location of the value in the query
+    :type node: CData
+    :type location: Location
+    :return: the EnumValueNode
+    :rtype: EnumValueNode
+    """
+    return EnumValueNode(
+        value=_c_string(_LIB.GraphQLAstEnumValue_get_value(node)),
+        location=location,
+    )
+
+
+def _visit_parent_callback(
+    builder: Callable, with_node: bool = False
+) -> "CData":
+    """
+    Creates the couple of C visitor callbacks used for a node which has
+    children. The node's AST representation is built once all its children
+    have been visited.
+    :param builder: callable in charge of building the node's representation
+    :param with_node: whether or not the builder needs the C AST node
+    :type builder: Callable
+    :type with_node: bool
+    :return: the visit & end visit C callbacks
+    :rtype: CData
+    """
+
+    def visit(_node: "CData", user_data: "CData") -> int:
+        _FFI.from_handle(user_data).stack.append([])
+        return 1
+
+    def end_visit(node: "CData", user_data: "CData") -> None:
+        ast_builder = _FFI.from_handle(user_data)
+        if ast_builder.error is not None:
+            return
+        try:
+            children = ast_builder.stack.pop()
+            location = ast_builder.parse_location(node)
+            ast_builder.stack[-1].append(
+                builder(node, children, location)
+                if with_node
+                else builder(children, location)
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            ast_builder.error = e
+
+    return (
+        _FFI.callback("visit_func", visit),
+        _FFI.callback("end_visit_func", end_visit),
+    )
+
+
+def _visit_leaf_callback(builder: Callable) -> "CData":
+    """
+    Creates the C visitor callbacks used for a node which doesn't have any
+    children. The node's AST representation is directly built on visit.
+    :param builder: callable in charge of building the node's representation
+    :type builder: Callable
+    :return: the visit & end visit C callbacks
+    :rtype: CData
+    """
+
+    def visit(node: "CData", user_data: "CData") -> int:
+        ast_builder = _FFI.from_handle(user_data)
+        try:
+            ast_builder.stack[-1].append(
+                builder(node, ast_builder.parse_location(node))
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            ast_builder.error = e
+        return 0
+
+    return _FFI.callback("visit_func", visit), _FFI.NULL
+
+
+_VISITOR_CALLBACKS = {
+    "document": _visit_parent_callback(_build_document),
+    "operation_definition": _visit_parent_callback(
+        _build_operation_definition, with_node=True
+    ),
+    "variable_definition": _visit_parent_callback(_build_variable_definition),
+    "selection_set": _visit_parent_callback(_build_selection_set),
+    "field": _visit_parent_callback(_build_field),
+    "argument": _visit_parent_callback(_build_argument),
+    "fragment_spread": _visit_parent_callback(_build_fragment_spread),
+    "inline_fragment": _visit_parent_callback(_build_inline_fragment),
+    "fragment_definition": _visit_parent_callback(_build_fragment_definition),
+    "variable": _visit_parent_callback(_build_variable),
+    "int_value": _visit_leaf_callback(_build_int_value),
+    "float_value": _visit_leaf_callback(_build_float_value),
+    "string_value": _visit_leaf_callback(_build_string_value),
+    "boolean_value": _visit_leaf_callback(_build_boolean_value),
+    "null_value": _visit_leaf_callback(_build_null_value),
+    "enum_value": _visit_leaf_callback(_build_enum_value),
+    "list_value": _visit_parent_callback(_build_list_value),
+    "object_value": _visit_parent_callback(_build_object_value),
+    "object_field": _visit_parent_callback(_build_object_field),
+    "directive": _visit_parent_callback(_build_directive),
+    "named_type": _visit_parent_callback(_build_named_type),
+    "list_type": _visit_parent_callback(_build_list_type),
+    "non_null_type": _visit_parent_callback(_build_non_null_type),
+    "name": _visit_leaf_callback(_build_name),
+}
+
+_VISITOR = _FFI.new("struct GraphQLAstVisitorCallbacks *")
+for _concrete_type, (_visit, _end_visit) in _VISITOR_CALLBACKS.items():
+    setattr(_VISITOR, f"visit_{_concrete_type}", _visit)
+    setattr(_VISITOR, f"end_visit_{_concrete_type}", _end_visit)
+
+
+def _parse_to_ast(query: Union[str, bytes]) -> "DocumentNode":
+    """
+    Parses the query and returns its DocumentNode by walking the C AST built
+    by libgraphqlparser, without serializing it to JSON. The definitions of
+    the returned document are in the order of the query and aren't validated
+    yet.
+    :param query: query to parse
+    :type query: Union[str, bytes]
+    :return: the DocumentNode of the query
+    :rtype: DocumentNode
+    """
+    ast_builder = _AstBuilder()
+    with _parse_context_manager(query) as parsed:
+        _LIB.graphql_node_visit(parsed, _VISITOR, _FFI.new_handle(ast_builder))
+
+    if ast_builder.error is not None:
+        raise ast_builder.error
+
+    return ast_builder.stack[0][0]
 
 
 def parse_to_document(
@@ -152,6 +862,21 @@ def parse_to_document(
     >>>   }
     >>> }''')
     """
-    return document_from_ast_json(
-        schema.json_loader(_parse_to_json_ast(query)), query, schema
-    )
+    instrumentation = schema.instrumentation
+    if schema.query_parser_mode == "json":
+        document_ast = schema.json_loader(_parse_to_json_ast(query))
+        if instrumentation is not None:
+            instrumentation.on_validate_start(query)
+        # The document is validated while its nodes are created
+        document = document_from_ast_json(document_ast, query, schema)
+    else:
+        document = _parse_to_ast(query)
+        if instrumentation is not None:
+            instrumentation.on_validate_start(query)
+        document = validate_document(document, query, schema)
+
+    if instrumentation is not None:
+        instrumentation.on_validate_end(
+            query, document.validators.errors or None
+        )
+    return document
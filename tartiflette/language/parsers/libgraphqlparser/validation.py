@@ -0,0 +1,538 @@
+from typing import List, Optional, Union
+
+from tartiflette.coercers.common import Path
+from tartiflette.language.ast import (
+    ArgumentNode,
+    DirectiveNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+from tartiflette.language.validators import Validators
+from tartiflette.language.validators.query import RULE_SET
+from tartiflette.language.validators.query.utils import (
+    get_schema_field_type_name,
+)
+
+__all__ = ("validate_document",)
+
+# The nodes are walked in the same order as the JSON AST transformers, so
+# that both parser modes collect the same validation errors in the same order
+
+
+def _current_definition_ctx(validators: "Validators") -> dict:
+    """
+    Returns the validation context of the operation or fragment definition
+    being walked.
+    :param validators: the validators used to validate the document
+    :type validators: Validators
+    :return: the validation context of the current definition
+    :rtype: dict
+    """
+    if validators.ctx["in_operation"]:
+        return validators.ctx["per_operation"][
+            validators.ctx["current_operation_name"]
+        ]
+    return validators.ctx["per_fragment"][
+        validators.ctx["current_fragment_name"]
+    ]
+
+
+def _validate_value(
+    value: Optional["ValueNode"], validators: "Validators", path: "Path"
+) -> None:
+    """
+    Validates a value node and collects the variables it uses.
+    :param value: the value node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type value: Optional[ValueNode]
+    :type validators: Validators
+    :type path: Path
+    """
+    if isinstance(value, VariableNode):
+        if not validators.ctx.get("in_variable_definitions", False):
+            _current_definition_ctx(validators).setdefault(
+                "used_vars", []
+            ).append(value)
+    elif isinstance(value, ListValueNode):
+        for item in value.values:
+            _validate_value(item, validators, path)
+    elif isinstance(value, ObjectValueNode) and value.fields:
+        for object_field in value.fields:
+            _validate_value(object_field.value, validators, path)
+
+        validators.validate(
+            "input-object-field-uniqueness",
+            input_fields=value.fields,
+            path=path,
+        )
+
+
+def _validate_argument(
+    argument: "ArgumentNode", validators: "Validators", path: "Path"
+) -> None:
+    """
+    Validates an argument node and collects the variable it uses if any.
+    :param argument: the argument node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type argument: ArgumentNode
+    :type validators: Validators
+    :type path: Path
+    """
+    _validate_value(argument.value, validators, path)
+
+    if isinstance(argument.value, VariableNode):
+        in_directive = validators.ctx.get("in_directive", False)
+        _current_definition_ctx(validators).setdefault(
+            "args_using_var", []
+        ).append(
+            {
+                "arg": argument,
+                "node_location": (
+                    validators.ctx["current_directive_name"]
+                    if in_directive
+                    else validators.ctx["current_field_name"]
+                ),
+                "is_directive": in_directive,
+                "path": path,
+            }
+        )
+
+
+def _validate_arguments(
+    arguments: Optional[List["ArgumentNode"]],
+    validators: "Validators",
+    path: "Path",
+) -> None:
+    """
+    Validates a list of argument nodes.
+    :param arguments: the argument nodes to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type arguments: Optional[List[ArgumentNode]]
+    :type validators: Validators
+    :type path: Path
+    """
+    if arguments:
+        for argument in arguments:
+            _validate_argument(argument, validators, path)
+
+        validators.validate(
+            rule="argument-uniqueness", arguments=arguments, path=path
+        )
+
+
+def _validate_directive(
+    directive: "DirectiveNode", validators: "Validators", path: "Path"
+) -> None:
+    """
+    Validates a directive node.
+    :param directive: the directive node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type directive: DirectiveNode
+    :type validators: Validators
+    :type path: Path
+    """
+    validators.ctx["in_directive"] = True
+    validators.ctx["current_directive_name"] = directive.name.value
+    _validate_arguments(directive.arguments, validators, path)
+    validators.ctx["in_directive"] = False
+
+    validators.validate(
+        rule="values-of-correct-type", node=directive, path=path
+    )
+    validators.validate(rule="argument-names", node=directive, path=path)
+    validators.validate(rule="required-arguments", node=directive, path=path)
+    validators.validate(
+        rule="directives-are-defined", directive=directive, path=path
+    )
+
+
+def _validate_directives(
+    directives: Optional[List["DirectiveNode"]],
+    validators: "Validators",
+    path: "Path",
+) -> None:
+    """
+    Validates a list of directive nodes.
+    :param directives: the directive nodes to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type directives: Optional[List[DirectiveNode]]
+    :type validators: Validators
+    :type path: Path
+    """
+    if directives:
+        for directive in directives:
+            _validate_directive(directive, validators, path)
+
+        validators.validate(
+            rule="directives-are-unique-per-location",
+            directives=directives,
+            path=path,
+        )
+
+
+def _validate_field(
+    field: "FieldNode", validators: "Validators", path: "Path"
+) -> None:
+    """
+    Validates a field node and its selection set.
+    :param field: the field node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type field: FieldNode
+    :type validators: Validators
+    :type path: Path
+    """
+    path = Path(prev=path, key=field.name.value)
+    parent_type_name = validators.ctx["parent_type_name"]
+
+    validators.ctx["parent_type_name"] = get_schema_field_type_name(
+        parent_type_name, field.name.value, validators.schema
+    )
+    validators.ctx["in_directive"] = False
+    validators.ctx["current_field_name"] = f"{parent_type_name}.{field.name}"
+
+    _validate_arguments(field.arguments, validators, path)
+    _validate_directives(field.directives, validators, path)
+    _validate_selection_set(field.selection_set, validators, path)
+
+    validators.ctx["parent_type_name"] = parent_type_name
+
+    validators.validate(
+        rule="directives-are-in-valid-locations", node=field, path=path
+    )
+    validators.validate(
+        rule="field-selections-on-objects-interfaces-and-unions-types",
+        field=field,
+        path=path,
+    )
+    validators.validate(rule="leaf-field-selections", field=field, path=path)
+    validators.validate(rule="values-of-correct-type", node=field, path=path)
+    validators.validate(rule="argument-names", node=field, path=path)
+    validators.validate(rule="required-arguments", node=field, path=path)
+
+
+def _validate_fragment_spread(
+    fragment_spread: "FragmentSpreadNode",
+    validators: "Validators",
+    path: "Path",
+) -> None:
+    """
+    Validates a fragment spread node and collects it in order to validate
+    the fragment definitions.
+    :param fragment_spread: the fragment spread node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type fragment_spread: FragmentSpreadNode
+    :type validators: Validators
+    :type path: Path
+    """
+    _validate_directives(fragment_spread.directives, validators, path)
+
+    validators.validate(
+        rule="directives-are-in-valid-locations",
+        node=fragment_spread,
+        path=path,
+    )
+
+    validators.ctx.setdefault("fragment_spreads", []).append(fragment_spread)
+    validators.ctx.setdefault("spreaded_in", {}).setdefault(
+        validators.ctx["parent_type_name"], []
+    ).append({"spread": fragment_spread, "path": path})
+    _current_definition_ctx(validators).setdefault("spreads", []).append(
+        fragment_spread
+    )
+
+
+def _validate_inline_fragment(
+    inline_fragment: "InlineFragmentNode",
+    validators: "Validators",
+    path: "Path",
+) -> None:
+    """
+    Validates an inline fragment node and its selection set.
+    :param inline_fragment: the inline fragment node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type inline_fragment: InlineFragmentNode
+    :type validators: Validators
+    :type path: Path
+    """
+    parent_type_name = validators.ctx["parent_type_name"]
+    if inline_fragment.type_condition:
+        validators.ctx[
+            "parent_type_name"
+        ] = inline_fragment.type_condition.name.value
+
+    _validate_directives(inline_fragment.directives, validators, path)
+    _validate_selection_set(inline_fragment.selection_set, validators, path)
+
+    validators.validate(
+        rule="directives-are-in-valid-locations",
+        node=inline_fragment,
+        path=path,
+    )
+    validators.validate(
+        rule="fragment-spread-type-existence",
+        fragment=inline_fragment,
+        path=path,
+    )
+    validators.validate(
+        rule="fragments-on-composite-types",
+        fragment=inline_fragment,
+        path=path,
+    )
+
+    validators.ctx.setdefault("inlined_in", {}).setdefault(
+        validators.ctx["parent_type_name"], []
+    ).append(inline_fragment)
+    validators.ctx["parent_type_name"] = parent_type_name
+
+
+_SELECTION_VALIDATOR_MAPPING = {
+    FieldNode: _validate_field,
+    FragmentSpreadNode: _validate_fragment_spread,
+    InlineFragmentNode: _validate_inline_fragment,
+}
+
+
+def _validate_selection_set(
+    selection_set: Optional["SelectionSetNode"],
+    validators: "Validators",
+    path: "Path",
+) -> None:
+    """
+    Validates the selections of a selection set node.
+    :param selection_set: the selection set node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type selection_set: Optional[SelectionSetNode]
+    :type validators: Validators
+    :type path: Path
+    """
+    if selection_set:
+        for selection in selection_set.selections:
+            _SELECTION_VALIDATOR_MAPPING[type(selection)](
+                selection, validators, path
+            )
+
+
+def _validate_fragment_definition(
+    fragment_definition: "FragmentDefinitionNode",
+    validators: "Validators",
+    path: Optional["Path"],
+) -> None:
+    """
+    Validates a fragment definition node and its selection set.
+    :param fragment_definition: the fragment definition node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type fragment_definition: FragmentDefinitionNode
+    :type validators: Validators
+    :type path: Optional[Path]
+    """
+    parent_type_name = validators.ctx.get("parent_type_name")
+    name = fragment_definition.name.value
+    validators.ctx[
+        "parent_type_name"
+    ] = fragment_definition.type_condition.name.value
+    validators.ctx["in_operation"] = False
+    validators.ctx["current_fragment_name"] = name
+    validators.ctx.setdefault("per_fragment", {}).setdefault(name, {})
+
+    _validate_directives(fragment_definition.directives, validators, path)
+    _validate_selection_set(
+        fragment_definition.selection_set, validators, path
+    )
+
+    validators.validate(
+        rule="directives-are-in-valid-locations",
+        node=fragment_definition,
+        path=path,
+    )
+    validators.validate(
+        rule="fragment-spread-type-existence",
+        fragment=fragment_definition,
+        path=path,
+    )
+    validators.validate(
+        rule="fragments-on-composite-types",
+        fragment=fragment_definition,
+        path=path,
+    )
+
+    validators.ctx["parent_type_name"] = parent_type_name
+
+
+def _validate_variable_definitions(
+    variable_definitions: Optional[List["VariableDefinitionNode"]],
+    validators: "Validators",
+    path: Optional["Path"],
+) -> None:
+    """
+    Validates a list of variable definition nodes.
+    :param variable_definitions: the variable definition nodes to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type variable_definitions: Optional[List[VariableDefinitionNode]]
+    :type validators: Validators
+    :type path: Optional[Path]
+    """
+    if variable_definitions:
+        validators.ctx["in_variable_definitions"] = True
+        for variable_definition in variable_definitions:
+            _validate_value(
+                variable_definition.default_value, validators, path
+            )
+            validators.validate(
+                rule="variables-are-input-types",
+                variable=variable_definition,
+                path=path,
+            )
+        validators.ctx["in_variable_definitions"] = False
+
+        validators.validate(
+            rule="variable-uniqueness",
+            variable_definitions=variable_definitions,
+            path=path,
+        )
+
+
+def _validate_operation_definition(
+    operation_definition: "OperationDefinitionNode",
+    validators: "Validators",
+    path: Optional["Path"],
+) -> None:
+    """
+    Validates an operation definition node and its selection set.
+    :param operation_definition: the operation definition node to validate
+    :param validators: the validators used to validate the document
+    :param path: a Path object that contains the current field path
+    :type operation_definition: OperationDefinitionNode
+    :type validators: Validators
+    :type path: Optional[Path]
+    """
+    name = (
+        operation_definition.name.value
+        if operation_definition.name
+        else "None"
+    )
+    validators.ctx["parent_type_name"] = getattr(
+        validators.schema,
+        f"{operation_definition.operation_type.lower()}_operation_name",
+    )
+    validators.ctx["in_operation"] = True
+    validators.ctx["current_operation_name"] = name
+    validators.ctx.setdefault("per_operation", {}).setdefault(name, {})
+
+    _validate_variable_definitions(
+        operation_definition.variable_definitions, validators, path
+    )
+    _validate_directives(operation_definition.directives, validators, path)
+    _validate_selection_set(
+        operation_definition.selection_set, validators, path
+    )
+
+    validators.validate(
+        rule="directives-are-in-valid-locations",
+        node=operation_definition,
+        path=path,
+    )
+
+
+_DOCUMENT_RULES = (
+    ("fragment-spreads-must-not-form-cycles", "fragments"),
+    ("operation-name-uniqueness", "operations"),
+    ("lone-anonymous-operation", "operations"),
+    ("single-root-field", "definitions"),
+    ("fragment-name-uniqueness", "fragments"),
+    ("fragment-spread-target-defined", "fragments"),
+    ("fragment-must-be-used", "fragments"),
+    ("fragment-spread-is-possible", "fragments"),
+    ("all-variable-uses-defined", "operations"),
+    ("all-variables-used", "operations"),
+    ("all-variable-usages-are-allowed", "operations"),
+)
+
+
+def _validate_definitions(
+    definitions: List[
+        Union["FragmentDefinitionNode", "OperationDefinitionNode"]
+    ],
+    validators: "Validators",
+) -> List[Union["FragmentDefinitionNode", "OperationDefinitionNode"]]:
+    """
+    Validates the definition nodes of a document and returns them with the
+    fragment definitions first, as the JSON AST transformers do.
+    :param definitions: the definition nodes to validate
+    :param validators: the validators used to validate the document
+    :type definitions: List[Union[FragmentDefinitionNode, OperationDefinitionNode]]
+    :type validators: Validators
+    :return: the fragment definitions followed by the operation definitions
+    :rtype: List[Union[FragmentDefinitionNode, OperationDefinitionNode]]
+    """
+    parsed_def = {"FragmentDefinition": [], "OperationDefinition": []}
+    for definition in definitions:
+        if isinstance(definition, FragmentDefinitionNode):
+            _validate_fragment_definition(definition, validators, None)
+            parsed_def["FragmentDefinition"].append(definition)
+        else:
+            _validate_operation_definition(definition, validators, None)
+            parsed_def["OperationDefinition"].append(definition)
+
+    arguments = {
+        "fragments": parsed_def["FragmentDefinition"],
+        "operations": parsed_def["OperationDefinition"],
+        "definitions": parsed_def,
+    }
+    for rule, argument in _DOCUMENT_RULES:
+        validators.validate(
+            rule=rule, path=None, **{argument: arguments[argument]}
+        )
+
+    return parsed_def["FragmentDefinition"] + parsed_def["OperationDefinition"]
+
+
+def validate_document(
+    document: "DocumentNode", query: Union[str, bytes], schema: "GraphQLSchema"
+) -> "DocumentNode":
+    """
+    Validates a DocumentNode built from the libgraphqlparser C AST and
+    returns it along with its validators, as `document_from_ast_json` does
+    for the JSON AST representation.
+    :param document: the DocumentNode to validate
+    :param query: the query from which the document has been parsed
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type document: DocumentNode
+    :type query: Union[str, bytes]
+    :type schema: GraphQLSchema
+    :return: the validated DocumentNode
+    :rtype: DocumentNode
+    """
+    validators = Validators(schema, RULE_SET)
+
+    definitions = _validate_definitions(document.definitions, validators)
+
+    validators.validate(
+        rule="executable-definitions", definitions=definitions, path=None
+    )
+
+    return DocumentNode(
+        definitions=definitions,
+        validators=validators,
+        hash_id=hash(query),
+        location=document.location,
+    )
@@ -47,7 +47,7 @@ def find_field(
     :return: A GraphQLField or None if field is not found
     :rtype: Union[None, GraphQLField]
     """
-    return find_field_by_name(f"{parent_type_name}.{field_name}", schema)
+    return schema.get_field(parent_type_name, field_name)
 
 
 def find_field_reduced_type(
@@ -0,0 +1,15 @@
+from tartiflette.persisted_queries.base import (
+    PersistedQueryStore,
+    compute_query_id,
+    is_valid_query_id,
+)
+from tartiflette.persisted_queries.file import FilePersistedQueryStore
+from tartiflette.persisted_queries.lru import LRUPersistedQueryStore
+
+__all__ = (
+    "compute_query_id",
+    "is_valid_query_id",
+    "FilePersistedQueryStore",
+    "LRUPersistedQueryStore",
+    "PersistedQueryStore",
+)
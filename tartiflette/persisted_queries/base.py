@@ -0,0 +1,76 @@
+import hashlib
+import re
+
+from typing import Optional, Union
+
+__all__ = ("compute_query_id", "is_valid_query_id", "PersistedQueryStore")
+
+_QUERY_ID_REGEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+def compute_query_id(query: Union[str, bytes]) -> str:
+    """
+    Computes the persisted query identifier of a query, which is the
+    hexadecimal SHA-256 digest of its UTF-8 encoded content.
+    :param query: the GraphQL request / query as UTF8-encoded string
+    :type query: Union[str, bytes]
+    :return: the persisted query identifier of the query
+    :rtype: str
+    """
+    if isinstance(query, str):
+        query = query.encode("utf-8")
+    return hashlib.sha256(query).hexdigest()
+
+
+def is_valid_query_id(query_id: str) -> bool:
+    """
+    Determines whether or not the query identifier is a lowercase hexadecimal
+    SHA-256 digest.
+    :param query_id: the persisted query identifier to check
+    :type query_id: str
+    :return: whether or not the query identifier is valid
+    :rtype: bool
+    """
+    return isinstance(query_id, str) and bool(_QUERY_ID_REGEX.match(query_id))
+
+
+class PersistedQueryStore:
+    """
+    Base class of the persisted query stores, which maps a persisted query
+    identifier to its parsed & validated DocumentNode. `get` & `set` are
+    coroutines so that stores can perform I/O (e.g. disk or remote stores).
+    """
+
+    def bake(self, schema: "GraphQLSchema") -> None:
+        """
+        Links the store to the schema of the engine it's used by.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        """
+
+    async def get(self, query_id: str) -> Optional["DocumentNode"]:
+        """
+        Returns the DocumentNode stored under the query identifier if any.
+        :param query_id: the persisted query identifier to look up
+        :type query_id: str
+        :return: the DocumentNode stored under the query identifier if any
+        :rtype: Optional[DocumentNode]
+        """
+        raise NotImplementedError
+
+    async def set(
+        self,
+        query_id: str,
+        query: Union[str, bytes],
+        document: "DocumentNode",
+    ) -> None:
+        """
+        Stores the DocumentNode of a valid query under its identifier.
+        :param query_id: the persisted query identifier of the query
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param document: the parsed & validated DocumentNode of the query
+        :type query_id: str
+        :type query: Union[str, bytes]
+        :type document: DocumentNode
+        """
+        raise NotImplementedError
@@ -0,0 +1,157 @@
+import asyncio
+import os
+
+from tempfile import NamedTemporaryFile
+from typing import Optional, Union
+
+from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.persisted_queries.base import (
+    PersistedQueryStore,
+    compute_query_id,
+)
+from tartiflette.persisted_queries.lru import LRUPersistedQueryStore
+
+__all__ = ("FilePersistedQueryStore",)
+
+
+class FilePersistedQueryStore(PersistedQueryStore):
+    """
+    On-disk persisted query store which writes each query into a
+    `<query_id>.graphql` file of a directory. Documents read back from the
+    disk are parsed & validated once per process and then kept in an
+    in-memory LRU store. Files whose content doesn't match their query
+    identifier are ignored.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        maxsize: Optional[int] = 1024,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        :param directory: path of the directory containing the queries
+        :param maxsize: maximum number of documents to keep in memory
+        (unbounded if `None`)
+        :param encoding: encoding of the query files
+        :type directory: str
+        :type maxsize: Optional[int]
+        :type encoding: str
+        """
+        self._directory = directory
+        self._encoding = encoding
+        self._documents = LRUPersistedQueryStore(maxsize=maxsize)
+        self._schema = None
+
+    def _get_path(self, query_id: str) -> str:
+        """
+        Returns the path of the file containing the query.
+        :param query_id: the persisted query identifier of the query
+        :type query_id: str
+        :return: the path of the file containing the query
+        :rtype: str
+        """
+        return os.path.join(self._directory, f"{query_id}.graphql")
+
+    def bake(self, schema: "GraphQLSchema") -> None:
+        """
+        Links the store to the schema of the engine it's used by in order to
+        be able to parse & validate the queries read from the disk.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        """
+        self._schema = schema
+        os.makedirs(self._directory, exist_ok=True)
+
+    def _read(self, query_id: str) -> Optional[str]:
+        """
+        Reads the query stored under the query identifier if any. Queries
+        whose content doesn't match their identifier (e.g. edited or
+        corrupted files) are ignored.
+        :param query_id: the persisted query identifier to look up
+        :type query_id: str
+        :return: the query stored under the query identifier if any
+        :rtype: Optional[str]
+        """
+        try:
+            with open(
+                self._get_path(query_id), encoding=self._encoding
+            ) as query_file:
+                query = query_file.read()
+        except FileNotFoundError:
+            return None
+
+        return query if compute_query_id(query) == query_id else None
+
+    def _write(self, query_id: str, query: str) -> None:
+        """
+        Writes the query into its file, unless it already exists.
+        :param query_id: the persisted query identifier of the query
+        :param query: the GraphQL request / query
+        :type query_id: str
+        :type query: str
+        """
+        path = self._get_path(query_id)
+        if os.path.exists(path):
+            return
+
+        # Writes into a temporary file first so that concurrent workers
+        # never read a partially written query
+        with NamedTemporaryFile(
+            "w",
+            encoding=self._encoding,
+            dir=self._directory,
+            suffix=".tmp",
+            delete=False,
+        ) as query_file:
+            query_file.write(query)
+        os.replace(query_file.name, path)
+
+    async def get(self, query_id: str) -> Optional["DocumentNode"]:
+        """
+        Returns the DocumentNode stored under the query identifier if any.
+        Files are read in the default executor of the event loop.
+        :param query_id: the persisted query identifier to look up
+        :type query_id: str
+        :return: the DocumentNode stored under the query identifier if any
+        :rtype: Optional[DocumentNode]
+        """
+        document = await self._documents.get(query_id)
+        if document is not None:
+            return document
+
+        query = await asyncio.get_running_loop().run_in_executor(
+            None, self._read, query_id
+        )
+        if query is None:
+            return None
+
+        document, _ = parse_and_validate_query(query, self._schema)
+        if document is not None:
+            await self._documents.set(query_id, query, document)
+        return document
+
+    async def set(
+        self,
+        query_id: str,
+        query: Union[str, bytes],
+        document: "DocumentNode",
+    ) -> None:
+        """
+        Writes the query into its file, in the default executor of the event
+        loop, and stores its DocumentNode in memory.
+        :param query_id: the persisted query identifier of the query
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param document: the parsed & validated DocumentNode of the query
+        :type query_id: str
+        :type query: Union[str, bytes]
+        :type document: DocumentNode
+        """
+        await self._documents.set(query_id, query, document)
+
+        if isinstance(query, bytes):
+            query = query.decode("utf-8")
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, query_id, query
+        )
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Optional, Union
+
+from tartiflette.persisted_queries.base import PersistedQueryStore
+
+__all__ = ("LRUPersistedQueryStore",)
+
+
+class LRUPersistedQueryStore(PersistedQueryStore):
+    """
+    In-memory persisted query store evicting the least recently used
+    documents once `maxsize` is reached.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        """
+        :param maxsize: maximum number of documents to keep (unbounded if
+        `None`, which should be used for allowlists)
+        :type maxsize: Optional[int]
+        """
+        self._maxsize = maxsize
+        self._documents: "OrderedDict[str, DocumentNode]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored documents.
+        :return: the number of stored documents
+        :rtype: int
+        """
+        return len(self._documents)
+
+    async def get(self, query_id: str) -> Optional["DocumentNode"]:
+        """
+        Returns the DocumentNode stored under the query identifier if any.
+        :param query_id: the persisted query identifier to look up
+        :type query_id: str
+        :return: the DocumentNode stored under the query identifier if any
+        :rtype: Optional[DocumentNode]
+        """
+        try:
+            self._documents.move_to_end(query_id)
+        except KeyError:
+            return None
+        return self._documents[query_id]
+
+    async def set(
+        self,
+        query_id: str,
+        query: Union[str, bytes],
+        document: "DocumentNode",
+    ) -> None:
+        """
+        Stores the DocumentNode of a valid query under its identifier.
+        :param query_id: the persisted query identifier of the query
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param document: the parsed & validated DocumentNode of the query
+        :type query_id: str
+        :type query: Union[str, bytes]
+        :type document: DocumentNode
+        """
+        # pylint: disable=unused-argument
+        self._documents[query_id] = document
+        self._documents.move_to_end(query_id)
+        if self._maxsize is not None:
+            while len(self._documents) > self._maxsize:
+                self._documents.popitem(last=False)
@@ -0,0 +1,359 @@
+import asyncio
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tartiflette.coercers.arguments import coerce_arguments
+from tartiflette.coercers.common import Path
+from tartiflette.execution.collect import collect_subfields
+from tartiflette.execution.types import build_resolve_info
+from tartiflette.types.helpers.definition import is_object_type
+from tartiflette.utils.errors import copy_exception
+
+__all__ = (
+    "FieldBatch",
+    "batch_resolver_executor",
+    "reserve_batch_entries",
+    "release_batch_entries",
+)
+
+
+class FieldBatch:
+    """
+    Pending calls of a batch resolver for the same field nodes, accumulated
+    while the sibling parents of the field are being completed, then
+    dispatched in a single call of the resolver by the scheduler of the
+    execution.
+    """
+
+    __slots__ = (
+        "resolver",
+        "key",
+        "execution_context",
+        "entries",
+        "task",
+        "_cancelled",
+    )
+
+    def __init__(
+        self,
+        resolver: Callable,
+        key: Tuple[Any, ...],
+        execution_context: "ExecutionContext",
+    ) -> None:
+        """
+        :param resolver: the batch resolver to call with the list of parents
+        :param key: key of the batch in the pending batches
+        :param execution_context: instance of the query execution context
+        :type resolver: Callable
+        :type key: Tuple[Any, ...]
+        :type execution_context: ExecutionContext
+        """
+        self.resolver = resolver
+        self.key = key
+        self.execution_context = execution_context
+        self.entries: List[
+            Tuple[Any, Dict[str, Any], Optional[Any], "ResolveInfo", Any]
+        ] = []
+        self.task: Optional["asyncio.Task"] = None
+        self._cancelled = 0
+
+    def add(
+        self,
+        parent: Any,
+        args: Dict[str, Any],
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> "asyncio.Future":
+        """
+        Adds a parent to the batch and returns the future of its result.
+        :param parent: field parent value
+        :param args: computed arguments related to the resolved field
+        :param ctx: context passed to the query execution
+        :param info: information related to the execution and the resolved
+        field
+        :type parent: Any
+        :type args: Dict[str, Any]
+        :type ctx: Optional[Any]
+        :type info: ResolveInfo
+        :return: the future of the result related to the parent
+        :rtype: asyncio.Future
+        """
+        scheduler = self.execution_context.batch_scheduler
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(self._on_future_done)
+        if not self.entries:
+            scheduler.schedule(self.flush)
+        self.entries.append((parent, args, ctx, info, future))
+        scheduler.entry_added()
+        return future
+
+    def _on_future_done(self, future: "asyncio.Future") -> None:
+        """
+        Cancels the dispatch once every parent waiting for its result has
+        been cancelled.
+        :param future: the done future of a parent
+        :type future: asyncio.Future
+        """
+        if not future.cancelled():
+            return
+
+        self._cancelled += 1
+        if self.task is not None and self._cancelled == len(self.entries):
+            self.task.cancel()
+
+    def flush(self) -> None:
+        """
+        Closes the batch and dispatches it in a new task, unless every parent
+        waiting for its result has been cancelled.
+        """
+        del self.execution_context.field_batches[self.key]
+        if self._cancelled == len(self.entries):
+            return
+
+        self.task = self.execution_context.batch_scheduler.create_task(
+            self.dispatch()
+        )
+
+    async def dispatch(self) -> None:
+        """
+        Calls the batch resolver once for each distinct set of arguments and
+        sets the result of each parent, ignoring the cancelled parents.
+        """
+        groups: List[Tuple[Dict[str, Any], List[Tuple[Any, ...]]]] = []
+        for entry in self.entries:
+            if entry[4].done():
+                continue
+            for args, group_entries in groups:
+                if args == entry[1]:
+                    group_entries.append(entry)
+                    break
+            else:
+                groups.append((entry[1], [entry]))
+
+        dispatches = asyncio.gather(
+            *[
+                self._dispatch_group(args, group_entries)
+                for args, group_entries in groups
+            ]
+        )
+        self.execution_context.batch_scheduler.spawned()
+        await dispatches
+
+    async def _dispatch_group(
+        self, args: Dict[str, Any], entries: List[Tuple[Any, ...]]
+    ) -> None:
+        """
+        Calls the batch resolver for the parents sharing the same arguments.
+        :param args: computed arguments shared by the parents
+        :param entries: pending entries to resolve
+        :type args: Dict[str, Any]
+        :type entries: List[Tuple[Any, ...]]
+        """
+        _, _, ctx, info, _ = entries[0]
+        try:
+            results = await self.resolver(
+                [entry[0] for entry in entries], args, ctx, info
+            )
+            if not isinstance(results, list) or len(results) != len(entries):
+                raise TypeError(
+                    "Batch resolver of field "
+                    f"< {info.parent_type.name}.{info.field_name} > should "
+                    f"return a list of {len(entries)} results, got "
+                    f"< {results!r} >."
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            # Each parent gets its own error since errors are located by path
+            results = [e] + [copy_exception(e) for _ in entries[1:]]
+
+        for (_, _, _, _, future), result in zip(entries, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def batch_resolver_executor(
+    resolver: Callable,
+    parent: Any,
+    args: Dict[str, Any],
+    ctx: Optional[Any],
+    info: "ResolveInfo",
+    **kwargs,
+) -> Any:
+    """
+    Resolves a field through its batch resolver: the parent is added to the
+    pending batch of the field nodes, which is dispatched with the parents of
+    all its siblings in a single call of the resolver.
+    :param resolver: the batch resolver, called with the list of parents
+    :param parent: field parent value
+    :param args: computed arguments related to the resolved field
+    :param ctx: context passed to the query execution
+    :param info: information related to the execution and the resolved field
+    :type resolver: Callable
+    :type parent: Any
+    :type args: Dict[str, Any]
+    :type ctx: Optional[Any]
+    :type info: ResolveInfo
+    :return: the result related to the parent
+    :rtype: Any
+    """
+    kwargs.pop("context_coercer", None)
+    execution_context = info.execution_context
+    if execution_context is None:
+        results = await resolver([parent], args, ctx, info)
+        return results[0]
+
+    key = (resolver, tuple(map(id, info.field_nodes)))
+    future = execution_context.reserved_batch_entries.pop(
+        (key, info.path.prev), None
+    )
+    if future is None:
+        future = _get_field_batch(execution_context, resolver, key).add(
+            parent, args, ctx, info
+        )
+    return await future
+
+
+def _get_field_batch(
+    execution_context: "ExecutionContext",
+    resolver: Callable,
+    key: Tuple[Any, ...],
+) -> "FieldBatch":
+    """
+    Returns the pending batch of a batch resolver for the field nodes of the
+    key, creating it if there is none.
+    :param execution_context: instance of the query execution context
+    :param resolver: the batch resolver
+    :param key: key of the batch
+    :type execution_context: ExecutionContext
+    :type resolver: Callable
+    :type key: Tuple[Any, ...]
+    :return: the pending batch
+    :rtype: FieldBatch
+    """
+    batch = execution_context.field_batches.get(key)
+    if batch is None:
+        batch = FieldBatch(resolver, key, execution_context)
+        execution_context.field_batches[key] = batch
+    return batch
+
+
+async def reserve_batch_entries(
+    items: List[Any],
+    paths: List["Path"],
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    item_type: "GraphQLOutputType",
+) -> List[Tuple[Tuple[Any, ...], "Path"]]:
+    """
+    Adds the items of a list to the pending batches of their batch fields
+    before they're completed, so that these fields are resolved by a single
+    call of their resolver for all the items, even if the items are
+    completed one after the other. The batch fields then take the result
+    reserved for their item.
+    :param items: the items of the list
+    :param paths: the paths of the items
+    :param info: information related to the execution and the list field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the list field
+    :param item_type: GraphQLType of list items
+    :type items: List[Any]
+    :type paths: List[Path]
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type item_type: GraphQLOutputType
+    :return: the keys of the reserved entries
+    :rtype: List[Tuple[Tuple[Any, ...], Path]]
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    if item_type.is_non_null_type:
+        item_type = item_type.wrapped_type
+    if (
+        not is_object_type(item_type)
+        or not item_type.batch_fields
+        or info.is_introspection
+    ):
+        return []
+
+    parents = [
+        (item, item_path)
+        for item, item_path in zip(items, paths)
+        if item is not None and not isinstance(item, Exception)
+    ]
+    if not parents:
+        return []
+
+    reserved = []
+    subfields = await collect_subfields(
+        execution_context, item_type, field_nodes
+    )
+    for entry_key, subfield_nodes in subfields.items():
+        field_definition = item_type.batch_fields.get(
+            subfield_nodes[0].name.value
+        )
+        if field_definition is None or any(
+            subfield_node.directives for subfield_node in subfield_nodes
+        ):
+            continue
+
+        try:
+            args = await coerce_arguments(
+                field_definition.arguments,
+                subfield_nodes[0],
+                execution_context.variable_values,
+                execution_context.context,
+                coercer=field_definition.arguments_coercer,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Reported by the resolution of each item
+            continue
+
+        resolver = field_definition.batch_resolver
+        key = (resolver, tuple(map(id, subfield_nodes)))
+        batch = _get_field_batch(execution_context, resolver, key)
+        subfield_info = build_resolve_info(
+            execution_context,
+            field_definition,
+            subfield_nodes,
+            item_type,
+            Path(parents[0][1], entry_key),
+        )
+        for parent, item_path in parents:
+            execution_context.reserved_batch_entries[
+                (key, item_path)
+            ] = batch.add(
+                parent, args, execution_context.context, subfield_info
+            )
+            reserved.append((key, item_path))
+    return reserved
+
+
+def release_batch_entries(
+    execution_context: "ExecutionContext",
+    reserved: List[Tuple[Tuple[Any, ...], "Path"]],
+) -> None:
+    """
+    Cancels the entries reserved for the items of a list which haven't been
+    taken by their field, e.g. because the completion of their item failed
+    before.
+    :param execution_context: instance of the query execution context
+    :param reserved: the keys of the reserved entries
+    :type execution_context: ExecutionContext
+    :type reserved: List[Tuple[Tuple[Any, ...], Path]]
+    """
+    for reserved_key in reserved:
+        future = execution_context.reserved_batch_entries.pop(
+            reserved_key, None
+        )
+        if future is None:
+            continue
+        if future.done() and not future.cancelled():
+            # Marks the error of the unused result as retrieved
+            future.exception()
+        future.cancel()
@@ -1,8 +1,22 @@
 import asyncio
 
-from typing import Any, Coroutine, Dict, List, Optional, Union
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from tartiflette.utils.tasks import gather_results
 
 __all__ = (
+    "SOURCE_SHAPES",
+    "compile_default_field_resolver",
     "default_field_resolver",
     "default_type_resolver",
     "gather_arguments_coercer",
@@ -43,6 +57,56 @@ async def default_field_resolver(
     return None
 
 
+SOURCE_SHAPES = ("mapping", "object", "dataclass")
+
+
+def compile_default_field_resolver(
+    field_name: str, source_shape: Union[str, Sequence[str]]
+) -> Optional[Callable]:
+    """
+    Compiles the default resolver of a field from the shape of its parent
+    values into a synchronous getter. The shape can be "mapping" (values are
+    read by key), "object" or "dataclass" (values are read by attribute) or
+    the sequence of the field names of tuple values (values are read by
+    index).
+    :param field_name: name of the field to resolve
+    :param source_shape: shape of the parent values of the field
+    :type field_name: str
+    :type source_shape: Union[str, Sequence[str]]
+    :return: the compiled resolver or None if the field isn't part of the
+    shape (the compiled resolver returns None for the parent values which
+    don't match the shape, like the default resolver does)
+    :rtype: Optional[Callable]
+    """
+    if source_shape == "mapping":
+        getter = itemgetter(field_name)
+        # TypeError is raised by parent values which aren't mappings
+        missing_errors = (KeyError, TypeError)
+    elif source_shape in ("object", "dataclass"):
+        getter = attrgetter(field_name)
+        missing_errors = AttributeError
+    else:
+        try:
+            getter = itemgetter(list(source_shape).index(field_name))
+        except ValueError:
+            return None
+        missing_errors = (IndexError, KeyError, TypeError)
+
+    def compiled_field_resolver(
+        parent: Any,
+        args: Dict[str, Any],
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> Any:
+        # pylint: disable=unused-argument
+        try:
+            return getter(parent)
+        except missing_errors:
+            return None
+
+    return compiled_field_resolver
+
+
 def default_type_resolver(
     result: Any,
     ctx: Optional[Any],
@@ -87,7 +151,10 @@ async def gather_arguments_coercer(
     :return: the result of coroutines
     :rtype: List[Union[Any, Exception]]
     """
-    return await asyncio.gather(*coroutines, return_exceptions=True)
+    if len(coroutines) == 1:
+        # A single argument is coerced without spawning a task
+        return await sync_arguments_coercer(*coroutines)
+    return await gather_results(coroutines)
 
 
 async def sync_arguments_coercer(
@@ -105,6 +172,8 @@ async def sync_arguments_coercer(
     for coroutine in coroutines:
         try:
             result = await coroutine
+        except asyncio.CancelledError:
+            raise
         except Exception as e:  # pylint: disable=broad-except
             result = e
         results.append(result)
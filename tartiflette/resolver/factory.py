@@ -1,7 +1,13 @@
-from typing import Any, Callable, List, Union
+import asyncio
+
+from functools import partial
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, List, Optional, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
 from tartiflette.coercers.outputs.common import complete_value_catching_error
+from tartiflette.execution.deadline import call_until, check_deadline
+from tartiflette.execution.limiter import run_limited
 from tartiflette.execution.types import build_resolve_info
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
@@ -13,6 +19,88 @@ from tartiflette.utils.directives import (
 
 __all__ = ("resolve_field",)
 
+_DEADLINE_MESSAGE = "Execution deadline exceeded."
+
+
+def wraps_field_resolver_with_directives(
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    resolver: Callable,
+) -> Callable:
+    """
+    Wraps the resolver of a field with the directives of its field nodes.
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param resolver: callable to use to resolve the field
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type resolver: Callable
+    :return: the wrapped resolver
+    :rtype: Callable
+    """
+    computed_directives = []
+    for field_node in field_nodes:
+        computed_directives.extend(
+            compute_directive_nodes(
+                execution_context.schema,
+                field_node.directives,
+                execution_context.variable_values,
+            )
+        )
+
+    if not computed_directives:
+        return resolver
+
+    return wraps_with_directives(
+        directives_definition=computed_directives,
+        directive_hook="on_field_execution",
+        func=resolver,
+        is_resolver=True,
+        with_default=True,
+    )
+
+
+def _call_resolver(
+    execution_context: "ExecutionContext",
+    func: Callable[..., Awaitable[Any]],
+    *args,
+    **kwargs,
+) -> Awaitable[Any]:
+    """
+    Calls the resolver of a field, which is cancelled once the deadline of
+    the execution has expired.
+    :param execution_context: instance of the query execution context
+    :param func: the callable calling the resolver
+    :param args: positional arguments of the call
+    :param kwargs: keyword arguments of the call
+    :type execution_context: ExecutionContext
+    :type func: Callable[..., Awaitable[Any]]
+    :return: the awaitable of the resolved value
+    :rtype: Awaitable[Any]
+    """
+    deadline = execution_context.options.deadline
+    if deadline is None:
+        return func(*args, **kwargs)
+    return call_until(
+        deadline,
+        _DEADLINE_MESSAGE,
+        func,
+        *args,
+        on_spawn=execution_context.batch_scheduler.spawned,
+        **kwargs,
+    )
+
+
+async def _await_result(result: Awaitable[Any]) -> Any:
+    """
+    Awaits the awaitable returned by a synchronous resolver.
+    :param result: the awaitable returned by the resolver
+    :type result: Awaitable[Any]
+    :return: the resolved value
+    :rtype: Any
+    """
+    return await result
+
 
 async def resolve_field_value_or_error(
     execution_context: "ExecutionContext",
@@ -41,38 +129,71 @@ async def resolve_field_value_or_error(
     """
     # pylint: disable=too-many-locals
     try:
-        computed_directives = []
-        for field_node in field_nodes:
-            computed_directives.extend(
-                compute_directive_nodes(
-                    execution_context.schema,
-                    field_node.directives,
+        if any(field_node.directives for field_node in field_nodes):
+            wrap_resolver = partial(
+                wraps_field_resolver_with_directives,
+                execution_context,
+                field_nodes,
+                resolver,
+            )
+            resolver = (
+                execution_context.execution_plan.get_field_resolver(
+                    field_nodes,
+                    resolver,
                     execution_context.variable_values,
+                    wrap_resolver,
                 )
+                if execution_context.execution_plan is not None
+                else wrap_resolver()
             )
 
-        if computed_directives:
-            resolver = wraps_with_directives(
-                directives_definition=computed_directives,
-                directive_hook="on_field_execution",
-                func=resolver,
-                is_resolver=True,
-                with_default=True,
-            )
-
-        result = await resolver(
-            source,
-            await coerce_arguments(
-                field_definition.arguments,
-                field_nodes[0],
-                execution_context.variable_values,
-                execution_context.context,
-                coercer=field_definition.arguments_coercer,
-            ),
+        args = await coerce_arguments(
+            field_definition.arguments,
+            field_nodes[0],
+            execution_context.variable_values,
             execution_context.context,
-            info,
-            context_coercer=execution_context.context,
+            coercer=field_definition.arguments_coercer,
         )
+        if resolver is field_definition.sync_resolver:
+            # Synchronous resolvers which aren't wrapped by any directive are
+            # called inline
+            check_deadline(
+                execution_context.options.deadline, _DEADLINE_MESSAGE
+            )
+            result = resolver(source, args, execution_context.context, info)
+            if isawaitable(result):
+                # Synchronous callables can still return awaitables (e.g. a
+                # lambda calling a coroutine function)
+                result = await _call_resolver(
+                    execution_context, _await_result, result
+                )
+        elif (
+            execution_context.options.resolver_limiters
+            and field_definition.is_limited
+        ):
+            # Only the call of the resolver takes a slot, so that the fields
+            # of its result can't wait for a slot held by their parent
+            result = await _call_resolver(
+                execution_context,
+                run_limited,
+                execution_context.options.resolver_limiters,
+                resolver,
+                source,
+                args,
+                execution_context.context,
+                info,
+                context_coercer=execution_context.context,
+            )
+        else:
+            result = await _call_resolver(
+                execution_context,
+                resolver,
+                source,
+                args,
+                execution_context.context,
+                info,
+                context_coercer=execution_context.context,
+            )
         if info.is_introspection:
             return await introspection_directives_executor(
                 result,
@@ -81,6 +202,10 @@ async def resolve_field_value_or_error(
                 context_coercer=execution_context.context,
             )
         return result
+    except asyncio.CancelledError:
+        # Cancellations aren't field errors, even under Python 3.7 where
+        # they're Exception instances
+        raise
     except Exception as e:  # pylint: disable=broad-except
         return e
 
@@ -95,6 +220,7 @@ async def resolve_field(
     field_definition: "GraphQLField",
     resolver: Callable,
     output_coercer: Callable,
+    instrumentation: Optional["Instrumentation"] = None,
 ) -> Any:
     """
     Resolves the field value and coerce it before returning it.
@@ -108,6 +234,8 @@ async def resolve_field(
     :param output_coercer: callable to use to coerce the resolved field value
     :param is_introspection_context: determines whether or not the resolved
     field is in a context of an introspection query
+    :param instrumentation: dispatcher of the events of the field to the
+    instruments of the engine, if they observe fields
     :type execution_context: ExecutionContext
     :type parent_type: GraphQLObjectType
     :type source: Any
@@ -117,10 +245,42 @@ async def resolve_field(
     :type resolver: Callable
     :type output_coercer: Callable
     :type is_introspection_context: bool
+    :type instrumentation: Optional[Instrumentation]
     :return: the coerced resolved field value
     :rtype: Any
     """
     # pylint: disable=too-many-arguments
+    if execution_context.options.cache_policy is not None:
+        execution_context.options.cache_policy.add_field_hint(
+            field_definition, path.prev is None
+        )
+
+    if (
+        field_definition.inline_resolver is not None
+        and execution_context.options.tracer is None
+        and instrumentation is None
+        and not is_introspection_context
+        and not any(field_node.directives for field_node in field_nodes)
+    ):
+        # Leaf fields resolved by a compiled getter don't need any ResolveInfo
+        # unless they fail, in which case they're resolved again below in
+        # order to report the error. Traced & instrumented executions report
+        # them like any other field
+        try:
+            return await output_coercer(
+                field_definition.inline_resolver(
+                    source, {}, execution_context.context, None
+                ),
+                None,
+                execution_context,
+                field_nodes,
+                path,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            pass
+
     info = build_resolve_info(
         execution_context,
         field_definition,
@@ -130,15 +290,44 @@ async def resolve_field(
         is_introspection_context,
     )
 
-    return await complete_value_catching_error(
-        await resolve_field_value_or_error(
+    tracer = execution_context.options.tracer
+    if tracer is not None:
+        start = tracer.now()
+    if instrumentation is not None:
+        instrumentation.on_resolve_field_start(info)
+    result = await resolve_field_value_or_error(
+        execution_context,
+        field_definition,
+        field_nodes,
+        resolver,
+        source,
+        info,
+    )
+    if tracer is not None:
+        tracer.add_resolver(
+            path,
+            parent_type.name,
+            field_definition.name,
+            field_definition.graphql_type,
+            start,
+            tracer.now(),
+        )
+
+    if instrumentation is None:
+        return await complete_value_catching_error(
+            result,
+            info,
             execution_context,
-            field_definition,
             field_nodes,
-            resolver,
-            source,
-            info,
-        ),
+            path,
+            field_definition.graphql_type,
+            output_coercer,
+        )
+
+    instrumentation.on_resolve_field_end(info, result)
+    instrumentation.on_coerce_start(info, result)
+    value = await complete_value_catching_error(
+        result,
         info,
         execution_context,
         field_nodes,
@@ -146,3 +335,5 @@ async def resolve_field(
         field_definition.graphql_type,
         output_coercer,
     )
+    instrumentation.on_coerce_end(info, value)
+    return value
@@ -2,6 +2,7 @@ from typing import Callable, Optional
 
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
+    ImproperlyConfigured,
     MissingImplementation,
     NonAwaitableResolver,
     NonCallable,
@@ -30,6 +31,13 @@ class Resolver:
         async def field_resolver(parent, args, ctx, info):
             # do your stuff
             return 42
+
+    Synchronous resolvers are also accepted and called inline, without the
+    cost of a coroutine, when no directive wraps the field execution:
+
+        @Resolver("SomeObject.field")
+        def field_resolver(parent, args, ctx, info):
+            return parent["field"]
     """
 
     def __init__(
@@ -40,6 +48,8 @@ class Resolver:
         arguments_coercer: Optional[Callable] = None,
         list_concurrently: Optional[bool] = None,
         parent_concurrently: Optional[bool] = True,
+        list_max_concurrency: Optional[int] = None,
+        batch: bool = False,
     ) -> None:
         """
         :param name: name of the field to wrap
@@ -51,13 +61,25 @@ class Resolver:
         concurrently
         :param parent_concurrently: whether or not field will be coerced
         concurrently
+        :param list_max_concurrency: maximum number of items of the list
+        completed concurrently
+        :param batch: whether or not the resolver is called once with the
+        list of the parents of sibling fields instead of once per parent
         :type name: str
         :type schema_name: str
         :type type_resolver: Optional[Callable]
         :type arguments_coercer: Optional[Callable]
         :type list_concurrently: Optional[bool]
         :type parent_concurrently: Optional[bool]
+        :type list_max_concurrency: Optional[int]
+        :type batch: bool
         """
+        if list_max_concurrency is not None and list_max_concurrency < 1:
+            raise ImproperlyConfigured(
+                f"Given < list_max_concurrency > of < {name} > should be a "
+                f"positive integer, got < {list_max_concurrency} >."
+            )
+
         self.name = name
         self._type_resolver = type_resolver
         self._implementation = None
@@ -65,6 +87,8 @@ class Resolver:
         self._arguments_coercer = arguments_coercer
         self._list_concurrently = list_concurrently
         self._parent_concurrently = parent_concurrently
+        self._list_max_concurrency = list_max_concurrency
+        self._batch = batch
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -82,7 +106,9 @@ class Resolver:
             field.raw_resolver = self._implementation
             field.query_arguments_coercer = self._arguments_coercer
             field.query_list_concurrently = self._list_concurrently
+            field.query_list_max_concurrency = self._list_max_concurrency
             field.query_parent_concurrently = self._parent_concurrently
+            field.batch = self._batch
 
             field_wrapped_type = get_wrapped_type(
                 get_graphql_type(schema, field.gql_type)
@@ -104,9 +130,15 @@ class Resolver:
         :return: the implementation of the resolver
         :rtype: Callable
         """
-        if not is_valid_coroutine(implementation):
+        if not callable(implementation):
+            raise NonCallable(
+                f"The resolver `{repr(implementation)}` given is not callable."
+            )
+
+        if self._batch and not is_valid_coroutine(implementation):
             raise NonAwaitableResolver(
-                f"The resolver `{repr(implementation)}` given is not awaitable."
+                f"The batch resolver `{repr(implementation)}` given is not "
+                "awaitable."
             )
 
         if self._type_resolver is not None and not callable(
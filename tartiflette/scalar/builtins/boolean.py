@@ -1,5 +1,5 @@
 from math import isfinite
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
@@ -32,6 +32,28 @@ class ScalarBoolean:
             f"Boolean cannot represent a non boolean value: < {value} >."
         )
 
+    def coerce_output_many(
+        self, values: Union[List[Any], memoryview]
+    ) -> List[Optional[bool]]:
+        """
+        Coerce a list of resolved values for output, without calling
+        `coerce_output` for the values which are already valid.
+        :param values: values to coerce
+        :type values: Union[List[Any], memoryview]
+        :return: the coerced values
+        :rtype: List[Optional[bool]]
+        """
+        if isinstance(values, memoryview) and values.format == "?":
+            return values.tolist()
+
+        coerce_output = self.coerce_output
+        return [
+            value
+            if value is None or value.__class__ is bool
+            else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> bool:
         """
         Coerce the user input from variable value.
@@ -1,10 +1,13 @@
 from math import isfinite
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import FloatValueNode, IntValueNode
 
+_FLOAT_FORMATS = frozenset("fd")
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+
 
 class ScalarFloat:
     """
@@ -36,6 +39,33 @@ class ScalarFloat:
             f"Float cannot represent non numeric value: < {value} >."
         )
 
+    def coerce_output_many(
+        self, values: Union[List[Any], memoryview]
+    ) -> List[Optional[float]]:
+        """
+        Coerce a list of resolved values for output, without calling
+        `coerce_output` for the values which are already valid.
+        :param values: values to coerce
+        :type values: Union[List[Any], memoryview]
+        :return: the coerced values
+        :rtype: List[Optional[float]]
+        """
+        if isinstance(values, memoryview):
+            # Buffers of numbers are converted at once
+            if values.format in _FLOAT_FORMATS:
+                if all(map(isfinite, values)):
+                    return values.tolist()
+            elif values.format in _INTEGER_FORMATS:
+                return list(map(float, values))
+
+        coerce_output = self.coerce_output
+        return [
+            value
+            if value is None or (value.__class__ is float and isfinite(value))
+            else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> float:
         """
         Coerce the user input from variable value.
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
@@ -7,6 +7,7 @@ from tartiflette.utils.values import is_integer
 
 _MIN_INT = -2_147_483_648
 _MAX_INT = 2_147_483_647
+_INT_FORMATS = frozenset("bBhHiIlLqQnN")
 
 
 class ScalarInt:
@@ -48,6 +49,37 @@ class ScalarInt:
             )
         return result
 
+    def coerce_output_many(
+        self, values: Union[List[Any], memoryview]
+    ) -> List[Optional[int]]:
+        """
+        Coerce a list of resolved values for output, without calling
+        `coerce_output` for the values which are already valid.
+        :param values: values to coerce
+        :type values: Union[List[Any], memoryview]
+        :return: the coerced values
+        :rtype: List[Optional[int]]
+        """
+        if isinstance(values, memoryview) and values.format in _INT_FORMATS:
+            # Buffers of integers are converted at once, once their bounds
+            # are checked if their items can exceed 32 bits
+            if (
+                values.itemsize < 4
+                or (values.itemsize == 4 and values.format.islower())
+                or not values
+                or (min(values) >= _MIN_INT and max(values) <= _MAX_INT)
+            ):
+                return values.tolist()
+
+        coerce_output = self.coerce_output
+        return [
+            value
+            if value is None
+            or (value.__class__ is int and _MIN_INT <= value <= _MAX_INT)
+            else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> int:
         """
         Coerce the user input from variable value.
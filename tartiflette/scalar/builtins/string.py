@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
@@ -32,6 +32,23 @@ class ScalarString:
             pass
         raise TypeError(f"String cannot represent value: < {value} >.")
 
+    def coerce_output_many(self, values: List[Any]) -> List[Optional[str]]:
+        """
+        Coerce a list of resolved values for output, without calling
+        `coerce_output` for the values which are already valid.
+        :param values: values to coerce
+        :type values: List[Any]
+        :return: the coerced values
+        :rtype: List[Optional[str]]
+        """
+        coerce_output = self.coerce_output
+        return [
+            value
+            if value is None or value.__class__ is str
+            else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> str:
         """
         Coerce the user input from variable value.
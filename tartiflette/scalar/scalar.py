@@ -67,6 +67,9 @@ class Scalar:
             )
 
         scalar.coerce_output = self._implementation.coerce_output
+        scalar.coerce_output_many = getattr(
+            self._implementation, "coerce_output_many", None
+        )
         scalar.coerce_input = self._implementation.coerce_input
         scalar.parse_literal = self._implementation.parse_literal
 
@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Sequence, Union
 
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.schema.transformer import schema_from_sdl
@@ -35,6 +35,9 @@ class SchemaBakery:
         custom_default_arguments_coercer: Optional[Callable] = None,
         coerce_list_concurrently: Optional[bool] = None,
         coerce_parent_concurrently: Optional[bool] = None,
+        source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        list_max_concurrency: Optional[int] = None,
+        instrumentation: Optional["Instrumentation"] = None,
     ) -> "GraphQLSchema":
         """
         Bakes and returns a GraphQLSchema instance.
@@ -50,12 +53,21 @@ class SchemaBakery:
         concurrently
         :param coerce_parent_concurrently: whether or not field will be coerced
         concurrently
+        :param source_shapes: shapes of the values resolved for each object
+        type
+        :param list_max_concurrency: maximum number of items of a list
+        completed concurrently
+        :param instrumentation: dispatcher of the events of the executions
+        to the instruments of the engine
         :type schema_name: str
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type coerce_list_concurrently: Optional[bool]
         :type coerce_parent_concurrently: Optional[bool]
+        :type source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]]
+        :type list_max_concurrency: Optional[int]
+        :type instrumentation: Optional[Instrumentation]
         :return: a baked GraphQLSchema instance
         :rtype: GraphQLSchema
         """
@@ -66,5 +78,8 @@ class SchemaBakery:
             custom_default_arguments_coercer,
             coerce_list_concurrently,
             coerce_parent_concurrently,
+            source_shapes,
+            list_max_concurrency,
+            instrumentation,
         )
         return schema
@@ -1,6 +1,7 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from tartiflette.resolver.default import (
+    SOURCE_SHAPES,
     default_type_resolver,
     gather_arguments_coercer,
 )
@@ -181,6 +182,9 @@ class GraphQLSchema:
         self.default_arguments_coercer: Optional[Callable] = None
         self.coerce_list_concurrently: Optional[bool] = None
         self.coerce_parent_concurrently: Optional[bool] = None
+        self.source_shapes: Dict[str, Union[str, Sequence[str]]] = {}
+        self.list_max_concurrency: Optional[int] = None
+        self.instrumentation: Optional["Instrumentation"] = None
 
         # Operation type names
         self.query_operation_name: str = _DEFAULT_QUERY_OPERATION_NAME
@@ -221,6 +225,7 @@ class GraphQLSchema:
         self.extensions: List["GraphQLExtension"] = []
         self._schema_directives: List["DirectiveNode"] = []
         self._json_loader = None
+        self.query_parser_mode: str = "ast"
         self.is_introspectable = True
 
     @property
@@ -432,12 +437,30 @@ class GraphQLSchema:
                 f"`{name}`."
             )
 
-        try:
-            return self.type_definitions[parent_name].find_field(field_name)
-        except (AttributeError, KeyError):
+        field = self.get_field(parent_name, field_name)
+        if field is None:
             raise UnknownSchemaFieldResolver(
                 f"field `{name}` was not found in GraphQL schema."
             )
+        return field
+
+    def get_field(
+        self, parent_name: str, field_name: str
+    ) -> Optional["GraphQLField"]:
+        """
+        Returns the field corresponding to the parent type name and field
+        name if any.
+        :param parent_name: name of the type defining the field
+        :param field_name: name of the field to return
+        :type parent_name: str
+        :type field_name: str
+        :return: the field corresponding to the names if any
+        :rtype: Optional[GraphQLField]
+        """
+        try:
+            return self.type_definitions[parent_name].get_field(field_name)
+        except (AttributeError, KeyError):
+            return None
 
     def _inject_introspection_fields(self) -> None:
         """
@@ -622,6 +645,38 @@ class GraphQLSchema:
                 errors.append(f"Type < {type_name} > has no fields.")
         return errors
 
+    def _validate_source_shapes(self) -> List[str]:
+        """
+        Validates that source shapes are defined for existing object types
+        and are either a known shape or a sequence of fields of the type.
+        :return: a list of errors
+        :rtype: List[str]
+        """
+        errors = []
+        for type_name, source_shape in self.source_shapes.items():
+            gql_type = self.type_definitions.get(type_name)
+            if not isinstance(gql_type, GraphQLObjectType):
+                errors.append(
+                    f"Source shape defined for < {type_name} > which isn't "
+                    "an object type."
+                )
+            elif isinstance(source_shape, str):
+                if source_shape not in SOURCE_SHAPES:
+                    errors.append(
+                        f"Source shape < {source_shape} > of type "
+                        f"< {type_name} > should be one of "
+                        f"{', '.join(SOURCE_SHAPES)} or a sequence of field "
+                        "names."
+                    )
+            else:
+                for field_name in source_shape:
+                    if field_name not in gql_type.implemented_fields:
+                        errors.append(
+                            f"Source shape of type < {type_name} > refers "
+                            f"to the unknown field < {field_name} >."
+                        )
+        return errors
+
     def _validate_union_is_acceptable(self) -> List[str]:
         """
         Validates that union types are valid.
@@ -1009,6 +1064,7 @@ class GraphQLSchema:
             self._validate_arguments_have_valid_type,
             self._validate_input_type_composed_of_input_type,
             self._validate_directive_implementation,
+            self._validate_source_shapes,
             # TODO: Validate Field: default value must be of given type
             # TODO: Check all objects have resolvers (at least in parent)
         ]
@@ -1120,6 +1176,9 @@ class GraphQLSchema:
         custom_default_arguments_coercer: Optional[Callable] = None,
         coerce_list_concurrently: Optional[bool] = None,
         coerce_parent_concurrently: Optional[bool] = None,
+        source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        list_max_concurrency: Optional[int] = None,
+        instrumentation: Optional["Instrumentation"] = None,
     ) -> None:
         """
         Bake the final schema (it should not change after this) used for
@@ -1135,11 +1194,20 @@ class GraphQLSchema:
         concurrently
         :param coerce_parent_concurrently: whether or not field will be coerced
         concurrently
+        :param source_shapes: shapes of the values resolved for each object
+        type
+        :param list_max_concurrency: maximum number of items of a list
+        completed concurrently
+        :param instrumentation: dispatcher of the events of the executions
+        to the instruments of the engine
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type coerce_list_concurrently: Optional[bool]
         :type coerce_parent_concurrently: Optional[bool]
+        :type source_shapes: Optional[Dict[str, Union[str, Sequence[str]]]]
+        :type list_max_concurrency: Optional[int]
+        :type instrumentation: Optional[Instrumentation]
         """
         self.default_type_resolver = (
             custom_default_type_resolver or default_type_resolver
@@ -1157,6 +1225,9 @@ class GraphQLSchema:
             if coerce_parent_concurrently is not None
             else True
         )
+        self.source_shapes = source_shapes or {}
+        self.list_max_concurrency = list_max_concurrency
+        self.instrumentation = instrumentation
         self._inject_introspection_fields()
 
         self._validate_extensions()  # Validate this before bake
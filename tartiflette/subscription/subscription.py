@@ -2,6 +2,7 @@ from typing import Callable, Optional
 
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
+    ImproperlyConfigured,
     MissingImplementation,
     NonAsyncGeneratorSubscription,
     NotSubscriptionField,
@@ -42,6 +43,7 @@ class Subscription:
         arguments_coercer: Optional[Callable] = None,
         list_concurrently: Optional[bool] = None,
         parent_concurrently: Optional[bool] = True,
+        list_max_concurrency: Optional[int] = None,
     ) -> None:
         """
         :param name: name of the subscription field
@@ -51,18 +53,28 @@ class Subscription:
         concurrently
         :param parent_concurrently: whether or not field will be coerced
         concurrently
+        :param list_max_concurrency: maximum number of items of the list
+        completed concurrently
         :type name: str
         :type schema_name: str
         :type arguments_coercer: Optional[Callable]
         :type list_concurrently: Optional[bool]
         :type parent_concurrently: Optional[bool]
+        :type list_max_concurrency: Optional[int]
         """
+        if list_max_concurrency is not None and list_max_concurrency < 1:
+            raise ImproperlyConfigured(
+                f"Given < list_max_concurrency > of < {name} > should be a "
+                f"positive integer, got < {list_max_concurrency} >."
+            )
+
         self.name = name
         self._implementation = None
         self._schema_name = schema_name
         self._arguments_coercer = arguments_coercer
         self._list_concurrently = list_concurrently
         self._parent_concurrently = parent_concurrently
+        self._list_max_concurrency = list_max_concurrency
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -92,6 +104,7 @@ class Subscription:
         field.subscribe = self._implementation
         field.subscription_arguments_coercer = self._arguments_coercer
         field.subscription_list_concurrently = self._list_concurrently
+        field.subscription_list_max_concurrency = self._list_max_concurrency
         field.subscription__parent_concurrently = self._parent_concurrently
 
     def __call__(self, implementation: Callable) -> Callable:
@@ -0,0 +1,3 @@
+from tartiflette.tracing.tracer import ExecutionTracer, Tracing
+
+__all__ = ("ExecutionTracer", "Tracing")
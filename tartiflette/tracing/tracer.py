@@ -0,0 +1,246 @@
+import logging
+import random
+
+from array import array
+from datetime import datetime, timezone
+from inspect import isawaitable
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__ = ("ExecutionTracer", "Tracing")
+
+logger = logging.getLogger(__name__)
+
+
+def _format_time(timestamp_ns: int) -> str:
+    """
+    Formats a wall clock timestamp as an RFC 3339 date time.
+    :param timestamp_ns: the number of nanoseconds since the epoch
+    :type timestamp_ns: int
+    :return: the formatted date time
+    :rtype: str
+    """
+    return (
+        datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+        .isoformat(timespec="milliseconds")
+        .replace("+00:00", "Z")
+    )
+
+
+class ExecutionTracer:
+    """
+    Records the timings of the phases of an execution & of the resolvers it
+    calls, with a monotonic nanosecond clock. The resolver timings are
+    written into buffers preallocated for the request, which are only grown
+    if the execution calls more resolvers than their capacity, and are
+    formatted once the trace is built.
+    """
+
+    __slots__ = (
+        "start_time",
+        "start",
+        "end",
+        "parsing",
+        "execution",
+        "_count",
+        "_capacity",
+        "_clocks",
+        "_fields",
+    )
+
+    def __init__(self, capacity: int = 256) -> None:
+        """
+        :param capacity: number of resolver calls the buffers are
+        preallocated for
+        :type capacity: int
+        """
+        self.start_time = time_ns()
+        self.start = perf_counter_ns()
+        self.end: Optional[int] = None
+        self.parsing: Optional[Tuple[int, int]] = None
+        self.execution: Optional[Tuple[int, int]] = None
+        self._count = 0
+        self._capacity = capacity
+        # Start & end clock values of each resolver call
+        self._clocks = array("q", bytes(16 * capacity))
+        # Path, parent type name, field name & return type of each call
+        self._fields: List[Any] = [None] * (4 * capacity)
+
+    now = staticmethod(perf_counter_ns)
+
+    def _grow(self) -> None:
+        """
+        Doubles the capacity of the buffers.
+        """
+        self._clocks.frombytes(bytes(16 * self._capacity))
+        self._fields.extend([None] * (4 * self._capacity))
+        self._capacity *= 2
+
+    def add_resolver(
+        self,
+        path: "Path",
+        parent_type_name: str,
+        field_name: str,
+        return_type: Any,
+        start: int,
+        end: int,
+    ) -> None:
+        """
+        Records the call of a resolver.
+        :param path: the path of the resolved field
+        :param parent_type_name: name of the parent type of the field
+        :param field_name: name of the resolved field
+        :param return_type: GraphQL type of the resolved field
+        :param start: clock value when the resolver was called
+        :param end: clock value when the resolver returned
+        :type path: Path
+        :type parent_type_name: str
+        :type field_name: str
+        :type return_type: Any
+        :type start: int
+        :type end: int
+        """
+        # pylint: disable=too-many-arguments
+        index = self._count
+        if index == self._capacity:
+            self._grow()
+        self._count = index + 1
+
+        self._clocks[2 * index] = start
+        self._clocks[2 * index + 1] = end
+        offset = 4 * index
+        self._fields[offset : offset + 4] = (
+            path,
+            parent_type_name,
+            field_name,
+            return_type,
+        )
+
+    def _timing(self, start: int, end: int) -> Dict[str, int]:
+        """
+        Returns the offset & duration of a timing, in nanoseconds.
+        :param start: clock value at the start of the timing
+        :param end: clock value at the end of the timing
+        :type start: int
+        :type end: int
+        :return: the offset from the start of the trace & the duration
+        :rtype: Dict[str, int]
+        """
+        return {"startOffset": start - self.start, "duration": end - start}
+
+    def _resolver_timings(self) -> List[Dict[str, Any]]:
+        """
+        Returns the timings of the recorded resolver calls.
+        :return: the timings of the resolver calls
+        :rtype: List[Dict[str, Any]]
+        """
+        clocks = self._clocks
+        fields = self._fields
+        return [
+            {
+                "path": fields[4 * index].as_list(),
+                "parentType": fields[4 * index + 1],
+                "fieldName": fields[4 * index + 2],
+                "returnType": str(fields[4 * index + 3]),
+                **self._timing(clocks[2 * index], clocks[2 * index + 1]),
+            }
+            for index in range(self._count)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the trace in the Apollo tracing format. Documents are
+        validated while they're parsed, so the validation is accounted in
+        the parsing timing and the trace has no validation timing.
+        :return: the trace of the execution
+        :rtype: Dict[str, Any]
+        """
+        end = self.end if self.end is not None else self.now()
+        parsing_start, parsing_end = self.parsing or (self.start, self.start)
+        execution = {}
+        execution_timing: Optional[Tuple[int, int]] = self.execution
+        if execution_timing is not None:
+            execution_start, execution_end = execution_timing
+            execution = self._timing(execution_start, execution_end)
+        execution["resolvers"] = self._resolver_timings()
+        return {
+            "version": 1,
+            "startTime": _format_time(self.start_time),
+            "endTime": _format_time(self.start_time + end - self.start),
+            "duration": end - self.start,
+            "parsing": self._timing(parsing_start, parsing_end),
+            "execution": execution,
+        }
+
+
+class Tracing:
+    """
+    Traces a sample of the executions of query & mutation operations. The
+    traces are added under the `tracing` extension of the responses or sent
+    to a sink.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        sink: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        buffer_size: int = 256,
+    ) -> None:
+        """
+        :param sample_rate: proportion of the executions which are traced,
+        between 0 and 1
+        :param sink: callable, synchronous or asynchronous, receiving the
+        traces instead of the responses
+        :param buffer_size: number of resolver calls the buffers of a traced
+        execution are preallocated for
+        :type sample_rate: float
+        :type sink: Optional[Callable[[Dict[str, Any]], Any]]
+        :type buffer_size: int
+        """
+        self.sample_rate = sample_rate
+        self.sink = sink
+        self.buffer_size = buffer_size
+
+    def create_tracer(self) -> Optional["ExecutionTracer"]:
+        """
+        Creates the tracer of an execution, if it's sampled.
+        :return: a new tracer or None if the execution isn't traced
+        :rtype: Optional[ExecutionTracer]
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return ExecutionTracer(self.buffer_size)
+
+    async def emit(
+        self, tracer: "ExecutionTracer", response: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Ends the trace of an execution and sends it to the sink or adds it
+        under the `tracing` extension of its response.
+        :param tracer: the tracer of the execution
+        :param response: the response of the execution
+        :type tracer: ExecutionTracer
+        :type response: Dict[str, Any]
+        :return: the response of the execution
+        :rtype: Dict[str, Any]
+        """
+        tracer.end = tracer.now()
+        trace = tracer.to_dict()
+        if self.sink is None:
+            # Responses can be shared with the response cache or concurrent
+            # executions
+            return {
+                **response,
+                "extensions": {
+                    **response.get("extensions", {}),
+                    "tracing": trace,
+                },
+            }
+
+        try:
+            result = self.sink(trace)
+            if isawaitable(result):
+                await result
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Tracing sink %r failed.", self.sink)
+        return response
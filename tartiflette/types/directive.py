@@ -30,6 +30,8 @@ class GraphQLDirective:
         self.arguments = arguments or {}
         self.description = description
         self.implementation: Optional[Callable] = None
+        # Hooks of the implementation, computed when linking it
+        self.callables: Dict[str, Callable] = {}
         self.arguments_coercer: Optional[Callable] = None
 
         # Introspection attributes
@@ -194,3 +194,11 @@ class RedefinedImplementation(TartifletteError):
 
 class CoercionError(TartifletteError):
     pass
+
+
+class PersistedQueryError(TartifletteError):
+    pass
+
+
+class TimeoutExceeded(TartifletteError):
+    pass
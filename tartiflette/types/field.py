@@ -1,18 +1,66 @@
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from tartiflette.caching.policy import compute_field_cache_hint
 from tartiflette.coercers.outputs.compute import get_output_coercer
-from tartiflette.resolver.default import default_field_resolver
+from tartiflette.resolver.batch import batch_resolver_executor
+from tartiflette.resolver.default import (
+    compile_default_field_resolver,
+    default_field_resolver,
+)
 from tartiflette.resolver.factory import resolve_field
+from tartiflette.types.helpers.definition import is_plain_leaf_type
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
 from tartiflette.types.helpers.type import get_graphql_type
+from tartiflette.utils.callables import is_valid_coroutine
 from tartiflette.utils.directives import wraps_with_directives
 
 __all__ = ("GraphQLField",)
 
 
+def _first_defined(*values: Any) -> Any:
+    """
+    Returns the first of the values which isn't None, e.g. the option of a
+    field set by its subscription, then by its resolver, then by the schema.
+    :param values: the values by order of precedence
+    :type values: Any
+    :return: the first value which isn't None if any
+    :rtype: Any
+    """
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _get_sync_resolver(
+    resolver: Optional[Callable], is_batch: bool, is_wrapped: bool
+) -> Optional[Callable]:
+    """
+    Returns the resolver of a field if it can be called inline, i.e. if it's
+    a synchronous callable which isn't a batch resolver nor wrapped by any
+    directive.
+    :param resolver: the resolver of the field if any
+    :param is_batch: whether or not the resolver is a batch resolver
+    :param is_wrapped: whether or not the resolver is wrapped by directives
+    :type resolver: Optional[Callable]
+    :type is_batch: bool
+    :type is_wrapped: bool
+    :return: the resolver if it can be called inline
+    :rtype: Optional[Callable]
+    """
+    if (
+        resolver is None
+        or is_batch
+        or is_wrapped
+        or is_valid_coroutine(resolver)
+    ):
+        return None
+    return resolver
+
+
 class GraphQLField:
     """
     Definition of a GraphQL field.
@@ -53,9 +101,15 @@ class GraphQLField:
         self.directives = directives
         self.on_post_bake: Optional[Callable] = None
         self.introspection_directives: Optional[Callable] = None
+        self.cache_hint: Optional[Tuple[Optional[int], Optional[str]]] = None
 
         # Resolvers
         self.raw_resolver = resolver
+        self.batch: bool = False
+        self.batch_resolver: Optional[Callable] = None
+        self.sync_resolver: Optional[Callable] = None
+        self.inline_resolver: Optional[Callable] = None
+        self.is_limited: bool = True
         self.resolver: Optional[Callable] = None
         self.subscribe: Optional[Callable] = None
 
@@ -70,6 +124,9 @@ class GraphQLField:
         self.query_list_concurrently: Optional[bool] = None
         self.query_parent_concurrently: Optional[bool] = None
         self.subscription_list_concurrently: Optional[bool] = None
+        self.list_max_concurrency: Optional[int] = None
+        self.query_list_max_concurrency: Optional[int] = None
+        self.subscription_list_max_concurrency: Optional[int] = None
         self.subscription_parent_concurrently: Optional[bool] = None
 
         # Introspection attributes
@@ -149,6 +206,7 @@ class GraphQLField:
         self,
         schema: "GraphQLSchema",
         custom_default_resolver: Optional[Callable],
+        source_shape: Optional[Union[str, Sequence[str]]] = None,
     ) -> None:
         """
         Bakes the GraphQLField and computes all the necessary stuff for
@@ -156,31 +214,34 @@ class GraphQLField:
         :param schema: the GraphQLSchema instance linked to the engine
         :param custom_default_resolver: callable that will replace the builtin
         default_resolver
+        :param source_shape: shape of the parent values of the field, used to
+        compile its default resolver
         :type schema: GraphQLSchema
         :type custom_default_resolver: Optional[Callable]
+        :type source_shape: Optional[Union[str, Sequence[str]]]
         """
         self.graphql_type = get_graphql_type(schema, self.gql_type)
 
-        if self.subscription_arguments_coercer is not None:
-            self.arguments_coercer = self.subscription_arguments_coercer
-        elif self.query_arguments_coercer is not None:
-            self.arguments_coercer = self.query_arguments_coercer
-        else:
-            self.arguments_coercer = schema.default_arguments_coercer
-
-        if self.subscription_list_concurrently is not None:
-            self.list_concurrently = self.subscription_list_concurrently
-        elif self.query_list_concurrently is not None:
-            self.list_concurrently = self.query_list_concurrently
-        else:
-            self.list_concurrently = schema.coerce_list_concurrently
-
-        if self.subscription_parent_concurrently is not None:
-            self.parent_concurrently = self.subscription_parent_concurrently
-        elif self.query_parent_concurrently is not None:
-            self.parent_concurrently = self.query_parent_concurrently
-        else:
-            self.parent_concurrently = schema.coerce_parent_concurrently
+        self.arguments_coercer = _first_defined(
+            self.subscription_arguments_coercer,
+            self.query_arguments_coercer,
+            schema.default_arguments_coercer,
+        )
+        self.list_concurrently = _first_defined(
+            self.subscription_list_concurrently,
+            self.query_list_concurrently,
+            schema.coerce_list_concurrently,
+        )
+        self.list_max_concurrency = _first_defined(
+            self.subscription_list_max_concurrency,
+            self.query_list_max_concurrency,
+            schema.list_max_concurrency,
+        )
+        self.parent_concurrently = _first_defined(
+            self.subscription_parent_concurrently,
+            self.query_parent_concurrently,
+            schema.coerce_parent_concurrently,
+        )
 
         # Directives
         directives_definition = compute_directive_nodes(
@@ -198,27 +259,105 @@ class GraphQLField:
             directives_definition=directives_definition,
             directive_hook="on_introspection",
         )
+        self.cache_hint = compute_field_cache_hint(self)
 
         # Resolvers
+        self._bake_resolvers(
+            schema,
+            custom_default_resolver,
+            source_shape,
+            directives_definition,
+        )
+
+        for argument in self.arguments.values():
+            argument.bake(schema)
+            self.args.append(argument)
+
+    def _bake_resolvers(
+        self,
+        schema: "GraphQLSchema",
+        custom_default_resolver: Optional[Callable],
+        source_shape: Optional[Union[str, Sequence[str]]],
+        directives_definition: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Computes the resolvers of the field.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param custom_default_resolver: callable that will replace the builtin
+        default_resolver
+        :param source_shape: shape of the parent values of the field, used to
+        compile its default resolver
+        :param directives_definition: the directives applied to the field
+        :type schema: GraphQLSchema
+        :type custom_default_resolver: Optional[Callable]
+        :type source_shape: Optional[Union[str, Sequence[str]]]
+        :type directives_definition: List[Dict[str, Any]]
+        """
+        resolver = self.raw_resolver
+        if resolver is None and source_shape is not None:
+            resolver = compile_default_field_resolver(self.name, source_shape)
+
+        is_wrapped = any(
+            "on_field_execution" in directive["callables"]
+            for directive in directives_definition
+        )
+        self.sync_resolver = _get_sync_resolver(
+            resolver, self.batch, is_wrapped
+        )
+        # Called directly by the list coercers with all their items
+        self.batch_resolver = (
+            resolver
+            if resolver is not None and self.batch and not is_wrapped
+            else None
+        )
+        # The built-in default resolver only reads the parent, its calls
+        # don't take any slot of the resolver limiters
+        self.is_limited = (
+            self.raw_resolver is not None
+            or custom_default_resolver is not None
+            or is_wrapped
+        )
+        self.inline_resolver = (
+            resolver
+            if resolver is not None
+            and resolver is not self.raw_resolver
+            and resolver is self.sync_resolver
+            and not self.arguments
+            and is_plain_leaf_type(self.graphql_type)
+            and not (
+                schema.instrumentation is not None
+                and schema.instrumentation.instruments_fields
+            )
+            else None
+        )
         self.resolver = partial(
             resolve_field,
             field_definition=self,
-            resolver=wraps_with_directives(
+            resolver=self.sync_resolver
+            or wraps_with_directives(
                 directives_definition=directives_definition,
                 directive_hook="on_field_execution",
                 func=(
-                    self.raw_resolver
-                    or custom_default_resolver
-                    or default_field_resolver
+                    partial(batch_resolver_executor, resolver)
+                    if resolver and self.batch
+                    else (
+                        resolver
+                        or custom_default_resolver
+                        or default_field_resolver
+                    )
                 ),
                 is_resolver=True,
                 with_default=True,
             ),
             output_coercer=get_output_coercer(
-                self.graphql_type, self.list_concurrently
+                self.graphql_type,
+                self.list_concurrently,
+                self.list_max_concurrency,
+            ),
+            instrumentation=(
+                schema.instrumentation
+                if schema.instrumentation is not None
+                and schema.instrumentation.instruments_fields
+                else None
             ),
         )
-
-        for argument in self.arguments.values():
-            argument.bake(schema)
-            self.args.append(argument)
@@ -18,6 +18,7 @@ __all__ = (
     "is_input_type",
     "is_abstract_type",
     "is_leaf_type",
+    "is_plain_leaf_type",
     "is_object_type",
 )
 
@@ -143,6 +144,25 @@ def is_leaf_type(graphql_type: "GraphQLType") -> bool:
     return isinstance(graphql_type, (GraphQLScalarType, GraphQLEnumType))
 
 
+def is_plain_leaf_type(graphql_type: "GraphQLType") -> bool:
+    """
+    Determines whether or not the "GraphQLType" is a (non-null) leaf type on
+    which no directive is applied, i.e. whose values are coerced without
+    reading their ResolveInfo.
+    :param graphql_type: schema type to test
+    :type graphql_type: GraphQLType
+    :return: whether or not the "GraphQLType" is a plain leaf type.
+    :rtype: bool
+    """
+    if is_non_null_type(graphql_type):
+        graphql_type = graphql_type.wrapped_type
+    if is_enum_type(graphql_type):
+        return not graphql_type.directives and not any(
+            enum_value.directives for enum_value in graphql_type.values
+        )
+    return is_scalar_type(graphql_type) and not graphql_type.directives
+
+
 def is_object_type(graphql_type: "GraphQLType") -> bool:
     """
     Determines whether or not the "GraphQLType" is an object type.
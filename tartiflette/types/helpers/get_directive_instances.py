@@ -44,7 +44,7 @@ def transform_directive(
     :rtype: Dict[str, Any]
     """
     return {
-        "callables": get_callables(directive.implementation),
+        "callables": directive.callables,
         "arguments_coercer": arguments_coercer,
     }
 
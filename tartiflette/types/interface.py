@@ -124,6 +124,16 @@ class GraphQLInterfaceType(GraphQLAbstractType, GraphQLCompositeType):
         """
         return self.implemented_fields[name]
 
+    def get_field(self, name: str) -> Optional["GraphQLField"]:
+        """
+        Returns the field corresponding to the filled in name if any.
+        :param name: name of the field to return
+        :type name: str
+        :return: the field corresponding to the filled in name if any
+        :rtype: Optional[GraphQLField]
+        """
+        return self.implemented_fields.get(name)
+
     def add_possible_type(self, possible_type: "GraphQLObjectType") -> None:
         """
         Adds a GraphQLObjectType that implements the interface to its possible
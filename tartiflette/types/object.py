@@ -55,10 +55,14 @@ class GraphQLObjectType(GraphQLCompositeType, GraphQLType):
         self.directives = directives
         self.introspection_directives: Optional[Callable] = None
         self.pre_output_coercion_directives: Optional[Callable] = None
+        self._coerces_raw_values = True
 
         # Coercers
         self.output_coercer: Optional[Callable] = None
 
+        # Batch fields resolved at once for the items of a list
+        self.batch_fields: Dict[str, "GraphQLField"] = {}
+
         # Introspection attributes
         self.interfaces: List["GraphQLInterfaceType"] = []
         self.fields: List["GraphQLField"] = []
@@ -124,6 +128,16 @@ class GraphQLObjectType(GraphQLCompositeType, GraphQLType):
         """
         return self.implemented_fields[name]
 
+    def get_field(self, name: str) -> Optional["GraphQLField"]:
+        """
+        Returns the field corresponding to the filled in name if any.
+        :param name: name of the field to return
+        :type name: str
+        :return: the field corresponding to the filled in name if any
+        :rtype: Optional[GraphQLField]
+        """
+        return self.implemented_fields.get(name)
+
     def bake(self, schema: "GraphQLSchema") -> None:
         """
         Bakes the GraphQLObjectType and computes all the necessary stuff for
@@ -151,6 +165,10 @@ class GraphQLObjectType(GraphQLCompositeType, GraphQLType):
             directive_hook="on_pre_output_coercion",
             with_default=True,
         )
+        self._coerces_raw_values = not any(
+            "on_pre_output_coercion" in directive["callables"]
+            for directive in directives_definition
+        )
 
         # Coercers
         self.output_coercer = partial(
@@ -174,12 +192,24 @@ class GraphQLObjectType(GraphQLCompositeType, GraphQLType):
         """
         if self.implemented_fields:
             for field in self.implemented_fields.values():
-                field.bake(schema, custom_default_resolver)
+                field.bake(
+                    schema,
+                    custom_default_resolver,
+                    source_shape=schema.source_shapes.get(self.name),
+                )
                 field = await field.on_post_bake()
 
                 if not field.name.startswith("__"):
                     self.fields.append(field)
 
+                # Unless the directives of the object could change the items
+                # of a list before their fields are resolved
+                if (
+                    field.batch_resolver is not None
+                    and self._coerces_raw_values
+                ):
+                    self.batch_fields[field.name] = field
+
     @property
     def possible_types_set(self) -> set:
         return self._possible_types_set
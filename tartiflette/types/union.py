@@ -128,6 +128,16 @@ class GraphQLUnionType(GraphQLAbstractType, GraphQLCompositeType):
         """
         return self._fields[name]
 
+    def get_field(self, name: str) -> Optional["GraphQLField"]:
+        """
+        Returns the field corresponding to the filled in name if any.
+        :param name: name of the field to return
+        :type name: str
+        :return: the field corresponding to the filled in name if any
+        :rtype: Optional[GraphQLField]
+        """
+        return self._fields.get(name)
+
     def is_possible_type(self, gql_type: "GraphQLType") -> bool:
         """
         Determines if a GraphQLType is a possible types for the union.
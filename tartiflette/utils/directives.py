@@ -1,9 +1,11 @@
 import asyncio
 
 from functools import partial
+from inspect import isawaitable
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Union
 
 from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.utils.callables import is_valid_coroutine
 from tartiflette.utils.values import is_invalid_value
 
 __all__ = ("introspection_directives_executor", "wraps_with_directives")
@@ -208,6 +210,22 @@ async def resolver_executor(resolver: Callable, *args, **kwargs) -> Any:
     return await resolver(*args, **kwargs)
 
 
+async def sync_resolver_executor(resolver: Callable, *args, **kwargs) -> Any:
+    """
+    Wraps the execution of a synchronous raw resolver so that it can be
+    wrapped with directives.
+    :param resolver: callable to wrap
+    :type resolver: Callable
+    :return: resolved value
+    :rtype: Any
+    """
+    kwargs.pop("context_coercer", None)
+    result = resolver(*args, **kwargs)
+    if isawaitable(result):
+        return await result
+    return result
+
+
 async def subscription_generator(generator: AsyncGenerator, *args, **kwargs):
     kwargs.pop("context_coercer", None)
     async for payload in generator(*args, **kwargs):
@@ -252,7 +270,12 @@ def wraps_with_directives(
         )
 
     if is_resolver and not isinstance(func, partial):
-        func = partial(resolver_executor, func)
+        func = partial(
+            resolver_executor
+            if is_valid_coroutine(func)
+            else sync_resolver_executor,
+            func,
+        )
 
     if is_async_generator and not isinstance(func, partial):
         func = partial(subscription_generator, func)
@@ -1,3 +1,5 @@
+import copy
+
 from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -9,6 +11,7 @@ from tartiflette.types.exceptions.tartiflette import (
 
 __all__ = (
     "is_coercible_exception",
+    "copy_exception",
     "to_graphql_error",
     "graphql_error_from_nodes",
     "located_error",
@@ -30,6 +33,21 @@ def is_coercible_exception(exception: Exception) -> bool:
     )
 
 
+def copy_exception(exception: Exception) -> Exception:
+    """
+    Returns a shallow copy of the exception if it can be copied, in order to
+    locate the same error at several paths.
+    :param exception: the exception to copy
+    :type exception: Exception
+    :return: a copy of the exception or the exception itself
+    :rtype: Exception
+    """
+    try:
+        return copy.copy(exception)
+    except Exception:  # pylint: disable=broad-except
+        return exception
+
+
 def to_graphql_error(
     raw_exception: Exception, message: Optional[str] = None
 ) -> Union["TartifletteError", Exception]:
@@ -0,0 +1,123 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Union
+
+__all__ = ("gather_results", "gather_until_error")
+
+
+async def _cancel_tasks(tasks: Iterable["asyncio.Task"]) -> None:
+    """
+    Cancels the tasks and waits for them to be done.
+    :param tasks: the tasks to cancel
+    :type tasks: Iterable[asyncio.Task]
+    """
+    tasks = [task for task in tasks if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+async def gather_results(
+    awaitables: Iterable[Awaitable[Any]],
+) -> List[Union[Exception, Any]]:
+    """
+    Runs the awaitables concurrently and returns their results, in order,
+    like `asyncio.gather(return_exceptions=True)`, except that the
+    cancellation of the awaitables is raised instead of being returned.
+    :param awaitables: the awaitables to run
+    :type awaitables: Iterable[Awaitable[Any]]
+    :return: the results or exceptions of the awaitables
+    :rtype: List[Union[Exception, Any]]
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            # Returned instead of being raised by Python 3.7 once the gather
+            # itself is cancelled
+            raise result
+    return results
+
+
+async def _wait_until_error(
+    tasks: List["asyncio.Task"],
+) -> Optional["asyncio.Task"]:
+    """
+    Waits for the tasks to be done, or for one of them to raise an exception
+    or to be cancelled. Once cancelled, the tasks are cancelled before the
+    cancellation is raised.
+    :param tasks: the tasks to wait for
+    :type tasks: List[asyncio.Task]
+    :return: the task which raised an exception or was cancelled if any
+    :rtype: Optional[asyncio.Task]
+    """
+    waiter = asyncio.get_running_loop().create_future()
+    remaining = len(tasks)
+
+    def on_done(task: "asyncio.Task") -> None:
+        nonlocal remaining
+        remaining -= 1
+        if waiter.done():
+            return
+        if task.cancelled() or task.exception() is not None:
+            waiter.set_result(task)
+        elif not remaining:
+            waiter.set_result(None)
+
+    for task in tasks:
+        task.add_done_callback(on_done)
+
+    try:
+        return await waiter
+    except asyncio.CancelledError:
+        # The tasks are done once the cancellation propagates, so that the
+        # cleanups of the execution don't run concurrently with them
+        await _cancel_tasks(tasks)
+        raise
+    finally:
+        for task in tasks:
+            task.remove_done_callback(on_done)
+
+
+async def gather_until_error(
+    awaitables: Iterable[Awaitable[Any]],
+    on_spawn: Optional[Callable[[], None]] = None,
+) -> List[Union[Exception, Any]]:
+    """
+    Runs the awaitables concurrently and returns their results, in order.
+    As soon as one of them raises an exception, the others are cancelled:
+    their results are replaced by None. The raised exceptions are returned
+    in place of the results, like `asyncio.gather(return_exceptions=True)`,
+    except the cancellation of one of the awaitables, which cancels the
+    others and is raised.
+    :param awaitables: the awaitables to run
+    :param on_spawn: callable called once the tasks running the awaitables
+    are created
+    :type awaitables: Iterable[Awaitable[Any]]
+    :type on_spawn: Optional[Callable[[], None]]
+    :return: the results or exceptions of the awaitables
+    :rtype: List[Union[Exception, Any]]
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    if not tasks:
+        return []
+
+    if on_spawn is not None:
+        on_spawn()
+
+    failed_task = await _wait_until_error(tasks)
+    if failed_task is not None:
+        # One of the awaitables failed, the others are useless
+        await _cancel_tasks(tasks)
+        if failed_task.cancelled():
+            raise asyncio.CancelledError()
+
+    results = []
+    for task in tasks:
+        if task.cancelled():
+            results.append(None)
+        elif task.exception() is not None:
+            results.append(task.exception())
+        else:
+            results.append(task.result())
+    return results
@@ -0,0 +1,184 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import TartifletteError
+
+_SDL = """
+type User {
+  id: Int!
+  name: String
+  friends: [User]
+  score(multiplier: Int = 1): Int
+}
+
+type Query {
+  users: [User]
+  user: User
+}
+"""
+
+_USERS = [{"id": index, "name": f"User #{index}"} for index in range(5)]
+
+
+async def _create_engine(schema_name, score_resolver=None):
+    calls = []
+
+    @Resolver("Query.users", schema_name=schema_name)
+    async def resolve_query_users(parent, args, ctx, info):
+        return _USERS
+
+    @Resolver("Query.user", schema_name=schema_name)
+    async def resolve_query_user(parent, args, ctx, info):
+        return _USERS[0]
+
+    @Resolver("User.friends", schema_name=schema_name, batch=True)
+    async def resolve_user_friends(parents, args, ctx, info):
+        calls.append(("friends", [parent["id"] for parent in parents]))
+        return [
+            [_USERS[(parent["id"] + 1) % len(_USERS)]] for parent in parents
+        ]
+
+    @Resolver("User.score", schema_name=schema_name, batch=True)
+    async def resolve_user_score(parents, args, ctx, info):
+        calls.append(
+            ("score", [parent["id"] for parent in parents], args["multiplier"])
+        )
+        if score_resolver is not None:
+            return score_resolver(parents, args)
+        return [parent["id"] * args["multiplier"] for parent in parents]
+
+    return await create_engine(_SDL, schema_name=schema_name), calls
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_list_children(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    assert await engine.execute(
+        "{ users { id score friends { id score } } }"
+    ) == {
+        "data": {
+            "users": [
+                {
+                    "id": index,
+                    "score": index,
+                    "friends": [
+                        {"id": (index + 1) % 5, "score": (index + 1) % 5}
+                    ],
+                }
+                for index in range(5)
+            ]
+        }
+    }
+    assert sorted(calls) == [
+        ("friends", [0, 1, 2, 3, 4]),
+        ("score", [0, 1, 2, 3, 4], 1),
+        ("score", [1, 2, 3, 4, 0], 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_arguments(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    query = """
+    query ($multiplier: Int) {
+      users { score double: score(multiplier: $multiplier) }
+      user { score }
+    }
+    """
+
+    assert await engine.execute(query, variables={"multiplier": 2}) == {
+        "data": {
+            "users": [
+                {"score": index, "double": index * 2} for index in range(5)
+            ],
+            "user": {"score": 0},
+        }
+    }
+    assert sorted(calls) == [
+        ("score", [0], 1),
+        ("score", [0, 1, 2, 3, 4], 1),
+        ("score", [0, 1, 2, 3, 4], 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_item_errors(random_schema_name):
+    engine, _ = await _create_engine(
+        random_schema_name,
+        score_resolver=lambda parents, args: [
+            parent["id"]
+            if parent["id"] % 2
+            else TartifletteError(f"Invalid score {parent['id']}")
+            for parent in parents
+        ],
+    )
+
+    assert await engine.execute("{ users { id score } }") == {
+        "data": {
+            "users": [
+                {"id": index, "score": index if index % 2 else None}
+                for index in range(5)
+            ]
+        },
+        "errors": [
+            {
+                "message": f"Invalid score {index}",
+                "path": ["users", index, "score"],
+                "locations": [{"line": 1, "column": 14}],
+            }
+            for index in (0, 2, 4)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_invalid_results(random_schema_name):
+    engine, _ = await _create_engine(
+        random_schema_name, score_resolver=lambda parents, args: [1]
+    )
+
+    result = await engine.execute("{ users { score } }")
+    assert result["data"] == {"users": [{"score": None}] * 5}
+    assert [error["path"] for error in result["errors"]] == [
+        ["users", index, "score"] for index in range(5)
+    ]
+    assert result["errors"][0]["message"] == (
+        "Batch resolver of field < User.score > should return a list of 5 "
+        "results, got < [1] >."
+    )
+
+
+@pytest.mark.parametrize(
+    "resolver_options",
+    [{"list_concurrently": False}, {"list_max_concurrency": 2}],
+)
+@pytest.mark.asyncio
+async def test_batch_resolver_items_completed_in_turn(
+    random_schema_name, resolver_options
+):
+    calls = []
+
+    @Resolver(
+        "Query.users", schema_name=random_schema_name, **resolver_options
+    )
+    async def resolve_query_users(parent, args, ctx, info):
+        return _USERS[:3] + [None] + _USERS[3:]
+
+    @Resolver("User.score", schema_name=random_schema_name, batch=True)
+    async def resolve_user_score(parents, args, ctx, info):
+        calls.append([parent["id"] for parent in parents])
+        return [parent["id"] for parent in parents]
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+
+    # The items completed one after the other are still resolved at once
+    assert await engine.execute("{ users { id score } }") == {
+        "data": {
+            "users": [{"id": index, "score": index} for index in range(3)]
+            + [None]
+            + [{"id": index, "score": index} for index in range(3, 5)]
+        }
+    }
+    assert calls == [[0, 1, 2, 3, 4]]
@@ -0,0 +1,196 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.caching import MemoryCacheStore
+
+_SDL = """
+type Country {
+  id: Int!
+  name: String @cached(ttl: 60)
+  population(year: Int!): Int @cached(ttl: 60)
+  favorite: Boolean @cached(ttl: 60, scope: PRIVATE)
+}
+
+type Query {
+  countries: [Country] @cached(ttl: 60)
+  country(id: Int!): Country
+}
+"""
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _create_engine(schema_name, store, config=None):
+    calls = []
+
+    @Resolver("Query.countries", schema_name=schema_name)
+    async def resolve_query_countries(parent, args, ctx, info):
+        calls.append("countries")
+        return [{"id": 1}, {"id": 2}]
+
+    @Resolver("Query.country", schema_name=schema_name)
+    async def resolve_query_country(parent, args, ctx, info):
+        return {"id": args["id"]}
+
+    @Resolver("Country.name", schema_name=schema_name)
+    async def resolve_country_name(parent, args, ctx, info):
+        calls.append(("name", parent["id"]))
+        return f"Country #{parent['id']}"
+
+    @Resolver("Country.population", schema_name=schema_name)
+    async def resolve_country_population(parent, args, ctx, info):
+        calls.append(("population", parent["id"], args["year"]))
+        return parent["id"] * args["year"]
+
+    @Resolver("Country.favorite", schema_name=schema_name)
+    async def resolve_country_favorite(parent, args, ctx, info):
+        calls.append(("favorite", parent["id"], ctx["user"]))
+        return parent["id"] == ctx["user"]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        modules=[
+            {
+                "name": "tartiflette.caching.directive",
+                "config": {"store": store, **(config or {})},
+            }
+        ],
+    )
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_cached_directive(random_schema_name):
+    clock = _Clock()
+    store = MemoryCacheStore(clock=clock)
+    engine, calls = await _create_engine(random_schema_name, store)
+
+    query = """
+    query ($year: Int!) {
+      countries { id name population(year: $year) }
+      country(id: 2) { name }
+    }
+    """
+    expected = {
+        "data": {
+            "countries": [
+                {"id": 1, "name": "Country #1", "population": 2000},
+                {"id": 2, "name": "Country #2", "population": 4000},
+            ],
+            "country": {"name": "Country #2"},
+        }
+    }
+
+    assert await engine.execute(query, variables={"year": 2000}) == expected
+    assert sorted(calls, key=str) == sorted(
+        [
+            "countries",
+            ("name", 1),
+            ("name", 2),
+            ("population", 1, 2000),
+            ("population", 2, 2000),
+        ],
+        key=str,
+    )
+
+    calls.clear()
+    assert await engine.execute(query, variables={"year": 2000}) == expected
+    assert calls == []
+
+    # Arguments are part of the key
+    assert await engine.execute(query, variables={"year": 1000}) == {
+        "data": {
+            "countries": [
+                {"id": 1, "name": "Country #1", "population": 1000},
+                {"id": 2, "name": "Country #2", "population": 2000},
+            ],
+            "country": {"name": "Country #2"},
+        }
+    }
+    assert sorted(calls) == [("population", 1, 1000), ("population", 2, 1000)]
+
+    # Values expire after their TTL
+    calls.clear()
+    clock.now = 61
+    assert await engine.execute(query, variables={"year": 2000}) == expected
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_cached_directive_private_scope(random_schema_name):
+    store = MemoryCacheStore()
+    engine, calls = await _create_engine(
+        random_schema_name,
+        store,
+        config={"context_key": lambda ctx: ctx.get("user")},
+    )
+
+    query = "{ country(id: 1) { favorite } }"
+    for _ in range(2):
+        for user in (1, 2):
+            assert await engine.execute(query, context={"user": user}) == {
+                "data": {"country": {"favorite": user == 1}}
+            }
+    assert calls == [("favorite", 1, 1), ("favorite", 1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_cached_directive_private_scope_without_context_key(
+    random_schema_name,
+):
+    engine, calls = await _create_engine(random_schema_name, None)
+
+    query = "{ country(id: 1) { favorite } }"
+    for _ in range(2):
+        assert await engine.execute(query, context={"user": 1}) == {
+            "data": {"country": {"favorite": True}}
+        }
+    assert calls == [("favorite", 1, 1), ("favorite", 1, 1)]
+
+
+@pytest.mark.asyncio
+async def test_cached_directive_mutation(random_schema_name):
+    calls = []
+
+    @Resolver("Query.version", schema_name=random_schema_name)
+    @Resolver("Mutation.increment", schema_name=random_schema_name)
+    async def resolve_increment(parent, args, ctx, info):
+        calls.append(info.field_name)
+        return len(calls)
+
+    engine = await create_engine(
+        """
+        type Query { version: Int }
+        type Mutation { increment: Int @cached(ttl: 60) }
+        """,
+        schema_name=random_schema_name,
+        modules=["tartiflette.caching.directive"],
+    )
+
+    assert await engine.execute("mutation { increment }") == {
+        "data": {"increment": 1}
+    }
+    assert await engine.execute("mutation { increment }") == {
+        "data": {"increment": 2}
+    }
+
+
+@pytest.mark.asyncio
+async def test_cached_directive_unsupported_key(random_schema_name):
+    engine, calls = await _create_engine(
+        random_schema_name,
+        MemoryCacheStore(),
+        {"parent_key": lambda parent, info: object()},
+    )
+
+    result = await engine.execute("{ country(id: 1) { name } }")
+    assert result["data"] == {"country": {"name": None}}
+    assert "can't be part of a cache key" in result["errors"][0]["message"]
+    assert calls == []
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.dataloader import get_dataloader
+
+_SDL = """
+type Item {
+  id: Int!
+  name(prefix: String = "Item"): String
+  score: Int
+  label: String
+}
+
+type Query {
+  items: [Item]
+  slow: String
+}
+"""
+
+
+async def _create_engine(schema_name):
+    calls = []
+    started = asyncio.Event()
+
+    async def wait(name):
+        calls.append(("started", name))
+        if len(calls) == 5:
+            started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            calls.append(("cancelled", name))
+            raise
+        calls.append(("done", name))
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        info.add_cleanup(lambda: calls.append(("cleanup", "sync")))
+        return [{"id": 1}, {"id": 2}]
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    async def resolve_query_slow(parent, args, ctx, info):
+        async def cleanup():
+            await asyncio.sleep(0)
+            calls.append(("cleanup", "async"))
+
+        info.add_cleanup(cleanup)
+        await wait("slow")
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        await wait(("name", parent["id"]))
+
+    @Resolver("Item.score", schema_name=schema_name, batch=True)
+    async def resolve_item_score(parents, args, ctx, info):
+        await wait("score")
+
+    async def load_labels(keys):
+        await wait("labels")
+
+    @Resolver("Item.label", schema_name=schema_name)
+    async def resolve_item_label(parent, args, ctx, info):
+        return await get_dataloader(info, load_labels, name="labels").load(
+            parent["id"]
+        )
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+    return engine, calls, started
+
+
+@pytest.mark.asyncio
+async def test_cancellation(random_schema_name):
+    engine, calls, started = await _create_engine(random_schema_name)
+
+    task = asyncio.ensure_future(
+        engine.execute('{ items { name(prefix: "#") score label } slow }')
+    )
+    await asyncio.wait_for(started.wait(), 1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    running = {name for event, name in calls if event == "started"}
+    assert running == {"slow", ("name", 1), ("name", 2), "score", "labels"}
+    # Every started resolver, batch resolver & batch load function is
+    # cancelled before the cleanup callbacks are called
+    assert {name for event, name in calls if event == "cancelled"} == running
+    assert not [name for event, name in calls if event == "done"]
+    assert calls[-2:] == [("cleanup", "async"), ("cleanup", "sync")]
+
+
+@pytest.mark.asyncio
+async def test_cancellation_cleanup_on_completion(random_schema_name):
+    engine, calls, _ = await _create_engine(random_schema_name)
+
+    assert await engine.execute("{ items { id } }") == {
+        "data": {"items": [{"id": 1}, {"id": 2}]}
+    }
+    assert calls == [("cleanup", "sync")]
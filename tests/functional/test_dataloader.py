@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.dataloader import get_dataloader
+
+_SDL = """
+type User {
+  id: Int!
+  bestFriend: User
+  friends: [User]
+}
+
+type Query {
+  users: [User]
+}
+"""
+
+
+async def _create_engine(schema_name):
+    calls = []
+
+    async def load_users(keys):
+        calls.append(list(keys))
+        return [{"id": key} for key in keys]
+
+    @Resolver("Query.users", schema_name=schema_name)
+    async def resolve_query_users(parent, args, ctx, info):
+        return await get_dataloader(info, load_users, name="users").load_many(
+            range(3)
+        )
+
+    @Resolver("User.bestFriend", schema_name=schema_name)
+    async def resolve_user_best_friend(parent, args, ctx, info):
+        return await get_dataloader(info, load_users, name="users").load(
+            (parent["id"] + 1) % 3
+        )
+
+    @Resolver("User.friends", schema_name=schema_name)
+    async def resolve_user_friends(parent, args, ctx, info):
+        return await get_dataloader(info, load_users, name="users").load_many(
+            [parent["id"] + 3, parent["id"] + 4]
+        )
+
+    return await create_engine(_SDL, schema_name=schema_name), calls
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_per_depth(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    assert await engine.execute(
+        "{ users { id bestFriend { id } friends { id } } }"
+    ) == {
+        "data": {
+            "users": [
+                {
+                    "id": index,
+                    "bestFriend": {"id": (index + 1) % 3},
+                    "friends": [{"id": index + 3}, {"id": index + 4}],
+                }
+                for index in range(3)
+            ]
+        }
+    }
+    # Keys are deduplicated & already loaded users are cached by the loader
+    assert calls == [[0, 1, 2], [3, 4, 5, 6]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_per_request(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    for _ in range(2):
+        assert await engine.execute("{ users { id } }") == {
+            "data": {"users": [{"id": 0}, {"id": 1}, {"id": 2}]}
+        }
+    assert calls == [[0, 1, 2], [0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_shared_key_timeout(random_schema_name):
+    async def load_values(keys):
+        await asyncio.sleep(0.2)
+        return keys
+
+    @Resolver("Query.fast", schema_name=random_schema_name)
+    @Resolver("Query.slow", schema_name=random_schema_name)
+    async def resolve_query_value(parent, args, ctx, info):
+        return await get_dataloader(info, load_values, name="values").load(1)
+
+    engine = await create_engine(
+        """
+        type Query {
+          fast: Int @timeout(ms: 50)
+          slow: Int
+        }
+        """,
+        schema_name=random_schema_name,
+        modules=["tartiflette.directive.timeout"],
+    )
+
+    # The timeout of a field doesn't cancel the loads of the other fields
+    result = await engine.execute("{ fast slow }")
+    assert result["data"] == {"fast": None, "slow": 1}
+    assert [error["path"] for error in result["errors"]] == [["fast"]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_until_execution_blocks(random_schema_name):
+    calls = []
+
+    async def load_users(keys):
+        calls.append(list(keys))
+        return [{"id": key} for key in keys]
+
+    @Resolver("Query.user", schema_name=random_schema_name)
+    @Resolver("Inner.user", schema_name=random_schema_name)
+    async def resolve_user(parent, args, ctx, info):
+        return await get_dataloader(info, load_users, name="users").load(
+            info.path.as_list()[0]
+        )
+
+    @Resolver("Query.wrapper", schema_name=random_schema_name)
+    async def resolve_query_wrapper(parent, args, ctx, info):
+        return {"inner": {}}
+
+    engine = await create_engine(
+        """
+        type User {
+          id: String!
+        }
+
+        type Inner {
+          user: User
+        }
+
+        type Wrapper {
+          inner: Inner
+        }
+
+        type Query {
+          user: User
+          wrapper: Wrapper
+        }
+        """,
+        schema_name=random_schema_name,
+    )
+
+    # Loads made at different depths are batched until every resolver
+    # started by the execution is waiting for something
+    assert await engine.execute(
+        "{ user { id } wrapper { inner { user { id } } } }"
+    ) == {
+        "data": {
+            "user": {"id": "user"},
+            "wrapper": {"inner": {"user": {"id": "wrapper"}}},
+        }
+    }
+    assert calls == [["user", "wrapper"]]
@@ -0,0 +1,348 @@
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from tartiflette import Directive, Resolver, TypeResolver, create_engine
+from tartiflette.execution import collect
+from tartiflette.resolver import factory
+from tartiflette.types.exceptions.tartiflette import SkipCollection
+
+_SDL = """
+directive @hideFor(role: String!) on FIELD | INLINE_FRAGMENT
+
+interface Pet {
+  name: String
+}
+
+type Dog implements Pet {
+  name: String
+  barkVolume: Int
+}
+
+type Cat implements Pet {
+  name: String
+  meowVolume: Int
+}
+
+type Query {
+  pets: [Pet]
+}
+"""
+
+_PETS = [
+    {"__typename": "Dog", "name": "Dog #0", "barkVolume": 10},
+    {"__typename": "Cat", "name": "Cat #1", "meowVolume": 11},
+    {"__typename": "Dog", "name": "Dog #2", "barkVolume": 12},
+    {"__typename": "Cat", "name": "Cat #3", "meowVolume": 13},
+]
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.pets", schema_name=schema_name)
+    async def resolve_query_pets(parent, args, ctx, info):
+        return _PETS
+
+    @TypeResolver("Pet", schema_name=schema_name)
+    def resolve_pet_type(result, ctx, info, abstract_type):
+        return result["__typename"]
+
+    @Directive("hideFor", schema_name=schema_name)
+    class HideForDirective:
+        async def on_field_collection(
+            self,
+            directive_args: Dict[str, Any],
+            next_directive: Callable,
+            field_node: "FieldNode",
+            ctx: Optional[Any],
+        ) -> "FieldNode":
+            if ctx and ctx.get("role") == directive_args["role"]:
+                raise SkipCollection()
+            return await next_directive(field_node, ctx)
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.fixture
+def condition_matches(monkeypatch):
+    calls = []
+    does_fragment_condition_match = collect.does_fragment_condition_match
+
+    def counted_does_fragment_condition_match(*args, **kwargs):
+        calls.append(args)
+        return does_fragment_condition_match(*args, **kwargs)
+
+    monkeypatch.setattr(
+        collect,
+        "does_fragment_condition_match",
+        counted_does_fragment_condition_match,
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_execution_plan_collects_once_per_runtime_type(
+    random_schema_name, condition_matches
+):
+    engine = await _create_engine(random_schema_name)
+    query = """
+    query {
+      pets {
+        name
+        ... on Dog { barkVolume }
+        ...CatFields
+      }
+    }
+
+    fragment CatFields on Cat { meowVolume }
+    """
+    expected = {
+        "data": {
+            "pets": [
+                {"name": "Dog #0", "barkVolume": 10},
+                {"name": "Cat #1", "meowVolume": 11},
+                {"name": "Dog #2", "barkVolume": 12},
+                {"name": "Cat #3", "meowVolume": 13},
+            ]
+        }
+    }
+
+    assert await engine.execute(query) == expected
+    # Fragment conditions are only checked once for each runtime type
+    assert len(condition_matches) == 4
+
+    assert await engine.execute(query) == expected
+    assert len(condition_matches) == 4
+
+
+@pytest.mark.asyncio
+async def test_execution_plan_uncached_documents(
+    random_schema_name, condition_matches
+):
+    engine = await _create_engine(
+        random_schema_name, query_cache_decorator=None
+    )
+    query = """
+    query {
+      pets {
+        ... on Dog { barkVolume }
+        ... on Cat { meowVolume }
+      }
+    }
+    """
+    expected = {
+        "data": {
+            "pets": [
+                {"barkVolume": 10},
+                {"meowVolume": 11},
+                {"barkVolume": 12},
+                {"meowVolume": 13},
+            ]
+        }
+    }
+
+    # Documents which aren't cached aren't planned, their fields are
+    # collected for each item
+    assert await engine.execute(query) == expected
+    assert len(condition_matches) == 8
+
+    assert await engine.execute(query) == expected
+    assert len(condition_matches) == 16
+
+
+@pytest.mark.asyncio
+async def test_execution_plan_skip_include_variables(
+    random_schema_name, condition_matches
+):
+    engine = await _create_engine(random_schema_name)
+    query = """
+    query ($withName: Boolean!, $skipDog: Boolean = false) {
+      pets {
+        name @include(if: $withName)
+        ... on Dog @skip(if: $skipDog) { barkVolume }
+      }
+    }
+    """
+
+    assert await engine.execute(query, variables={"withName": True}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog #0", "barkVolume": 10},
+                {"name": "Cat #1"},
+                {"name": "Dog #2", "barkVolume": 12},
+                {"name": "Cat #3"},
+            ]
+        }
+    }
+    assert len(condition_matches) == 2
+
+    assert await engine.execute(
+        query, variables={"withName": False, "skipDog": False}
+    ) == {
+        "data": {
+            "pets": [
+                {"barkVolume": 10},
+                {},
+                {"barkVolume": 12},
+                {},
+            ]
+        }
+    }
+    assert len(condition_matches) == 4
+
+    assert await engine.execute(
+        query, variables={"withName": True, "skipDog": True}
+    ) == {
+        "data": {
+            "pets": [
+                {"name": "Dog #0"},
+                {"name": "Cat #1"},
+                {"name": "Dog #2"},
+                {"name": "Cat #3"},
+            ]
+        }
+    }
+
+    # Already planned variable values
+    assert await engine.execute(query, variables={"withName": True}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog #0", "barkVolume": 10},
+                {"name": "Cat #1"},
+                {"name": "Dog #2", "barkVolume": 12},
+                {"name": "Cat #3"},
+            ]
+        }
+    }
+    assert len(condition_matches) == 4
+
+
+@pytest.mark.asyncio
+async def test_execution_plan_custom_collection_directive(
+    random_schema_name, condition_matches
+):
+    engine = await _create_engine(random_schema_name)
+    query = """
+    query {
+      pets {
+        name @hideFor(role: "guest")
+        ... on Dog { barkVolume }
+      }
+    }
+    """
+
+    assert await engine.execute(query, context={"role": "admin"}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog #0", "barkVolume": 10},
+                {"name": "Cat #1"},
+                {"name": "Dog #2", "barkVolume": 12},
+                {"name": "Cat #3"},
+            ]
+        }
+    }
+    assert await engine.execute(query, context={"role": "guest"}) == {
+        "data": {
+            "pets": [
+                {"barkVolume": 10},
+                {},
+                {"barkVolume": 12},
+                {},
+            ]
+        }
+    }
+    # Collection depends on the context, fields are collected for each pet
+    assert len(condition_matches) == 8
+
+
+@pytest.mark.asyncio
+async def test_execution_plan_field_directives(
+    random_schema_name, monkeypatch
+):
+    sdl = """
+    directive @suffix(value: String!) on FIELD
+
+    type Pet {
+      name: String
+    }
+
+    type Query {
+      pets: [Pet]
+    }
+    """
+
+    @Resolver("Query.pets", schema_name=random_schema_name)
+    async def resolve_query_pets(parent, args, ctx, info):
+        return [{"name": "Dog"}, {"name": "Cat"}]
+
+    @Directive("suffix", schema_name=random_schema_name)
+    class SuffixDirective:
+        async def on_field_execution(
+            self,
+            directive_args: Dict[str, Any],
+            next_resolver: Callable,
+            parent: Optional[Any],
+            args: Dict[str, Any],
+            ctx: Optional[Any],
+            info: "ResolveInfo",
+        ) -> Any:
+            return (
+                await next_resolver(parent, args, ctx, info)
+                + directive_args["value"]
+            )
+
+    engine = await create_engine(sdl, schema_name=random_schema_name)
+
+    calls = []
+    wraps_field_resolver_with_directives = (
+        factory.wraps_field_resolver_with_directives
+    )
+
+    def counted_wraps_field_resolver_with_directives(*args, **kwargs):
+        calls.append(args)
+        return wraps_field_resolver_with_directives(*args, **kwargs)
+
+    monkeypatch.setattr(
+        factory,
+        "wraps_field_resolver_with_directives",
+        counted_wraps_field_resolver_with_directives,
+    )
+
+    query = """
+    query ($suffix: String!) {
+      pets {
+        name @suffix(value: $suffix)
+        literal: name @suffix(value: "!")
+      }
+    }
+    """
+
+    assert await engine.execute(query, variables={"suffix": "?"}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog?", "literal": "Dog!"},
+                {"name": "Cat?", "literal": "Cat!"},
+            ]
+        }
+    }
+    # Directive chains are only wrapped once for the items of the list
+    assert len(calls) == 2
+
+    assert await engine.execute(query, variables={"suffix": "."}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog.", "literal": "Dog!"},
+                {"name": "Cat.", "literal": "Cat!"},
+            ]
+        }
+    }
+    assert len(calls) == 4
+
+    assert await engine.execute(query, variables={"suffix": "?"}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog?", "literal": "Dog!"},
+                {"name": "Cat?", "literal": "Cat!"},
+            ]
+        }
+    }
+    assert len(calls) == 4
@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String!
+}
+
+type Group {
+  failing: String
+  slow: String
+}
+
+type Query {
+  required: String!
+  lateRequired: String!
+  failing: String
+  group: Group
+  slow: String
+  items: [Item!]
+  limitedItems: [Item!]
+  nullableItems: [Item]
+}
+"""
+
+
+async def _create_engine(schema_name):
+    calls = []
+
+    async def wait(name):
+        calls.append(("started", name))
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            calls.append(("cancelled", name))
+            raise
+        calls.append(("done", name))
+
+    @Resolver("Query.required", schema_name=schema_name)
+    async def resolve_query_required(parent, args, ctx, info):
+        raise ValueError("Required failing")
+
+    @Resolver("Query.lateRequired", schema_name=schema_name)
+    async def resolve_query_late_required(parent, args, ctx, info):
+        await asyncio.sleep(0.01)
+        raise ValueError("Late required failing")
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    @Resolver("Group.failing", schema_name=schema_name)
+    async def resolve_failing(parent, args, ctx, info):
+        raise ValueError("Failing")
+
+    @Resolver("Query.group", schema_name=schema_name)
+    async def resolve_query_group(parent, args, ctx, info):
+        return {}
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    @Resolver("Group.slow", schema_name=schema_name)
+    async def resolve_slow(parent, args, ctx, info):
+        await wait("slow")
+        return "slow"
+
+    @Resolver("Query.items", schema_name=schema_name)
+    @Resolver(
+        "Query.limitedItems", schema_name=schema_name, list_max_concurrency=2
+    )
+    @Resolver("Query.nullableItems", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": index} for index in range(4)]
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        if parent["id"] == 0:
+            raise ValueError("Name failing")
+        await wait(parent["id"])
+        return f"Item #{parent['id']}"
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_fields(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    assert await engine.execute("{ slow required }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Required failing",
+                "path": ["required"],
+                "locations": [{"line": 1, "column": 8}],
+            }
+        ],
+    }
+    assert calls == [("started", "slow"), ("cancelled", "slow")]
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_errors(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    # Errors of the completed siblings are reported in their order, before
+    # the propagated one. The errors recorded by the cancelled `group` before
+    # its cancellation are dropped along with its value
+    assert await engine.execute(
+        "{ failing group { failing slow } lateRequired }"
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Failing",
+                "path": ["failing"],
+                "locations": [{"line": 1, "column": 3}],
+            },
+            {
+                "message": "Late required failing",
+                "path": ["lateRequired"],
+                "locations": [{"line": 1, "column": 34}],
+            },
+        ],
+    }
+    assert calls == [("started", "slow"), ("cancelled", "slow")]
+
+
+@pytest.mark.parametrize("field_name", ["items", "limitedItems"])
+@pytest.mark.asyncio
+async def test_fail_fast_list_items(random_schema_name, field_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    result = await engine.execute("{ %s { name } }" % field_name)
+    assert result["data"] == {field_name: None}
+    assert [error["path"] for error in result["errors"]] == [
+        [field_name, 0, "name"]
+    ]
+    # Pending items are cancelled & the remaining ones aren't started
+    assert all(call[0] != "done" for call in calls)
+    assert all(("cancelled", id) in calls for _, id in calls)
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_nullable_items(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    # Nullable items don't nullify the list
+    result = await engine.execute("{ nullableItems { name } }")
+    assert result["data"] == {
+        "nullableItems": [
+            None,
+            {"name": "Item #1"},
+            {"name": "Item #2"},
+            {"name": "Item #3"},
+        ]
+    }
+    assert sorted(call for call in calls if call[0] == "done") == [
+        ("done", 1),
+        ("done", 2),
+        ("done", 3),
+    ]
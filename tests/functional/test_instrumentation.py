@@ -0,0 +1,263 @@
+import pytest
+
+from tartiflette import Resolver, TartifletteError, create_engine
+from tartiflette.instrumentation import Instrument
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+}
+
+type Query {
+  items(limit: Int): [Item]
+  failing: String
+}
+"""
+
+
+class RecordingInstrument(Instrument):
+    def __init__(self):
+        self.events = []
+
+    def on_parse_start(self, query):
+        self.events.append(("parse_start", query))
+
+    def on_parse_end(self, query, document, errors):
+        self.events.append(("parse_end", document is not None, errors))
+
+    def on_validate_start(self, query):
+        self.events.append(("validate_start", query))
+
+    def on_validate_end(self, query, errors):
+        self.events.append(
+            ("validate_end", [error.message for error in errors or []])
+        )
+
+    def on_build_context_start(self, document, operation_name, variables):
+        self.events.append(("build_context_start", operation_name, variables))
+
+    def on_build_context_end(self, document, errors):
+        self.events.append(
+            ("build_context_end", [error.message for error in errors or []])
+        )
+
+    def on_execute_start(self, execution_context):
+        self.events.append(("execute_start",))
+
+    def on_execute_end(self, execution_context, data):
+        self.events.append(("execute_end", data))
+
+    def on_resolve_field_start(self, info):
+        self.events.append(("resolve_start", info.path.as_list()))
+
+    def on_resolve_field_end(self, info, result):
+        self.events.append(
+            (
+                "resolve_end",
+                info.path.as_list(),
+                type(result).__name__
+                if isinstance(result, Exception)
+                else result,
+            )
+        )
+
+    def on_coerce_start(self, info, value):
+        self.events.append(("coerce_start", info.path.as_list()))
+
+    def on_coerce_end(self, info, result):
+        self.events.append(("coerce_end", info.path.as_list(), result))
+
+    def on_error(self, error, coerced_error):
+        self.events.append(("error", coerced_error["message"]))
+
+
+class ErrorInstrument:
+    def __init__(self):
+        self.errors = []
+
+    def on_error(self, error, coerced_error):
+        self.errors.append(coerced_error["message"])
+
+
+class FailingInstrument(Instrument):
+    def on_execute_start(self, execution_context):
+        raise ValueError("Broken instrument")
+
+
+async def _create_engine(schema_name, instruments, **kwargs):
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": 1, "name": "One"}][: args.get("limit")]
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    async def resolve_query_failing(parent, args, ctx, info):
+        raise TartifletteError("Failing")
+
+    return await create_engine(
+        _SDL, schema_name=schema_name, instruments=instruments, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_instrumentation(random_schema_name):
+    instrument = RecordingInstrument()
+    engine = await _create_engine(random_schema_name, [instrument])
+
+    query = "query Items($limit: Int) { items(limit: $limit) { id } }"
+    assert await engine.execute(
+        query, operation_name="Items", variables={"limit": 1}
+    ) == {"data": {"items": [{"id": 1}]}}
+    assert instrument.events == [
+        ("parse_start", query),
+        ("validate_start", query),
+        ("validate_end", []),
+        ("parse_end", True, None),
+        ("build_context_start", "Items", {"limit": 1}),
+        ("build_context_end", []),
+        ("execute_start",),
+        ("resolve_start", ["items"]),
+        ("resolve_end", ["items"], [{"id": 1, "name": "One"}]),
+        ("coerce_start", ["items"]),
+        ("resolve_start", ["items", 0, "id"]),
+        ("resolve_end", ["items", 0, "id"], 1),
+        ("coerce_start", ["items", 0, "id"]),
+        ("coerce_end", ["items", 0, "id"], 1),
+        ("coerce_end", ["items"], [{"id": 1}]),
+        ("execute_end", {"items": [{"id": 1}]}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_errors(random_schema_name):
+    instrument = RecordingInstrument()
+    engine = await _create_engine(random_schema_name, [instrument])
+
+    await engine.execute("{ failing }")
+    assert instrument.events[-5:] == [
+        ("resolve_end", ["failing"], "TartifletteError"),
+        ("coerce_start", ["failing"]),
+        ("coerce_end", ["failing"], None),
+        ("execute_end", {"failing": None}),
+        ("error", "Failing"),
+    ]
+
+    instrument.events.clear()
+    await engine.execute("{ unknown }")
+    assert [event[0] for event in instrument.events] == [
+        "parse_start",
+        "validate_start",
+        "validate_end",
+        "parse_end",
+        "error",
+    ]
+    assert instrument.events[2] == (
+        "validate_end",
+        ["Field unknown doesn't exist on Query"],
+    )
+    assert instrument.events[3][:2] == ("parse_end", False)
+    assert instrument.events[4] == (
+        "error",
+        "Field unknown doesn't exist on Query",
+    )
+
+    # Documents retrieved from the query cache aren't validated again
+    instrument.events.clear()
+    await engine.execute("{ failing }")
+    assert [event[0] for event in instrument.events[:3]] == [
+        "parse_start",
+        "parse_end",
+        "build_context_start",
+    ]
+
+    instrument.events.clear()
+    await engine.execute(
+        "query ($limit: Int!) { items(limit: $limit) { id } }"
+    )
+    assert instrument.events[4:] == [
+        ("build_context_start", None, None),
+        (
+            "build_context_end",
+            [
+                "Variable < $limit > of required type < Int! > was not provided."
+            ],
+        ),
+        (
+            "error",
+            "Variable < $limit > of required type < Int! > was not provided.",
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_json_query_parser_mode(random_schema_name):
+    instrument = RecordingInstrument()
+    engine = await _create_engine(
+        random_schema_name, [instrument], query_parser_mode="json"
+    )
+
+    await engine.execute("{ unknown }")
+    assert instrument.events[1:3] == [
+        ("validate_start", "{ unknown }"),
+        ("validate_end", ["Field unknown doesn't exist on Query"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_partial(random_schema_name):
+    instrument = ErrorInstrument()
+    engine = await _create_engine(random_schema_name, [instrument])
+
+    assert not engine._schema.instrumentation.instruments_fields
+    assert (
+        engine._schema.get_field_by_name("Query.items").resolver.keywords[
+            "instrumentation"
+        ]
+        is None
+    )
+
+    await engine.execute("{ failing items { id } }")
+    assert instrument.errors == ["Failing"]
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_failing_instrument(random_schema_name, caplog):
+    engine = await _create_engine(random_schema_name, [FailingInstrument()])
+
+    assert await engine.execute("{ items { id } }") == {
+        "data": {"items": [{"id": 1}]}
+    }
+    assert "Instrument hook" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_disabled(random_schema_name):
+    engine = await _create_engine(random_schema_name, None)
+
+    assert engine._instrumentation is None
+    assert engine._schema.instrumentation is None
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_source_shapes(random_schema_name):
+    instrument = RecordingInstrument()
+
+    @Resolver("Query.items", schema_name=random_schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": 1, "name": "One"}]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        source_shapes={"Item": "mapping"},
+        instruments=[instrument],
+    )
+
+    assert engine._schema.get_field_by_name("Item.id").inline_resolver is None
+    assert await engine.execute("{ items { id name } }") == {
+        "data": {"items": [{"id": 1, "name": "One"}]}
+    }
+    # Fields resolved by a compiled getter are reported as well
+    assert [
+        event[1] for event in instrument.events if event[0] == "resolve_start"
+    ] == [["items"], ["items", 0, "id"], ["items", 0, "name"]]
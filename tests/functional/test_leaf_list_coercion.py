@@ -0,0 +1,153 @@
+import pytest
+
+from tartiflette import Directive, Resolver, Scalar, create_engine
+
+_SDL = """
+directive @rounded on SCALAR
+
+scalar Celsius
+scalar Fahrenheit @rounded
+
+enum Unit { CELSIUS FAHRENHEIT }
+
+type Query {
+  celsius: [Celsius!]!
+  fahrenheit: [Fahrenheit]
+  floats: [Float!]!
+  units: [Unit]
+}
+"""
+
+
+async def _create_engine(schema_name, values):
+    calls = []
+
+    @Directive("rounded", schema_name=schema_name)
+    class RoundedDirective:
+        @staticmethod
+        async def on_pre_output_coercion(
+            directive_args, next_directive, value, ctx, info
+        ):
+            value = await next_directive(value, ctx, info)
+            return round(value) if value is not None else None
+
+    @Scalar("Celsius", schema_name=schema_name)
+    class ScalarCelsius:
+        @staticmethod
+        def coerce_output(value):
+            calls.append("coerce_output")
+            if not isinstance(value, float):
+                raise TypeError(f"Not a temperature: < {value} >.")
+            return value
+
+        @staticmethod
+        def coerce_output_many(values):
+            calls.append("coerce_output_many")
+            if not all(isinstance(value, float) for value in values):
+                raise TypeError
+            return values
+
+        coerce_input = parse_literal = staticmethod(lambda value: value)
+
+    @Scalar("Fahrenheit", schema_name=schema_name)
+    class ScalarFahrenheit:
+        coerce_output = coerce_input = parse_literal = staticmethod(
+            lambda value: value * 1.8 + 32
+        )
+
+    @Resolver("Query.celsius", schema_name=schema_name)
+    @Resolver("Query.fahrenheit", schema_name=schema_name)
+    @Resolver("Query.floats", schema_name=schema_name)
+    @Resolver("Query.units", schema_name=schema_name)
+    async def resolve_query_values(parent, args, ctx, info):
+        return values[info.field_name]
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_leaf_list_coercion(random_schema_name):
+    engine, calls = await _create_engine(
+        random_schema_name,
+        {
+            "celsius": [1.5, 2.5],
+            "fahrenheit": [1.5, None],
+            "floats": list(range(50_000)),
+            "units": ["CELSIUS", None, "FAHRENHEIT"],
+        },
+    )
+
+    result = await engine.execute("{ celsius fahrenheit floats units }")
+    assert result == {
+        "data": {
+            "celsius": [1.5, 2.5],
+            "fahrenheit": [35.6, None],
+            "floats": [float(value) for value in range(50_000)],
+            "units": ["CELSIUS", None, "FAHRENHEIT"],
+        }
+    }
+    assert calls == ["coerce_output_many"]
+
+
+@pytest.mark.asyncio
+async def test_leaf_list_coercion_errors(random_schema_name):
+    engine, calls = await _create_engine(
+        random_schema_name,
+        {
+            "celsius": [1.5, "hot", 2.5],
+            "fahrenheit": [],
+            "floats": [1.5, None, "cold"],
+            "units": ["CELSIUS", "KELVIN"],
+        },
+    )
+
+    result = await engine.execute("{ celsius }")
+    assert result == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Not a temperature: < hot >.",
+                "path": ["celsius", 1],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+    assert calls == [
+        "coerce_output_many",
+        "coerce_output",
+        "coerce_output",
+        "coerce_output",
+    ]
+
+    result = await engine.execute("{ floats }")
+    assert result == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Cannot return null for non-nullable field "
+                "Query.floats.",
+                "path": ["floats", 1],
+                "locations": [{"line": 1, "column": 3}],
+            },
+            {
+                "message": "Float cannot represent non numeric value: "
+                "< cold >.",
+                "path": ["floats", 2],
+                "locations": [{"line": 1, "column": 3}],
+            },
+        ],
+    }
+
+    result = await engine.execute("{ units }")
+    assert result == {
+        "data": {"units": ["CELSIUS", None]},
+        "errors": [
+            {
+                "message": "Expected value of type Unit but received "
+                "<class 'str'>.",
+                "path": ["units", 1],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
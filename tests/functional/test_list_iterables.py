@@ -0,0 +1,187 @@
+from array import array
+
+import pytest
+
+from tartiflette import Resolver, Scalar, create_engine
+
+_SDL = """
+type Item {
+  id: Int
+}
+
+type Query {
+  floats: [Float!]!
+  ints: [Int]
+  matrix: [[Int]]
+  items: [Item]
+  names: [String]
+}
+"""
+
+
+async def _agen(values):
+    for value in values:
+        yield value
+
+
+async def _execute(schema_name, value, query):
+    @Resolver("Query.floats", schema_name=schema_name)
+    @Resolver("Query.ints", schema_name=schema_name)
+    @Resolver("Query.matrix", schema_name=schema_name)
+    @Resolver("Query.items", schema_name=schema_name)
+    @Resolver("Query.names", schema_name=schema_name)
+    async def resolve_query_field(parent, args, ctx, info):
+        return value() if callable(value) else value
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+    return await engine.execute(query)
+
+
+@pytest.mark.parametrize(
+    "value,query,expected",
+    [
+        ((1, 2, None), "{ ints }", {"ints": [1, 2, None]}),
+        ({1}, "{ ints }", {"ints": [1]}),
+        (range(3), "{ ints }", {"ints": [0, 1, 2]}),
+        (lambda: (i * 2 for i in range(3)), "{ ints }", {"ints": [0, 2, 4]}),
+        (lambda: _agen([1, None]), "{ ints }", {"ints": [1, None]}),
+        (
+            lambda: _agen([{"id": 1}, {"id": 2}]),
+            "{ items { id } }",
+            {"items": [{"id": 1}, {"id": 2}]},
+        ),
+        (
+            ({"id": index} for index in range(2)),
+            "{ items { id } }",
+            {"items": [{"id": 0}, {"id": 1}]},
+        ),
+        (array("d", [1.5, 2.5]), "{ floats }", {"floats": [1.5, 2.5]}),
+        (array("q", [1, 2]), "{ floats }", {"floats": [1.0, 2.0]}),
+        (
+            memoryview(array("i", [1, 2, 3, 4])).cast("B").cast("i", (2, 2)),
+            "{ matrix }",
+            {"matrix": [[1, 2], [3, 4]]},
+        ),
+        (
+            (range(2), array("i", [3])),
+            "{ matrix }",
+            {"matrix": [[0, 1], [3]]},
+        ),
+        (frozenset(["a"]), "{ names }", {"names": ["a"]}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_iterables(random_schema_name, value, query, expected):
+    assert await _execute(random_schema_name, value, query) == {
+        "data": expected
+    }
+
+
+@pytest.mark.parametrize(
+    "value", ["abc", b"abc", bytearray(b"abc"), {"a": 1}, 3]
+)
+@pytest.mark.asyncio
+async def test_list_iterables_not_iterable(random_schema_name, value):
+    assert await _execute(random_schema_name, value, "{ names }") == {
+        "data": {"names": None},
+        "errors": [
+            {
+                "message": "Expected Iterable, but did not find one for "
+                "field Query.names.",
+                "path": ["names"],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_buffer_errors(random_schema_name):
+    assert await _execute(
+        random_schema_name, array("d", [1.5, float("nan")]), "{ floats }"
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Float cannot represent non numeric value: "
+                "< nan >.",
+                "path": ["floats", 1],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_buffer_bounds(random_schema_name):
+    assert await _execute(
+        random_schema_name, array("q", [1, 2**40]), "{ ints }"
+    ) == {
+        "data": {"ints": [1, None]},
+        "errors": [
+            {
+                "message": "Int cannot represent non 32-bit signed integer "
+                f"value: < {2**40} >.",
+                "path": ["ints", 1],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_buffer_handed_over(random_schema_name):
+    values = []
+
+    @Scalar("Celsius", schema_name=random_schema_name)
+    class ScalarCelsius:
+        @staticmethod
+        def coerce_output_many(buffer):
+            values.append(buffer)
+            return buffer.tolist()
+
+        coerce_output = coerce_input = parse_literal = staticmethod(
+            lambda value: value
+        )
+
+    @Resolver("Query.temperatures", schema_name=random_schema_name)
+    async def resolve_query_temperatures(parent, args, ctx, info):
+        return array("d", [1.5, 2.5])
+
+    engine = await create_engine(
+        """
+        scalar Celsius
+
+        type Query {
+          temperatures: [Celsius!]
+        }
+        """,
+        schema_name=random_schema_name,
+    )
+
+    assert await engine.execute("{ temperatures }") == {
+        "data": {"temperatures": [1.5, 2.5]}
+    }
+    # Buffers are handed over to the scalar without being converted first
+    assert len(values) == 1
+    assert isinstance(values[0], memoryview)
+
+
+def _failing_names():
+    yield "a"
+    raise TypeError("Can't load names.")
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_iteration_errors(random_schema_name):
+    # Errors raised while iterating aren't confused with non iterable values
+    assert await _execute(random_schema_name, _failing_names, "{ names }") == {
+        "data": {"names": None},
+        "errors": [
+            {
+                "message": "Can't load names.",
+                "path": ["names"],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, Subscription, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String!
+}
+
+type Query {
+  items(count: Int!): [Item]
+  limitedItems(count: Int!): [Item]
+}
+"""
+
+
+async def _create_engine(schema_name, list_max_concurrency=None):
+    in_flight = {"current": 0, "max": 0}
+
+    @Resolver("Query.items", schema_name=schema_name)
+    @Resolver(
+        "Query.limitedItems", schema_name=schema_name, list_max_concurrency=2
+    )
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": index} for index in range(args["count"])]
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        try:
+            # Later items are completed first
+            await asyncio.sleep((10 - parent["id"]) / 1000)
+            if parent["id"] % 3 == 2:
+                raise ValueError(f"Failing #{parent['id']}")
+            return f"Item #{parent['id']}"
+        finally:
+            in_flight["current"] -= 1
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        list_max_concurrency=list_max_concurrency,
+    )
+    return engine, in_flight
+
+
+def _expected_data(field_name, count):
+    return {
+        field_name: [
+            None if index % 3 == 2 else {"name": f"Item #{index}"}
+            for index in range(count)
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "list_max_concurrency,field_name,expected_max",
+    [
+        (None, "items", 10),
+        (None, "limitedItems", 2),
+        (3, "items", 3),
+        (3, "limitedItems", 2),
+        (20, "items", 10),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_max_concurrency(
+    random_schema_name, list_max_concurrency, field_name, expected_max
+):
+    engine, in_flight = await _create_engine(
+        random_schema_name, list_max_concurrency
+    )
+
+    result = await engine.execute("{ %s(count: 10) { name } }" % field_name)
+    # Items are completed in any order but returned in the list order
+    assert result["data"] == _expected_data(field_name, 10)
+    assert sorted(error["path"] for error in result["errors"]) == [
+        [field_name, 2, "name"],
+        [field_name, 5, "name"],
+        [field_name, 8, "name"],
+    ]
+    assert in_flight["max"] == expected_max
+
+
+@pytest.mark.parametrize("list_max_concurrency", [0, -1])
+@pytest.mark.asyncio
+async def test_list_max_concurrency_invalid(
+    random_schema_name, list_max_concurrency
+):
+    with pytest.raises(ImproperlyConfigured):
+        await _create_engine(random_schema_name, list_max_concurrency)
+
+
+@pytest.mark.parametrize("decorator", [Resolver, Subscription])
+@pytest.mark.parametrize("list_max_concurrency", [0, -1])
+def test_list_max_concurrency_invalid_field(
+    random_schema_name, decorator, list_max_concurrency
+):
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=r"list_max_concurrency > of < Query\.items >",
+    ):
+        decorator(
+            "Query.items",
+            schema_name=random_schema_name,
+            list_max_concurrency=list_max_concurrency,
+        )
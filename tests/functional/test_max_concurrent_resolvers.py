@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.resolver import factory
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  children: [Item]
+}
+
+type Query {
+  items(count: Int!): [Item]
+}
+"""
+
+
+async def _create_engine(schema_name, **kwargs):
+    in_flight = {"current": 0, "max": 0}
+
+    async def track():
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            in_flight["current"] -= 1
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        await track()
+        return [{"id": index} for index in range(args["count"])]
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        await track()
+        if parent["id"] == 3:
+            raise ValueError("Failing")
+        return f"Item #{parent['id']}"
+
+    @Resolver("Item.children", schema_name=schema_name)
+    async def resolve_item_children(parent, args, ctx, info):
+        await track()
+        return [{"id": parent["id"] * 10 + index} for index in range(3)]
+
+    engine = await create_engine(_SDL, schema_name=schema_name, **kwargs)
+    return engine, in_flight
+
+
+_QUERY = "{ items(count: 5) { name children { name } } }"
+
+
+def _expected_items():
+    return [
+        {
+            "name": None if index == 3 else f"Item #{index}",
+            "children": [
+                {"name": f"Item #{index * 10 + child}"} for child in range(3)
+            ],
+        }
+        for index in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_resolvers_per_execution(random_schema_name):
+    engine, in_flight = await _create_engine(
+        random_schema_name, max_concurrent_resolvers_per_execution=3
+    )
+
+    results = await asyncio.gather(
+        engine.execute(_QUERY), engine.execute(_QUERY)
+    )
+    for result in results:
+        assert result["data"] == {"items": _expected_items()}
+        assert [error["path"] for error in result["errors"]] == [
+            ["items", 3, "name"]
+        ]
+    # Each execution has its own slots
+    assert in_flight["max"] == 6
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_resolvers(random_schema_name):
+    engine, in_flight = await _create_engine(
+        random_schema_name,
+        max_concurrent_resolvers=4,
+        max_concurrent_resolvers_per_execution=3,
+    )
+
+    results = await asyncio.gather(
+        engine.execute(_QUERY), engine.execute(_QUERY)
+    )
+    for result in results:
+        assert result["data"] == {"items": _expected_items()}
+    # Slots are shared by every execution of the engine
+    assert in_flight["max"] == 4
+    assert engine._resolver_limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_resolvers_unlimited(random_schema_name):
+    engine, in_flight = await _create_engine(random_schema_name)
+
+    result = await engine.execute(_QUERY)
+    assert result["data"] == {"items": _expected_items()}
+    assert in_flight["max"] == 15
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_concurrent_resolvers": 0},
+        {"max_concurrent_resolvers_per_execution": -1},
+    ],
+)
+@pytest.mark.asyncio
+async def test_max_concurrent_resolvers_invalid(random_schema_name, kwargs):
+    with pytest.raises(ImproperlyConfigured):
+        await _create_engine(random_schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_resolvers_default_resolver(
+    random_schema_name, monkeypatch
+):
+    engine, _ = await _create_engine(
+        random_schema_name, max_concurrent_resolvers=2
+    )
+
+    calls = []
+    run_limited = factory.run_limited
+
+    def counted_run_limited(limiters, func, *args, **kwargs):
+        calls.append(args[-1].path.as_list())
+        return run_limited(limiters, func, *args, **kwargs)
+
+    monkeypatch.setattr(factory, "run_limited", counted_run_limited)
+
+    result = await engine.execute("{ items(count: 2) { id name } }")
+    assert result == {
+        "data": {
+            "items": [
+                {"id": 0, "name": "Item #0"},
+                {"id": 1, "name": "Item #1"},
+            ]
+        }
+    }
+    # Fields resolved by the default resolver don't take any slot
+    assert calls == [["items"], ["items", 0, "name"], ["items", 1, "name"]]
@@ -0,0 +1,225 @@
+import os
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.persisted_queries import (
+    FilePersistedQueryStore,
+    LRUPersistedQueryStore,
+    compute_query_id,
+)
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Query {
+  hello(name: String = "World"): String
+}
+"""
+
+_QUERY = "query Hello($name: String) { hello(name: $name) }"
+_QUERY_ID = compute_query_id(_QUERY)
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello {}!".format(args["name"])
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+def _persisted_query_error(code):
+    return {
+        "data": None,
+        "errors": [
+            {
+                "message": "".join(
+                    part.capitalize() for part in code.split("_")
+                ),
+                "path": None,
+                "locations": [],
+                "extensions": {"code": code},
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_not_supported(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    assert await engine.execute(query_id=_QUERY_ID) == _persisted_query_error(
+        "PERSISTED_QUERY_NOT_SUPPORTED"
+    )
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_register_then_execute(random_schema_name):
+    store = LRUPersistedQueryStore()
+    engine = await _create_engine(
+        random_schema_name, persisted_query_store=store
+    )
+
+    assert await engine.execute(query_id=_QUERY_ID) == _persisted_query_error(
+        "PERSISTED_QUERY_NOT_FOUND"
+    )
+    assert len(store) == 0
+
+    assert await engine.execute(
+        _QUERY, variables={"name": "Bob"}, query_id=_QUERY_ID
+    ) == {"data": {"hello": "Hello Bob!"}}
+    assert len(store) == 1
+
+    assert await engine.execute(
+        query_id=_QUERY_ID, variables={"name": "Alice"}
+    ) == {"data": {"hello": "Hello Alice!"}}
+
+    # Queries without identifier are still executed
+    assert await engine.execute("{ hello }") == {
+        "data": {"hello": "Hello World!"}
+    }
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_id_mismatch(random_schema_name):
+    store = LRUPersistedQueryStore()
+    engine = await _create_engine(
+        random_schema_name, persisted_query_store=store
+    )
+
+    assert await engine.execute("{ hello }", query_id=_QUERY_ID) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Provided query id does not match query",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_ID_MISMATCH"},
+            }
+        ],
+    }
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_invalid_query_not_stored(
+    random_schema_name,
+):
+    store = LRUPersistedQueryStore()
+    engine = await _create_engine(
+        random_schema_name, persisted_query_store=store
+    )
+
+    query = "{ unknownField }"
+    result = await engine.execute(query, query_id=compute_query_id(query))
+    assert result["data"] is None
+    assert len(result["errors"]) == 1
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_allowlist_only(random_schema_name):
+    store = LRUPersistedQueryStore(maxsize=None)
+    engine = await _create_engine(
+        random_schema_name,
+        persisted_query_store=store,
+        persisted_query_allowlist_only=True,
+    )
+
+    assert await engine.persist_query(_QUERY) == _QUERY_ID
+
+    assert await engine.execute(
+        query_id=_QUERY_ID, variables={"name": "Bob"}
+    ) == {"data": {"hello": "Hello Bob!"}}
+    assert await engine.execute(_QUERY, variables={"name": "Bob"}) == {
+        "data": {"hello": "Hello Bob!"}
+    }
+
+    unknown_query = "{ hello }"
+    for kwargs in (
+        {"query": unknown_query},
+        {"query": unknown_query, "query_id": compute_query_id(unknown_query)},
+        {"query_id": compute_query_id(unknown_query)},
+        {"query_id": "../../etc/passwd"},
+    ):
+        assert await engine.execute(**kwargs) == _persisted_query_error(
+            "PERSISTED_QUERY_NOT_ALLOWED"
+        )
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_allowlist_only_requires_store(
+    random_schema_name,
+):
+    with pytest.raises(ImproperlyConfigured):
+        await _create_engine(
+            random_schema_name, persisted_query_allowlist_only=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_file_store(random_schema_name, tmp_path):
+    directory = str(tmp_path / "queries")
+    engine = await _create_engine(
+        random_schema_name,
+        persisted_query_store=FilePersistedQueryStore(directory),
+    )
+
+    assert await engine.execute(
+        _QUERY, variables={"name": "Bob"}, query_id=_QUERY_ID
+    ) == {"data": {"hello": "Hello Bob!"}}
+    with open(os.path.join(directory, f"{_QUERY_ID}.graphql")) as query_file:
+        assert query_file.read() == _QUERY
+
+    # A new store (e.g. after a restart) reads the queries back from the disk
+    store = FilePersistedQueryStore(directory)
+    store.bake(engine._schema)
+    engine._persisted_query_store = store
+
+    assert await engine.execute(
+        query_id=_QUERY_ID, variables={"name": "Alice"}
+    ) == {"data": {"hello": "Hello Alice!"}}
+    assert await store.get(compute_query_id("{ hello }")) is None
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_file_store_tampered(
+    random_schema_name, tmp_path
+):
+    directory = tmp_path / "queries"
+    directory.mkdir()
+    (directory / f"{_QUERY_ID}.graphql").write_text("{ hello }")
+
+    engine = await _create_engine(
+        random_schema_name,
+        persisted_query_store=FilePersistedQueryStore(str(directory)),
+    )
+
+    # A file whose content doesn't match its query id is ignored
+    assert await engine.execute(query_id=_QUERY_ID) == _persisted_query_error(
+        "PERSISTED_QUERY_NOT_FOUND"
+    )
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_allowlist_only_normalized(
+    random_schema_name,
+):
+    engine = await _create_engine(
+        random_schema_name,
+        persisted_query_store=LRUPersistedQueryStore(maxsize=None),
+        persisted_query_allowlist_only=True,
+        normalize_queries=True,
+    )
+
+    await engine.persist_query(_QUERY)
+
+    assert await engine.execute(
+        "query Hello($name: String) {\n  hello(name: $name)\n}",
+        variables={"name": "Bob"},
+    ) == {"data": {"hello": "Hello Bob!"}}
+    assert await engine.execute("{ hello }") == _persisted_query_error(
+        "PERSISTED_QUERY_NOT_ALLOWED"
+    )
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Query {
+  dashboard(id: Int!): String
+}
+
+type Mutation {
+  refresh(id: Int!): String
+}
+"""
+
+
+async def _create_engine(schema_name, **kwargs):
+    calls = []
+
+    @Resolver("Query.dashboard", schema_name=schema_name)
+    @Resolver("Mutation.refresh", schema_name=schema_name)
+    async def resolve_dashboard(parent, args, ctx, info):
+        calls.append((info.field_name, args["id"]))
+        await asyncio.sleep(0.01)
+        return f"Dashboard #{args['id']}"
+
+    engine = await create_engine(_SDL, schema_name=schema_name, **kwargs)
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_query_coalescing(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    query = "query ($id: Int!) { dashboard(id: $id) }"
+    responses = await asyncio.gather(
+        *[
+            engine.execute(query, variables={"id": 1}, coalescing_key="a")
+            for _ in range(5)
+        ],
+        engine.execute(query, variables={"id": 2}, coalescing_key="a"),
+        engine.execute(query, variables={"id": 1}, coalescing_key="b"),
+        engine.execute(query, variables={"id": 1}),
+    )
+
+    assert responses == [
+        {"data": {"dashboard": "Dashboard #1"}},
+        {"data": {"dashboard": "Dashboard #1"}},
+        {"data": {"dashboard": "Dashboard #1"}},
+        {"data": {"dashboard": "Dashboard #1"}},
+        {"data": {"dashboard": "Dashboard #1"}},
+        {"data": {"dashboard": "Dashboard #2"}},
+        {"data": {"dashboard": "Dashboard #1"}},
+        {"data": {"dashboard": "Dashboard #1"}},
+    ]
+    # Each caller gets its own copy of the response
+    responses[0]["data"]["dashboard"] = None
+    assert responses[1] == {"data": {"dashboard": "Dashboard #1"}}
+    assert sorted(calls) == [
+        ("dashboard", 1),
+        ("dashboard", 1),
+        ("dashboard", 1),
+        ("dashboard", 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_query_coalescing_excludes_mutations(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    responses = await asyncio.gather(
+        *[
+            engine.execute("mutation { refresh(id: 1) }", coalescing_key="a")
+            for _ in range(3)
+        ]
+    )
+
+    assert responses == [{"data": {"refresh": "Dashboard #1"}}] * 3
+    assert calls == [("refresh", 1)] * 3
+
+
+@pytest.mark.asyncio
+async def test_query_coalescing_cancelled_caller(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    query = "{ dashboard(id: 1) }"
+    first = asyncio.ensure_future(engine.execute(query, coalescing_key="a"))
+    second = asyncio.ensure_future(engine.execute(query, coalescing_key="a"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == {"data": {"dashboard": "Dashboard #1"}}
+    assert first.cancelled()
+    assert calls == [("dashboard", 1)]
+
+
+@pytest.mark.asyncio
+async def test_query_coalescing_without_query_cache(random_schema_name):
+    engine, calls = await _create_engine(
+        random_schema_name, query_cache_decorator=None, normalize_queries=True
+    )
+
+    responses = await asyncio.gather(
+        engine.execute("{ dashboard(id: 1) }", coalescing_key="a"),
+        engine.execute("{\n  dashboard(id: 1)\n}", coalescing_key="a"),
+        engine.execute("{ dashboard(id: 1) }", coalescing_key="a"),
+    )
+
+    assert responses == [{"data": {"dashboard": "Dashboard #1"}}] * 3
+    assert calls == [("dashboard", 1)]
@@ -0,0 +1,284 @@
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+from tartiflette.caching import ResponseCache
+
+_SDL = """
+type Country {
+  id: Int!
+  name: String
+  population: Int @cached(ttl: 30)
+  favorite: Boolean @cached(ttl: 60, scope: PRIVATE)
+  neighbours: [Country]
+}
+
+type Query {
+  countries: [Country] @cached(ttl: 60)
+  country(id: Int!): Country @cached(ttl: 120)
+  uncached: String
+  failing: String @cached(ttl: 60)
+}
+
+type Mutation {
+  rename(id: Int!): Country @cached(ttl: 60)
+}
+"""
+
+
+async def _create_engine(schema_name, response_cache):
+    calls = []
+
+    @Resolver("Query.countries", schema_name=schema_name)
+    async def resolve_query_countries(parent, args, ctx, info):
+        return [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+
+    @Resolver("Query.country", schema_name=schema_name)
+    @Resolver("Mutation.rename", schema_name=schema_name)
+    async def resolve_query_country(parent, args, ctx, info):
+        return {"id": args["id"], "name": "A"}
+
+    @Resolver("Query.uncached", schema_name=schema_name)
+    async def resolve_query_uncached(parent, args, ctx, info):
+        calls.append("uncached")
+        return "uncached"
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    async def resolve_query_failing(parent, args, ctx, info):
+        calls.append("failing")
+        raise ValueError("Failing")
+
+    @Resolver("Country.name", schema_name=schema_name)
+    async def resolve_country_name(parent, args, ctx, info):
+        # Leaf fields without hint are neither cached nor restrict responses
+        calls.append(("name", parent["id"]))
+        return parent["name"]
+
+    @Resolver("Country.population", schema_name=schema_name)
+    async def resolve_country_population(parent, args, ctx, info):
+        return parent["id"] * 1000
+
+    @Resolver("Country.favorite", schema_name=schema_name)
+    async def resolve_country_favorite(parent, args, ctx, info):
+        return True
+
+    @Resolver("Country.neighbours", schema_name=schema_name)
+    async def resolve_country_neighbours(parent, args, ctx, info):
+        return [{"id": parent["id"] + 1, "name": "C"}]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        modules=["tartiflette.caching.directive"],
+        response_cache=response_cache,
+    )
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_response_cache_hits(random_schema_name):
+    engine, calls = await _create_engine(
+        random_schema_name,
+        ResponseCache(context_key=lambda ctx: ctx and ctx.get("tenant")),
+    )
+
+    expected = {
+        "data": {
+            "countries": [
+                {"id": 1, "name": "A", "population": 1000},
+                {"id": 2, "name": "B", "population": 2000},
+            ]
+        },
+        "extensions": {"cacheControl": {"maxAge": 30, "scope": "PUBLIC"}},
+    }
+    assert (
+        await engine.execute("{ countries { id name population } }")
+        == expected
+    )
+    # Queries only differing by their formatting share the same response
+    assert (
+        await engine.execute(
+            "{\n  countries {\n    id, name, population\n  }\n}"
+        )
+        == expected
+    )
+    assert calls == [("name", 1), ("name", 2)]
+
+    # The tenant is part of the key
+    assert (
+        await engine.execute(
+            "{ countries { id name population } }", context={"tenant": "a"}
+        )
+        == expected
+    )
+    assert calls == [("name", 1), ("name", 2)] * 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_variables(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name, ResponseCache())
+
+    query = "query ($id: Int!) { country(id: $id) { id name } }"
+    for _ in range(2):
+        for country_id in (1, 2):
+            assert await engine.execute(
+                query, variables={"id": country_id}
+            ) == {
+                "data": {"country": {"id": country_id, "name": "A"}},
+                "extensions": {
+                    "cacheControl": {"maxAge": 120, "scope": "PUBLIC"}
+                },
+            }
+    assert calls == [("name", 1), ("name", 2)]
+
+
+@pytest.mark.parametrize(
+    "query,cache_control,expected_calls",
+    [
+        # Root fields without hint
+        ("{ uncached }", {"maxAge": 0, "scope": "PUBLIC"}, 2),
+        # Composite fields without hint
+        (
+            "{ country(id: 1) { neighbours { name } } }",
+            {"maxAge": 0, "scope": "PUBLIC"},
+            2,
+        ),
+        # Private fields
+        (
+            "{ country(id: 1) { name favorite } }",
+            {"maxAge": 60, "scope": "PRIVATE"},
+            2,
+        ),
+        # Mutations
+        (
+            "mutation { rename(id: 1) { name } }",
+            {"maxAge": 60, "scope": "PUBLIC"},
+            2,
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_response_cache_uncacheable(
+    random_schema_name, query, cache_control, expected_calls
+):
+    engine, calls = await _create_engine(random_schema_name, ResponseCache())
+
+    for _ in range(2):
+        response = await engine.execute(query)
+        assert response["extensions"] == {"cacheControl": cache_control}
+    assert len(calls) == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_response_cache_errors(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name, ResponseCache())
+
+    for _ in range(2):
+        response = await engine.execute("{ failing }")
+        assert response["errors"][0]["message"] == "Failing"
+    assert calls == ["failing", "failing"]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_default_max_age(random_schema_name):
+    engine, calls = await _create_engine(
+        random_schema_name, ResponseCache(default_max_age=10)
+    )
+
+    for _ in range(2):
+        assert await engine.execute("{ uncached }") == {
+            "data": {"uncached": "uncached"},
+            "extensions": {"cacheControl": {"maxAge": 10, "scope": "PUBLIC"}},
+        }
+    assert calls == ["uncached"]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_disabled(random_schema_name):
+    engine, _ = await _create_engine(random_schema_name, None)
+
+    assert await engine.execute("{ country(id: 1) { id } }") == {
+        "data": {"country": {"id": 1}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_response_cache_copies(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name, ResponseCache())
+
+    query = "{ countries { id name } }"
+    response = await engine.execute(query)
+    response["data"]["countries"][0]["name"] = "Mutated"
+    response["extensions"]["cacheControl"]["maxAge"] = 0
+
+    # Neither the stored response nor the returned ones are shared
+    hit = await engine.execute(query)
+    assert hit == {
+        "data": {
+            "countries": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+        },
+        "extensions": {"cacheControl": {"maxAge": 60, "scope": "PUBLIC"}},
+    }
+    hit["data"]["countries"].clear()
+    assert (await engine.execute(query))["data"]["countries"] != []
+    assert calls == [("name", 1), ("name", 2)]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_schema_directives(random_schema_name):
+    @Directive("restricted", schema_name=random_schema_name)
+    class RestrictedDirective:
+        @staticmethod
+        async def on_schema_execution(
+            directive_args, next_directive, schema, document, *args
+        ):
+            context = args[2]
+            if not context["allowed"]:
+                raise ValueError("Forbidden")
+            response = await next_directive(schema, document, *args)
+            response["extensions"]["restricted"] = True
+            return response
+
+    @Resolver("Query.countries", schema_name=random_schema_name)
+    async def resolve_query_countries(parent, args, ctx, info):
+        ctx["calls"] += 1
+        return [{"id": 1}]
+
+    engine = await create_engine(
+        """
+        directive @restricted on SCHEMA
+
+        type Country {
+          id: Int!
+        }
+
+        type Query {
+          countries: [Country] @cached(ttl: 60)
+        }
+
+        schema @restricted {
+          query: Query
+        }
+        """,
+        schema_name=random_schema_name,
+        modules=["tartiflette.caching.directive"],
+        response_cache=ResponseCache(),
+    )
+
+    # Schema directives are applied to the cached responses too
+    context = {"allowed": True, "calls": 0}
+    for _ in range(2):
+        assert await engine.execute(
+            "{ countries { id } }", context=context
+        ) == {
+            "data": {"countries": [{"id": 1}]},
+            "extensions": {
+                "cacheControl": {"maxAge": 60, "scope": "PUBLIC"},
+                "restricted": True,
+            },
+        }
+    assert context["calls"] == 1
+
+    context["allowed"] = False
+    result = await engine.execute("{ countries { id } }", context=context)
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == "Forbidden"
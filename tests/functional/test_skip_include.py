@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+from tartiflette.execution import collect
+from tartiflette.types.exceptions.tartiflette import SkipCollection
+
+_SDL = """
+directive @hideFor(role: String!) on FIELD
+directive @upper on FIELD
+
+type Query {
+  a: String
+  b: String
+  c: String
+}
+"""
+
+
+async def _create_engine(schema_name):
+    @Resolver("Query.a", schema_name=schema_name)
+    @Resolver("Query.b", schema_name=schema_name)
+    @Resolver("Query.c", schema_name=schema_name)
+    async def resolve_query_field(parent, args, ctx, info):
+        return info.field_name
+
+    @Directive("hideFor", schema_name=schema_name)
+    class HideForDirective:
+        async def on_field_collection(
+            self,
+            directive_args: Dict[str, Any],
+            next_directive: Callable,
+            field_node: "FieldNode",
+            ctx: Optional[Any],
+        ) -> "FieldNode":
+            if ctx and ctx.get("role") == directive_args["role"]:
+                raise SkipCollection()
+            return await next_directive(field_node, ctx)
+
+    @Directive("upper", schema_name=schema_name)
+    class UpperDirective:
+        async def on_field_execution(
+            self,
+            directive_args: Dict[str, Any],
+            next_resolver: Callable,
+            parent: Optional[Any],
+            args: Dict[str, Any],
+            ctx: Optional[Any],
+            info: "ResolveInfo",
+        ) -> Any:
+            return (await next_resolver(parent, args, ctx, info)).upper()
+
+    return await create_engine(_SDL, schema_name=schema_name)
+
+
+@pytest.fixture
+def computed_directives(monkeypatch):
+    calls = []
+    compute_directive_nodes = collect.compute_directive_nodes
+
+    def counted_compute_directive_nodes(*args, **kwargs):
+        calls.append(args)
+        return compute_directive_nodes(*args, **kwargs)
+
+    monkeypatch.setattr(
+        collect, "compute_directive_nodes", counted_compute_directive_nodes
+    )
+    return calls
+
+
+@pytest.mark.parametrize(
+    "query,variables,expected",
+    [
+        (
+            "{ a @skip(if: true) b @skip(if: false) }",
+            None,
+            {"b": "b"},
+        ),
+        (
+            "{ a @include(if: true) b @include(if: false) }",
+            None,
+            {"a": "a"},
+        ),
+        (
+            "{ a @skip(if: false) @include(if: true) "
+            "b @skip(if: true) @include(if: true) "
+            "c @skip(if: false) @include(if: false) }",
+            None,
+            {"a": "a"},
+        ),
+        (
+            "query ($s: Boolean!, $i: Boolean = true) "
+            "{ a @skip(if: $s) b @include(if: $i) c @upper @include(if: $i) }",
+            {"s": True},
+            {"b": "b", "c": "C"},
+        ),
+        (
+            "query ($s: Boolean!, $i: Boolean = true) "
+            "{ a @skip(if: $s) b @include(if: $i) c @upper @include(if: $i) }",
+            {"s": False, "i": False},
+            {"a": "a"},
+        ),
+        (
+            "query ($s: Boolean!) { a ... @skip(if: $s) { b } ...C }"
+            "fragment C on Query { c @include(if: $s) }",
+            {"s": True},
+            {"a": "a", "c": "c"},
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_skip_include_native_evaluation(
+    random_schema_name, computed_directives, query, variables, expected
+):
+    engine = await _create_engine(random_schema_name)
+    assert await engine.execute(query, variables=variables) == {
+        "data": expected
+    }
+    # Built-in conditions don't go through the directive pipeline
+    assert not computed_directives
+
+
+@pytest.mark.asyncio
+async def test_skip_include_with_custom_collection_directive(
+    random_schema_name, computed_directives
+):
+    engine = await _create_engine(random_schema_name)
+    query = """
+    query ($i: Boolean!) {
+      a @include(if: $i) @hideFor(role: "guest")
+      b @hideFor(role: "admin") @skip(if: $i)
+      c @hideFor(role: "guest")
+    }
+    """
+
+    assert await engine.execute(
+        query, variables={"i": True}, context={"role": "guest"}
+    ) == {"data": {}}
+    assert await engine.execute(
+        query, variables={"i": False}, context={"role": "guest"}
+    ) == {"data": {"b": "b"}}
+    assert await engine.execute(
+        query, variables={"i": True}, context={"role": "admin"}
+    ) == {"data": {"a": "a", "c": "c"}}
+    # Only the nodes which aren't skipped by a built-in condition go through
+    # the directive pipeline
+    assert len(computed_directives) == 6
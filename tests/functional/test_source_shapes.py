@@ -0,0 +1,238 @@
+from collections import namedtuple
+from dataclasses import dataclass
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import GraphQLSchemaError
+
+_SDL = """
+type Author {
+  name: String
+  country: String
+}
+
+type Book {
+  title: String
+  year: Int
+  author: Author
+}
+
+type Review {
+  stars: Int
+  comment: String
+  book: Book
+}
+
+type Query {
+  reviews: [Review]
+  point: Point
+}
+
+type Point {
+  x: Int
+  y: Int
+  label: String
+}
+"""
+
+
+@dataclass
+class Author:
+    name: str
+
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+async def _create_engine(schema_name, source_shapes):
+    @Resolver("Query.reviews", schema_name=schema_name)
+    async def resolve_query_reviews(parent, args, ctx, info):
+        return [
+            (5, "Great", {"title": "Dune", "author": Author("Herbert")}),
+            (4, None, {"title": "Emma", "year": 1815}),
+        ]
+
+    @Resolver("Query.point", schema_name=schema_name)
+    async def resolve_query_point(parent, args, ctx, info):
+        return Point(1, 2)
+
+    @Resolver("Point.label", schema_name=schema_name)
+    def resolve_point_label(parent, args, ctx, info):
+        return f"({parent.x}, {parent.y})"
+
+    return await create_engine(
+        _SDL, schema_name=schema_name, source_shapes=source_shapes
+    )
+
+
+@pytest.mark.asyncio
+async def test_source_shapes(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name,
+        {
+            "Review": ("stars", "comment", "book"),
+            "Book": "mapping",
+            "Author": "dataclass",
+            "Point": "object",
+        },
+    )
+
+    assert (
+        await engine.execute(
+            """
+        {
+          reviews {
+            stars comment book { title year author { name country } }
+          }
+          point { x y label }
+        }
+        """
+        )
+        == {
+            "data": {
+                "reviews": [
+                    {
+                        "stars": 5,
+                        "comment": "Great",
+                        "book": {
+                            "title": "Dune",
+                            "year": None,
+                            "author": {"name": "Herbert", "country": None},
+                        },
+                    },
+                    {
+                        "stars": 4,
+                        "comment": None,
+                        "book": {
+                            "title": "Emma",
+                            "year": 1815,
+                            "author": None,
+                        },
+                    },
+                ],
+                "point": {"x": 1, "y": 2, "label": "(1, 2)"},
+            }
+        }
+    )
+
+    schema = engine._schema
+    assert schema.get_field_by_name("Book.title").sync_resolver is not None
+    assert schema.get_field_by_name("Review.stars").sync_resolver is not None
+    # Decorated fields & fields without shape keep their resolver
+    assert (
+        schema.get_field_by_name("Point.label").sync_resolver.__name__
+        == "resolve_point_label"
+    )
+    assert schema.get_field_by_name("Query.point").sync_resolver is None
+
+
+@pytest.mark.parametrize(
+    "source_shapes,query,expected",
+    [
+        (
+            {"Review": "mapping", "Point": "mapping"},
+            "{ point { x } reviews { stars } }",
+            {
+                "point": {"x": None},
+                "reviews": [{"stars": None}, {"stars": None}],
+            },
+        ),
+        (
+            {
+                "Review": ("stars", "comment", "book"),
+                "Book": ("title", "year", "author"),
+            },
+            "{ reviews { book { title } } }",
+            {
+                "reviews": [
+                    {"book": {"title": None}},
+                    {"book": {"title": None}},
+                ]
+            },
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_source_shapes_wrong_shape(
+    random_schema_name, source_shapes, query, expected
+):
+    engine = await _create_engine(random_schema_name, source_shapes)
+
+    # Values which don't match their shape resolve to null like with the
+    # default resolver
+    assert await engine.execute(query) == {"data": expected}
+
+
+@pytest.mark.parametrize(
+    "source_shapes,message",
+    [
+        (
+            {"Unknown": "mapping"},
+            "Source shape defined for < Unknown > which isn't an object type.",
+        ),
+        (
+            {"Book": "tuple"},
+            "Source shape < tuple > of type < Book > should be one of "
+            "mapping, object, dataclass or a sequence of field names.",
+        ),
+        (
+            {"Book": ("title", "isbn")},
+            "Source shape of type < Book > refers to the unknown field "
+            "< isbn >.",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_source_shapes_invalid(
+    random_schema_name, source_shapes, message
+):
+    with pytest.raises(GraphQLSchemaError) as excinfo:
+        await _create_engine(random_schema_name, source_shapes)
+    assert message in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_source_shapes_without_resolve_info(
+    random_schema_name, monkeypatch
+):
+    from tartiflette.resolver import factory
+
+    infos = []
+    build_resolve_info = factory.build_resolve_info
+
+    def spy_build_resolve_info(execution_context, field_definition, *args):
+        infos.append(field_definition.name)
+        return build_resolve_info(execution_context, field_definition, *args)
+
+    monkeypatch.setattr(factory, "build_resolve_info", spy_build_resolve_info)
+
+    engine = await _create_engine(
+        random_schema_name,
+        {"Review": ("stars", "comment", "book"), "Point": "object"},
+    )
+
+    assert await engine.execute("{ reviews { stars comment } point { x } }")
+    assert infos == ["reviews", "point"]
+
+    # Fields with directives are resolved with their ResolveInfo
+    infos.clear()
+    result = await engine.execute(
+        "query ($skip: Boolean!) { point { x @skip(if: $skip) y label } }",
+        variables={"skip": False},
+    )
+    assert result == {"data": {"point": {"x": 1, "y": 2, "label": "(1, 2)"}}}
+    assert infos == ["point", "x", "label"]
+
+
+@pytest.mark.asyncio
+async def test_source_shapes_without_resolve_info_error(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name, {"Review": ("comment", "stars", "book")}
+    )
+
+    result = await engine.execute("{ reviews { stars } }")
+    assert result["data"] == {"reviews": [{"stars": None}, {"stars": None}]}
+    assert [error["path"] for error in result["errors"]] == [
+        ["reviews", 0, "stars"]
+    ]
@@ -0,0 +1,130 @@
+from functools import partial
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+directive @upper on FIELD_DEFINITION | FIELD
+
+type Dog {
+  name: String
+  nickname: String @upper
+  owner: Human
+}
+
+type Human {
+  name: String
+}
+
+union Pet = Dog | Human
+
+type Query {
+  dog: Dog
+  pet: Pet
+  failing: String
+  awaited: String
+  awaitedUpper: String @upper
+}
+"""
+
+
+async def _create_engine(schema_name):
+    @Directive("upper", schema_name=schema_name)
+    class UpperDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return (await next_resolver(parent, args, ctx, info)).upper()
+
+    @Resolver("Query.dog", schema_name=schema_name)
+    @Resolver(
+        "Query.pet",
+        schema_name=schema_name,
+        type_resolver=lambda result, *_: "Dog",
+    )
+    def resolve_query_dog(parent, args, ctx, info):
+        return {"name": "Doggo", "owner": {"name": "Hooman"}}
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    def resolve_query_failing(parent, args, ctx, info):
+        raise ValueError("Failing")
+
+    async def resolve_awaited(value, parent, args, ctx, info):
+        return value
+
+    Resolver("Query.awaited", schema_name=schema_name)(
+        partial(resolve_awaited, "awaited")
+    )
+    Resolver("Query.awaitedUpper", schema_name=schema_name)(
+        lambda parent, args, ctx, info: resolve_awaited(
+            "awaited", parent, args, ctx, info
+        )
+    )
+
+    @Resolver("Dog.name", schema_name=schema_name)
+    @Resolver("Dog.nickname", schema_name=schema_name)
+    @Resolver("Human.name", schema_name=schema_name)
+    def resolve_name(parent, args, ctx, info):
+        return parent["name"]
+
+    return await create_engine(_SDL, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    assert await engine.execute(
+        "{ dog { name owner { name } } pet { ... on Dog { name } } }"
+    ) == {
+        "data": {
+            "dog": {"name": "Doggo", "owner": {"name": "Hooman"}},
+            "pet": {"name": "Doggo"},
+        }
+    }
+
+    schema = engine._schema
+    assert schema.get_field_by_name("Dog.name").sync_resolver is not None
+    assert (
+        schema.get_field_by_name("Dog.name").resolver.keywords["resolver"]
+        is schema.get_field_by_name("Dog.name").sync_resolver
+    )
+    # Fields wrapped by an execution directive aren't called inline
+    assert schema.get_field_by_name("Dog.nickname").sync_resolver is None
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers_with_directives(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    assert await engine.execute(
+        "{ dog { nickname name @upper owner @skip(if: true) { name } } }"
+    ) == {"data": {"dog": {"nickname": "DOGGO", "name": "DOGGO"}}}
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers_error(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    assert await engine.execute("{ failing }") == {
+        "data": {"failing": None},
+        "errors": [
+            {
+                "message": "Failing",
+                "path": ["failing"],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers_returning_awaitables(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    assert await engine.execute("{ awaited awaitedUpper }") == {
+        "data": {"awaited": "awaited", "awaitedUpper": "AWAITED"}
+    }
+    assert engine._schema.get_field_by_name("Query.awaited").sync_resolver
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  slowName: String @timeout(ms: 200)
+}
+
+type Query {
+  fast: String
+  slow: String
+  items: [Item]
+  required: String!
+  budget: Float @timeout(ms: 500)
+}
+"""
+
+
+async def _create_engine(schema_name):
+    calls = []
+
+    async def wait(name, seconds):
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            calls.append(("cancelled", name))
+            raise
+        calls.append(("done", name))
+
+    @Resolver("Query.fast", schema_name=schema_name)
+    async def resolve_query_fast(parent, args, ctx, info):
+        return "fast"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    @Resolver("Query.required", schema_name=schema_name)
+    async def resolve_query_slow(parent, args, ctx, info):
+        await wait(info.field_name, 1)
+        return "slow"
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": 1}, {"id": 2}]
+
+    @Resolver("Query.budget", schema_name=schema_name)
+    async def resolve_query_budget(parent, args, ctx, info):
+        return info.remaining_time
+
+    @Resolver("Item.name", schema_name=schema_name)
+    def resolve_item_name(parent, args, ctx, info):
+        return f"Item #{parent['id']}"
+
+    @Resolver("Item.slowName", schema_name=schema_name)
+    async def resolve_item_slow_name(parent, args, ctx, info):
+        await wait(parent["id"], 1 if parent["id"] == 2 else 0)
+        return f"Item #{parent['id']}"
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        modules=["tartiflette.directive.timeout"],
+    )
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_timeout_execution(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    assert await engine.execute(
+        "{ fast slow items { name } }", timeout=0.2
+    ) == {
+        "data": {
+            "fast": "fast",
+            "slow": None,
+            "items": [{"name": "Item #1"}, {"name": "Item #2"}],
+        },
+        "errors": [
+            {
+                "message": "Execution deadline exceeded.",
+                "path": ["slow"],
+                "locations": [{"line": 1, "column": 8}],
+            }
+        ],
+    }
+    assert calls == [("cancelled", "slow")]
+
+
+@pytest.mark.asyncio
+async def test_timeout_execution_non_null(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    assert await engine.execute("{ fast required }", timeout=0.2) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Execution deadline exceeded.",
+                "path": ["required"],
+                "locations": [{"line": 1, "column": 8}],
+            }
+        ],
+    }
+    assert calls == [("cancelled", "required")]
+
+
+@pytest.mark.asyncio
+async def test_timeout_execution_expired(random_schema_name):
+    engine, _ = await _create_engine(random_schema_name)
+
+    # Resolvers called once the deadline has expired fail right away
+    result = await engine.execute("{ fast items { name } }", timeout=0)
+    assert result["data"] == {"fast": None, "items": None}
+    assert sorted(error["path"] for error in result["errors"]) == [
+        ["fast"],
+        ["items"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeout_directive(random_schema_name):
+    engine, calls = await _create_engine(random_schema_name)
+
+    assert await engine.execute("{ items { slowName } }") == {
+        "data": {"items": [{"slowName": "Item #1"}, {"slowName": None}]},
+        "errors": [
+            {
+                "message": "Timeout of < 200 > ms exceeded.",
+                "path": ["items", 1, "slowName"],
+                "locations": [{"line": 1, "column": 11}],
+            }
+        ],
+    }
+    assert calls == [("done", 1), ("cancelled", 2)]
+
+
+@pytest.mark.asyncio
+async def test_timeout_remaining_time(random_schema_name):
+    engine, _ = await _create_engine(random_schema_name)
+
+    result = await engine.execute("{ budget }")
+    assert 0.4 < result["data"]["budget"] <= 0.5
+
+    # The execution deadline expires before the field one
+    result = await engine.execute("{ budget }", timeout=0.1)
+    assert 0 < result["data"]["budget"] <= 0.1
+
+    result = await engine.execute("{ budget }", timeout=10)
+    assert 0.4 < result["data"]["budget"] <= 0.5
@@ -0,0 +1,210 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.caching import ResponseCache
+from tartiflette.tracing import Tracing
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+}
+
+type Query {
+  items: [Item!]
+  slow: String
+}
+"""
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": 1, "name": "One"}, {"id": 2, "name": "Two"}]
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    async def resolve_query_slow(parent, args, ctx, info):
+        await asyncio.sleep(0.01)
+        return "Slow"
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_tracing(random_schema_name):
+    engine = await _create_engine(random_schema_name, tracing=Tracing())
+
+    response = await engine.execute("{ items { id name } slow }")
+    assert response["data"] == {
+        "items": [{"id": 1, "name": "One"}, {"id": 2, "name": "Two"}],
+        "slow": "Slow",
+    }
+
+    trace = response["extensions"]["tracing"]
+    assert trace["version"] == 1
+    assert trace["startTime"].endswith("Z")
+    assert trace["endTime"] >= trace["startTime"]
+    assert trace["parsing"]["startOffset"] >= 0
+    assert "validation" not in trace
+    assert (
+        trace["execution"]["startOffset"] + trace["execution"]["duration"]
+        <= trace["duration"]
+    )
+
+    resolvers = {
+        tuple(resolver["path"]): resolver
+        for resolver in trace["execution"]["resolvers"]
+    }
+    assert sorted(resolvers) == [
+        ("items",),
+        ("items", 0, "id"),
+        ("items", 0, "name"),
+        ("items", 1, "id"),
+        ("items", 1, "name"),
+        ("slow",),
+    ]
+    assert {
+        key: value
+        for key, value in resolvers[("items", 1, "id")].items()
+        if key not in ("startOffset", "duration")
+    } == {
+        "path": ["items", 1, "id"],
+        "parentType": "Item",
+        "fieldName": "id",
+        "returnType": "Int!",
+    }
+    assert resolvers[("items",)]["returnType"] == "[Item!]"
+    assert resolvers[("slow",)]["duration"] >= 10_000_000
+    assert resolvers[("items", 0, "id")]["startOffset"] >= (
+        resolvers[("items",)]["startOffset"]
+        + resolvers[("items",)]["duration"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_tracing_sink(random_schema_name):
+    traces = []
+
+    async def sink(trace):
+        traces.append(trace)
+
+    engine = await _create_engine(
+        random_schema_name, tracing=Tracing(sink=sink)
+    )
+
+    assert await engine.execute("{ slow }") == {"data": {"slow": "Slow"}}
+    assert len(traces) == 1
+    assert [
+        resolver["path"] for resolver in traces[0]["execution"]["resolvers"]
+    ] == [["slow"]]
+
+
+@pytest.mark.asyncio
+async def test_tracing_buffer_size(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name, tracing=Tracing(buffer_size=1)
+    )
+
+    response = await engine.execute("{ items { id name } slow }")
+    # The buffers grow when the execution calls more resolvers
+    assert sorted(
+        tuple(resolver["path"])
+        for resolver in response["extensions"]["tracing"]["execution"][
+            "resolvers"
+        ]
+    ) == [
+        ("items",),
+        ("items", 0, "id"),
+        ("items", 0, "name"),
+        ("items", 1, "id"),
+        ("items", 1, "name"),
+        ("slow",),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tracing_sink_error(random_schema_name, caplog):
+    def sink(trace):
+        raise ValueError("Unavailable")
+
+    engine = await _create_engine(
+        random_schema_name, tracing=Tracing(sink=sink)
+    )
+
+    assert await engine.execute("{ slow }") == {"data": {"slow": "Slow"}}
+    assert "Tracing sink" in caplog.text
+
+
+@pytest.mark.parametrize("sample_rate,traced", [(0.0, False), (1.0, True)])
+@pytest.mark.asyncio
+async def test_tracing_sample_rate(random_schema_name, sample_rate, traced):
+    engine = await _create_engine(
+        random_schema_name, tracing=Tracing(sample_rate=sample_rate)
+    )
+
+    response = await engine.execute("{ slow }")
+    assert ("extensions" in response) is traced
+
+
+@pytest.mark.asyncio
+async def test_tracing_errors(random_schema_name):
+    engine = await _create_engine(random_schema_name, tracing=Tracing())
+
+    response = await engine.execute("{ unknown }")
+    assert len(response["errors"]) == 1
+    trace = response["extensions"]["tracing"]
+    assert trace["parsing"]["duration"] > 0
+    assert trace["execution"] == {"resolvers": []}
+
+
+@pytest.mark.asyncio
+async def test_tracing_response_cache(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name,
+        tracing=Tracing(),
+        response_cache=ResponseCache(default_max_age=60),
+    )
+
+    first = await engine.execute("{ slow }")
+    second = await engine.execute("{ slow }")
+    assert first["extensions"]["cacheControl"] == (
+        second["extensions"]["cacheControl"]
+    )
+    # The cached response doesn't carry the trace of the first execution
+    assert first["extensions"]["tracing"]["execution"]["resolvers"]
+    assert second["extensions"]["tracing"]["execution"] == {"resolvers": []}
+
+
+@pytest.mark.asyncio
+async def test_tracing_source_shapes(random_schema_name):
+    @Resolver("Query.books", schema_name=random_schema_name)
+    async def resolve_query_books(parent, args, ctx, info):
+        return [{"id": 1, "title": "Dune"}]
+
+    engine = await create_engine(
+        """
+        type Book {
+          id: Int!
+          title: String
+        }
+
+        type Query {
+          books: [Book]
+        }
+        """,
+        schema_name=random_schema_name,
+        source_shapes={"Book": "mapping"},
+        tracing=Tracing(),
+    )
+
+    response = await engine.execute("{ books { id title } }")
+    assert response["data"] == {"books": [{"id": 1, "title": "Dune"}]}
+    # Fields resolved by a compiled getter are traced as well
+    assert [
+        resolver["path"]
+        for resolver in response["extensions"]["tracing"]["execution"][
+            "resolvers"
+        ]
+    ] == [["books"], ["books", 0, "id"], ["books", 0, "title"]]
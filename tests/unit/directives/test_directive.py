@@ -68,3 +68,6 @@ def test_directive_bake(clean_registry):
 
     assert a_directive.bake(schema) is None
     assert isinstance(directive_internal.implementation, dontcare)
+    assert directive_internal.callables == {
+        "on_field_execution": directive_internal.implementation.on_field_execution
+    }
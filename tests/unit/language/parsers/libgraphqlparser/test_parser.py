@@ -1,7 +1,10 @@
+import json
+
 from unittest.mock import Mock
 
 import pytest
 
+from tartiflette import create_engine
 from tartiflette.language.ast import (
     ArgumentNode,
     BooleanValueNode,
@@ -33,6 +36,7 @@ from tartiflette.language.parsers.libgraphqlparser import parse_to_document
 from tartiflette.language.parsers.libgraphqlparser.parser import (
     ParsedData,
     _parse_context_manager,
+    _parse_to_ast,
     _parse_to_json_ast,
 )
 from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
@@ -80,6 +84,91 @@ def test_parse_to_json_ast(query, expected):
     assert _parse_to_json_ast(query) == expected
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ a { a1 a2 } }",
+        b"{ a { a1 a2 } }",
+        "{ a { a1 a2 } }\x00",
+        """
+        query Operation($a: [Int!] = [1, 2], $b: String!) @aDirective {
+          alias: field(
+            input: {a: $a, b: null, c: ENUM, d: true, e: 1.5, f: "str"}
+            list: [[1], [null], []]
+          ) @include(if: $b) {
+            ... on Type @skip(if: false) { inlined }
+            ... @include(if: true) { untyped }
+            ...Fragment @skip(if: $b)
+          }
+        }
+
+        mutation { mutate(a: "\\"escaped\\"\\n") }
+
+        subscription Subscription { subscribe }
+
+        fragment Fragment on Type @aDirective { fragmented }
+        """,
+        """
+        query Invalid($a: Int, $a: Type) {
+          unknown(a: 1, a: 2) @skip @skip { a }
+          field(input: {b: 1, b: "2", z: $undefined}) { ...Missing }
+          ... on Unknown { a }
+        }
+
+        fragment Unused on Query { a { inlined } }
+
+        fragment Cycle on Type { ...Cycle }
+        """,
+    ],
+)
+@pytest.mark.asyncio
+async def test_parse_to_ast(query, clean_registry):
+    engine = await create_engine(
+        """
+        directive @aDirective on QUERY | FIELD | FRAGMENT_DEFINITION
+
+        enum Enum { ENUM }
+
+        input Input { a: [Int!] b: String c: Enum d: Boolean e: Float }
+
+        type Type { inlined: String untyped: String fragmented: String }
+
+        type Query {
+          a: Type
+          field(input: Input, list: [[Int]]): Type
+        }
+
+        type Mutation { mutate(a: String): String }
+
+        type Subscription { subscribe: String }
+        """,
+        schema_name="test_parse_to_ast",
+    )
+    schema = engine._schema
+
+    document = _parse_to_ast(query)
+    assert isinstance(document, DocumentNode)
+
+    ast_document = parse_to_document(query, schema)
+    schema.query_parser_mode = "json"
+    json_document = parse_to_document(query, schema)
+
+    # Both modes build the same document & collect the same errors
+    assert ast_document == json_document
+    assert ast_document.definitions == sorted(
+        document.definitions,
+        key=lambda definition: isinstance(definition, OperationDefinitionNode),
+    )
+    assert [
+        error.coerce_value() for error in ast_document.validators.errors
+    ] == [error.coerce_value() for error in json_document.validators.errors]
+
+
+def test_parse_to_ast_error():
+    with pytest.raises(GraphQLSyntaxError):
+        _parse_to_ast("{ a { }")
+
+
 @pytest.mark.skip(
     reason="Should be unskipped when a better validation "
     "system which doesn't alter the DocumentNode will "
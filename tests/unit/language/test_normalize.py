@@ -0,0 +1,53 @@
+import pytest
+
+from tartiflette.language.normalize import normalize_query
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("{ a { b } }", "{a{b}}"),
+        (b"{ a { b } }", "{a{b}}"),
+        ("\ufeff{ a }", "{a}"),
+        (
+            """
+            query Query($a: Int = 1, $b: [String!]!) @aDirective {
+              # A comment with a "string"
+              alias: field(a: $a, b: -1.5e+3, c: ENUM, d: [1, 2]) {
+                ... on Type { inlined }
+                ...Fragment
+              }
+            }
+            """,
+            "query Query($a:Int=1$b:[String!]!)@aDirective{alias:field("
+            "a:$a b:-1.5e+3 c:ENUM d:[1 2]){... on Type{inlined}...Fragment}}",
+        ),
+        (
+            '{ a(s: "a , # b", t: ["a" "b"], u: """ c\n \\""" " """) }',
+            '{a(s:"a , # b" t:["a" "b"]u:""" c\n \\""" " """)}',
+        ),
+        ('{ a(s: "", t: "") }', '{a(s:"" t:"")}'),
+        # Queries which can't be tokenized are left untouched
+        ('{ a(s: "abc  ) }', '{ a(s: "abc  ) }'),
+        ('{ a(s: """abc  ) }', '{ a(s: """abc  ) }'),
+        (b"{ a \xff }", b"{ a \xff }"),
+        ("{ a \x00 }", "{ a \x00 }"),
+    ],
+)
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ a b }",
+        "{ a(x: 1 y: 2) }",
+        "{ ... on T { a } }",
+        "{ a(x: 1, y: 2.5) @skip(if: true) }",
+        '{ a(s: "" t: "") }',
+    ],
+)
+def test_normalize_query_is_idempotent(query):
+    normalized_query = normalize_query(query)
+    assert normalize_query(normalized_query) == normalized_query
@@ -0,0 +1,71 @@
+from array import array
+
+import pytest
+
+from tartiflette.scalar.builtins.boolean import ScalarBoolean
+from tartiflette.scalar.builtins.float import ScalarFloat
+from tartiflette.scalar.builtins.int import ScalarInt
+from tartiflette.scalar.builtins.string import ScalarString
+
+
+@pytest.mark.parametrize(
+    "scalar,values",
+    [
+        (ScalarBoolean(), [True, False, None, 0, 1.5]),
+        (ScalarFloat(), [1.5, None, 3, "4.5", True]),
+        (ScalarInt(), [1, None, "2", 3.0, False]),
+        (ScalarString(), ["a", None, 1, True, 2.5]),
+    ],
+)
+def test_scalar_coerce_output_many(scalar, values):
+    assert scalar.coerce_output_many(values) == [
+        None if value is None else scalar.coerce_output(value)
+        for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    "scalar,values",
+    [
+        (ScalarBoolean(), [True, "true"]),
+        (ScalarFloat(), [1.5, float("inf")]),
+        (ScalarInt(), [1, 2**31]),
+    ],
+)
+def test_scalar_coerce_output_many_error(scalar, values):
+    with pytest.raises(TypeError):
+        scalar.coerce_output_many(values)
+
+
+@pytest.mark.parametrize(
+    "scalar,values",
+    [
+        (ScalarBoolean(), array("b", [0, 1])),
+        (ScalarFloat(), array("d", [1.5, -2.5])),
+        (ScalarFloat(), array("q", [1, -2])),
+        (ScalarInt(), array("b", [1, -2])),
+        (ScalarInt(), array("I", [1, 2**31 - 1])),
+        (ScalarInt(), array("q", [])),
+        (ScalarInt(), array("d", [1.0, 2.0])),
+        (ScalarString(), array("i", [1, 2])),
+    ],
+)
+def test_scalar_coerce_output_many_buffer(scalar, values):
+    coerced_values = scalar.coerce_output_many(memoryview(values))
+    assert coerced_values == [scalar.coerce_output(value) for value in values]
+    assert [type(value) for value in coerced_values] == [
+        type(scalar.coerce_output(value)) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    "scalar,values",
+    [
+        (ScalarFloat(), array("f", [1.5, float("nan")])),
+        (ScalarInt(), array("I", [1, 2**31])),
+        (ScalarInt(), array("q", [-(2**31) - 1])),
+    ],
+)
+def test_scalar_coerce_output_many_buffer_error(scalar, values):
+    with pytest.raises(TypeError):
+        scalar.coerce_output_many(memoryview(values))
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from tartiflette.execution.scheduler import BatchScheduler
+
+
+@pytest.mark.asyncio
+async def test_batch_scheduler_close():
+    scheduler = BatchScheduler()
+    events = []
+
+    async def dispatch():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0)
+            events.append("cancelled")
+            raise
+
+    task = scheduler.create_task(dispatch())
+    scheduler.schedule(lambda: events.append("flushed"))
+    scheduler.entry_added()
+    await asyncio.sleep(0)
+
+    # Running dispatches are done once closed, pending batches are dropped
+    await scheduler.close()
+    assert task.cancelled()
+    assert events == ["cancelled"]
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert events == ["cancelled"]
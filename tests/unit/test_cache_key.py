@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+from datetime import date
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from tartiflette.caching.base import compute_key_digest
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+def test_compute_key_digest():
+    key = [
+        {"b": {"x", "y", "z"}, "a": (1, 2.5, None)},
+        _Color.RED,
+        UUID(int=1),
+        date(2020, 1, 1),
+    ]
+    assert compute_key_digest(key) == compute_key_digest(
+        [
+            {"a": [1, 2.5, None], "b": {"z", "y", "x"}},
+            "red",
+            "00000000-0000-0000-0000-000000000001",
+            "2020-01-01",
+        ]
+    )
+    assert compute_key_digest(key) != compute_key_digest([])
+
+
+def test_compute_key_digest_across_processes():
+    # Sets of strings are iterated in a different order in each process
+    code = (
+        "from tartiflette.caching.base import compute_key_digest;"
+        "print(compute_key_digest({'%s' % i for i in range(100)}))"
+    )
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        for _ in range(3)
+    }
+    assert len(digests) == 1
+
+
+@pytest.mark.parametrize("value", [object(), {object(): 1}, b"bytes"])
+def test_compute_key_digest_unsupported_values(value):
+    with pytest.raises(TypeError):
+        compute_key_digest([value])
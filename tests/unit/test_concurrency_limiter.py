@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from tartiflette.execution.limiter import ConcurrencyLimiter, run_limited
+
+
+def _create_call(calls, name, release):
+    async def call():
+        calls.append(name)
+        await release.wait()
+        return name
+
+    return call
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_fifo():
+    limiter = ConcurrencyLimiter(2)
+    release = asyncio.Event()
+    calls = []
+
+    tasks = [
+        asyncio.ensure_future(
+            run_limited([limiter], _create_call(calls, index, release))
+        )
+        for index in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert calls == [0, 1]
+    assert limiter.in_flight == 2
+    assert len(limiter) == 3
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [0, 1, 2, 3, 4]
+    # Waiting calls are served in their arrival order
+    assert calls == [0, 1, 2, 3, 4]
+    assert limiter.in_flight == 0
+    assert len(limiter) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_no_barging():
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # The released slot is handed over to the waiting call, not taken by a
+    # new one
+    limiter.release()
+    late = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert waiter.done()
+    assert not late.done()
+
+    limiter.release()
+    await late
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_cancelled_waiter():
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire()
+
+    cancelled = asyncio.ensure_future(limiter.acquire())
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert len(limiter) == 1
+
+    limiter.release()
+    await waiter
+    assert limiter.in_flight == 1
+
+    # A slot handed over to a cancelled call is handed over again
+    handed_over = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release()
+    handed_over.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await handed_over
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_run_limited_releases_on_error():
+    first = ConcurrencyLimiter(1)
+    second = ConcurrencyLimiter(1)
+
+    async def failing():
+        raise ValueError("Failing")
+
+    with pytest.raises(ValueError):
+        await run_limited([first, second], failing)
+    assert first.in_flight == 0
+    assert second.in_flight == 0
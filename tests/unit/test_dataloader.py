@@ -0,0 +1,206 @@
+import asyncio
+
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from tartiflette.dataloader import DataLoader, get_dataloader
+
+
+async def _load_values(keys):
+    return keys
+
+
+def _create_loader(**kwargs):
+    calls = []
+
+    async def batch_load_fn(keys):
+        calls.append(list(keys))
+        return [
+            ValueError(f"Invalid key {key}") if key < 0 else key * 10
+            for key in keys
+        ]
+
+    return DataLoader(batch_load_fn, **kwargs), calls
+
+
+async def _load_later(loader, key, iterations):
+    for _ in range(iterations):
+        await asyncio.sleep(0)
+    return await loader.load(key)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_concurrent_loads():
+    loader, calls = _create_loader()
+
+    assert await asyncio.gather(
+        loader.load(1),
+        _load_later(loader, 2, 1),
+        _load_later(loader, 3, 2),
+        loader.load_many([4, 1]),
+    ) == [10, 20, 30, [40, 10]]
+    assert calls == [[1, 4, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cache():
+    loader, calls = _create_loader()
+
+    assert await loader.load_many([1, 2]) == [10, 20]
+    assert await loader.load_many([2, 3]) == [20, 30]
+    assert calls == [[1, 2], [3]]
+
+    loader.clear(2)
+    loader.prime(4, 400)
+    assert await loader.load_many([2, 3, 4]) == [20, 30, 400]
+    assert calls == [[1, 2], [3], [2]]
+
+    loader.clear_all()
+    assert await loader.load(1) == 10
+    assert calls == [[1, 2], [3], [2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_without_cache():
+    loader, calls = _create_loader(cache=False)
+
+    assert await loader.load_many([1, 1, 2]) == [10, 10, 20]
+    assert await loader.load(1) == 10
+    assert calls == [[1, 2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cache_key_fn():
+    calls = []
+
+    async def batch_load_fn(keys):
+        calls.append(keys)
+        return [key["id"] for key in keys]
+
+    loader = DataLoader(batch_load_fn, cache_key_fn=lambda key: key["id"])
+    assert await loader.load_many([{"id": 1}, {"id": 1}, {"id": 2}]) == [
+        1,
+        1,
+        2,
+    ]
+    assert calls == [[{"id": 1}, {"id": 2}]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_max_batch_size():
+    loader, calls = _create_loader(max_batch_size=2)
+
+    assert await loader.load_many(range(5)) == [0, 10, 20, 30, 40]
+    assert calls == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_errors():
+    loader, calls = _create_loader()
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(-1), return_exceptions=True
+    )
+    assert results[0] == 10
+    assert str(results[1]) == "Invalid key -1"
+
+    # Failed keys aren't cached
+    with pytest.raises(ValueError):
+        await loader.load(-1)
+    assert calls == [[1, -1], [-1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_invalid_values():
+    async def batch_load_fn(keys):
+        return [1]
+
+    loader = DataLoader(batch_load_fn)
+    results = await asyncio.gather(
+        loader.load(1), loader.load(2), return_exceptions=True
+    )
+    assert all(isinstance(result, TypeError) for result in results)
+    assert results[0] is not results[1]
+    assert str(results[0]) == (
+        "DataLoader batch load function should return a list of 2 values, "
+        "got < [1] >."
+    )
+
+
+def test_dataloader_invalid_max_batch_size():
+    with pytest.raises(ValueError):
+        DataLoader(lambda keys: keys, max_batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cancelled_loads():
+    loader, calls = _create_loader()
+
+    # Keys whose every loader has been cancelled aren't loaded
+    cancelled = asyncio.ensure_future(loader.load(1))
+    loaded = asyncio.ensure_future(loader.load(2))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await loaded == 20
+    assert calls == [[2]]
+
+    # Cancelled values aren't cached
+    assert await loader.load(1) == 10
+    assert calls == [[2], [1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cancelled_shared_load():
+    loader, calls = _create_loader()
+
+    # Cancelling a load doesn't cancel the other loads of the same key
+    cancelled = loader.load(1)
+    loaded = loader.load(1)
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await loaded == 10
+    assert calls == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_cancelled_dispatch():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def batch_load_fn(keys):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return keys
+
+    loader = DataLoader(batch_load_fn)
+    tasks = [asyncio.ensure_future(loader.load(key)) for key in (1, 2)]
+    await started.wait()
+
+    # The dispatch is cancelled once nobody waits for its values
+    tasks[0].cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+    tasks[1].cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+def test_get_dataloader():
+    info = Mock(execution_context=Mock(dataloaders={}))
+
+    loader = get_dataloader(info, _load_values)
+    assert get_dataloader(info, _load_values) is loader
+    assert get_dataloader(info, _load_values, name="values") is not loader
+
+    # Functions created at each call are only identified by a name
+    for batch_load_fn in (lambda keys: keys, partial(_load_values)):
+        with pytest.raises(ValueError):
+            get_dataloader(info, batch_load_fn)
+        assert get_dataloader(info, batch_load_fn, name="values") is (
+            get_dataloader(info, _load_values, name="values")
+        )
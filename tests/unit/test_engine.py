@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 import pytest
 
@@ -323,3 +324,36 @@ async def test_engine_cook_is_idempotent():
 
     await engine.cook()
     await engine.cook()
+
+
+def _json_loader(*args, **kwargs):
+    return json.loads(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "engine_kwargs,expected",
+    [
+        ({}, "ast"),
+        ({"query_parser_mode": "json"}, "json"),
+        ({"json_loader": _json_loader}, "json"),
+        ({"json_loader": _json_loader, "query_parser_mode": "ast"}, "ast"),
+    ],
+)
+async def test_engine_query_parser_mode(
+    engine_kwargs, expected, clean_registry
+):
+    e = await create_engine("type Query { a: String }", **engine_kwargs)
+
+    assert e._schema.query_parser_mode == expected
+    assert await e.execute("{ a }") == {"data": {"a": None}}
+
+
+@pytest.mark.asyncio
+async def test_engine_query_parser_mode_unknown(clean_registry):
+    from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+    with pytest.raises(ImproperlyConfigured):
+        await create_engine(
+            "type Query { a: String }", query_parser_mode="unknown"
+        )
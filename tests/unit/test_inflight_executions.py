@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from tartiflette.execution.coalescing import InflightExecutions
+
+
+def _create_execution(result="result"):
+    calls = []
+    release = asyncio.Event()
+
+    async def execution():
+        calls.append("started")
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            calls.append("cancelled")
+            raise
+        return result
+
+    return execution, calls, release
+
+
+@pytest.mark.asyncio
+async def test_inflight_executions_coalesce():
+    inflight_executions = InflightExecutions()
+    execution, calls, release = _create_execution()
+
+    waiters = [
+        asyncio.ensure_future(inflight_executions.run("key", execution))
+        for _ in range(3)
+    ]
+    other = asyncio.ensure_future(inflight_executions.run("other", execution))
+    await asyncio.sleep(0)
+    assert len(inflight_executions) == 2
+
+    release.set()
+    assert await asyncio.gather(*waiters, other) == ["result"] * 4
+    assert calls == ["started", "started"]
+    assert len(inflight_executions) == 0
+
+
+@pytest.mark.asyncio
+async def test_inflight_executions_partial_cancellation():
+    inflight_executions = InflightExecutions()
+    execution, calls, release = _create_execution()
+
+    first = asyncio.ensure_future(inflight_executions.run("key", execution))
+    second = asyncio.ensure_future(inflight_executions.run("key", execution))
+    await asyncio.sleep(0)
+
+    # The shared execution survives the cancellation of some callers
+    first.cancel()
+    await asyncio.sleep(0)
+    assert first.cancelled()
+
+    release.set()
+    assert await second == "result"
+    assert calls == ["started"]
+
+
+@pytest.mark.asyncio
+async def test_inflight_executions_total_cancellation():
+    inflight_executions = InflightExecutions()
+    execution, calls, _ = _create_execution()
+
+    waiters = [
+        asyncio.ensure_future(inflight_executions.run("key", execution))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert calls == ["started", "cancelled"]
+    assert len(inflight_executions) == 0
+
+    # A new execution is started for later callers
+    execution, calls, release = _create_execution("new result")
+    waiter = asyncio.ensure_future(inflight_executions.run("key", execution))
+    await asyncio.sleep(0)
+    release.set()
+    assert await waiter == "new result"
+    assert calls == ["started"]
@@ -0,0 +1,67 @@
+import pytest
+
+from tartiflette.instrumentation import Instrument, Instrumentation
+from tartiflette.instrumentation.instrument import _noop
+
+
+class ParseInstrument(Instrument):
+    def __init__(self, events):
+        self.events = events
+
+    def on_parse_start(self, query):
+        self.events.append(("parse", query))
+
+
+class ResolveInstrument:
+    def __init__(self, events):
+        self.events = events
+
+    def on_resolve_field_start(self, info):
+        self.events.append(("resolve", info))
+
+
+def test_instrumentation_compiles_implemented_hooks():
+    events = []
+    instrumentation = Instrumentation(
+        [ParseInstrument(events), ResolveInstrument(events)]
+    )
+
+    assert instrumentation.on_validate_start is _noop
+    assert instrumentation.on_error is _noop
+    assert instrumentation.instruments_fields
+
+    instrumentation.on_parse_start("{ a }")
+    instrumentation.on_resolve_field_start("info")
+    instrumentation.on_execute_start("context")
+    assert events == [("parse", "{ a }"), ("resolve", "info")]
+
+
+def test_instrumentation_without_field_hooks():
+    instrumentation = Instrumentation([ParseInstrument([]), Instrument()])
+
+    assert not instrumentation.instruments_fields
+    assert instrumentation.on_resolve_field_start is _noop
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_wrap_error_coercer():
+    async def error_coercer(exception):
+        return {"message": str(exception)}
+
+    assert (
+        Instrumentation([Instrument()]).wrap_error_coercer(error_coercer)
+        is error_coercer
+    )
+
+    errors = []
+
+    class ErrorInstrument(Instrument):
+        def on_error(self, error, coerced_error):
+            errors.append((error, coerced_error))
+
+    exception = ValueError("Failing")
+    wrapped = Instrumentation([ErrorInstrument()]).wrap_error_coercer(
+        error_coercer
+    )
+    assert await wrapped(exception) == {"message": "Failing"}
+    assert errors == [(exception, {"message": "Failing"})]
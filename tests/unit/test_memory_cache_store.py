@@ -0,0 +1,83 @@
+import pytest
+
+from tartiflette.caching import MemoryCacheStore
+from tartiflette.constants import UNDEFINED_VALUE
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_store_ttl():
+    clock = _Clock()
+    store = MemoryCacheStore(clock=clock)
+
+    await store.set("a", None, 10)
+    await store.set("b", "B", 20)
+    await store.set("c", "C", 0)
+    assert await store.get("a") is None
+    assert await store.get("b") == "B"
+    assert await store.get("c") is UNDEFINED_VALUE
+
+    clock.now = 10
+    assert await store.get("a") is UNDEFINED_VALUE
+    assert await store.get("b") == "B"
+    assert len(store) == 1
+
+    await store.delete("b")
+    assert await store.get("b") is UNDEFINED_VALUE
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_store_max_entries():
+    store = MemoryCacheStore(max_entries=2)
+
+    await store.set("a", "A", 10)
+    await store.set("b", "B", 10)
+    assert await store.get("a") == "A"
+    await store.set("c", "C", 10)
+
+    assert await store.get("a") == "A"
+    assert await store.get("b") is UNDEFINED_VALUE
+    assert await store.get("c") == "C"
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_store_max_size():
+    store = MemoryCacheStore(max_size=2500)
+
+    await store.set("a", "a" * 1000, 10)
+    await store.set("b", "b" * 1000, 10)
+    await store.set("c", "c" * 1000, 10)
+    await store.set("d", "d" * 4000, 10)
+
+    assert await store.get("a") is UNDEFINED_VALUE
+    assert await store.get("b") == "b" * 1000
+    assert await store.get("c") == "c" * 1000
+    # Values larger than the store aren't stored
+    assert await store.get("d") is UNDEFINED_VALUE
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_store_sizeof():
+    sizes = []
+
+    def sizeof(value):
+        sizes.append(value)
+        return len(value)
+
+    store = MemoryCacheStore(max_size=5, sizeof=sizeof)
+
+    await store.set("a", "aa", 10)
+    await store.set("b", "bbb", 10)
+    await store.set("c", "c", 10)
+
+    assert sizes == ["aa", "bbb", "c"]
+    assert await store.get("a") is UNDEFINED_VALUE
+    assert await store.get("b") == "bbb"
+    assert await store.get("c") == "c"
@@ -0,0 +1,52 @@
+import pytest
+
+from tartiflette.persisted_queries import (
+    LRUPersistedQueryStore,
+    compute_query_id,
+    is_valid_query_id,
+)
+
+
+@pytest.mark.parametrize("query", ["{ hello }", b"{ hello }"])
+def test_compute_query_id(query):
+    assert compute_query_id(query) == (
+        "001c3174e099bd72b729d0c0a529ba9f5a740c446e2a6e1d71b283cb84ec3065"
+    )
+
+
+@pytest.mark.parametrize(
+    "query_id,expected",
+    [
+        (compute_query_id("{ hello }"), True),
+        (compute_query_id("{ hello }").upper(), False),
+        (compute_query_id("{ hello }")[:-1], False),
+        ("../" + compute_query_id("{ hello }")[3:], False),
+        (None, False),
+    ],
+)
+def test_is_valid_query_id(query_id, expected):
+    assert is_valid_query_id(query_id) is expected
+
+
+@pytest.mark.asyncio
+async def test_lru_persisted_query_store():
+    store = LRUPersistedQueryStore(maxsize=2)
+
+    await store.set("a", "query a", "document_a")
+    await store.set("b", "query b", "document_b")
+    assert await store.get("a") == "document_a"
+
+    await store.set("c", "query c", "document_c")
+    assert len(store) == 2
+    assert await store.get("b") is None
+    assert await store.get("a") == "document_a"
+    assert await store.get("c") == "document_c"
+
+
+@pytest.mark.asyncio
+async def test_lru_persisted_query_store_unbounded():
+    store = LRUPersistedQueryStore(maxsize=None)
+    for index in range(2048):
+        await store.set(str(index), "", index)
+    assert len(store) == 2048
+    assert await store.get("0") == 0
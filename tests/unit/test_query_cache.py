@@ -0,0 +1,282 @@
+import sys
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.query_cache import (
+    QueryCache,
+    QueryCacheInfo,
+    get_retained_size,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Document:
+    __slots__ = ("payload",)
+
+    def __init__(self, size):
+        self.payload = "x" * size
+
+
+def _parse_and_validate_query(query, schema):
+    if query.startswith("invalid"):
+        return None, ["error"]
+    return _Document(int(query)), None
+
+
+def test_get_retained_size():
+    small = _Document(10)
+    big = _Document(1000)
+    assert get_retained_size(big) - get_retained_size(small) == 990
+
+    # Objects referenced several times are only counted once
+    documents = [big, big]
+    assert get_retained_size(documents) == (
+        sys.getsizeof(documents) + get_retained_size(big)
+    )
+
+
+def test_query_cache_hits_and_misses():
+    cached = QueryCache()(_parse_and_validate_query)
+
+    document, errors = cached("100", None)
+    assert errors is None
+    assert cached("100", None)[0] is document
+    assert cached("100", "another_schema")[0] is not document
+
+    info = cached.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.entries == 2
+    assert info.size == 2 * get_retained_size(document)
+
+    cached.cache_clear()
+    assert cached.cache_info() == QueryCacheInfo(
+        hits=0,
+        misses=0,
+        negative_hits=0,
+        evictions=0,
+        expirations=0,
+        entries=0,
+        aliases=0,
+        negative_entries=0,
+        size=0,
+        max_size=64 * 1024 * 1024,
+    )
+
+
+def test_query_cache_evicts_by_size():
+    document_size = get_retained_size(_Document(1000))
+    cached = QueryCache(max_size=int(document_size * 2.5))(
+        _parse_and_validate_query
+    )
+
+    first, _ = cached("1000", None)
+    cached("1000", "b")
+    assert cached("1000", None)[0] is first  # `None` is now the most recent
+    cached("1000", "c")
+
+    info = cached.cache_info()
+    assert info.entries == 2
+    assert info.evictions == 1
+    assert info.size == document_size * 2
+    assert cached("1000", None)[0] is first
+    assert cached.cache_info().misses == 3
+
+    # Documents bigger than the whole cache are never cached
+    cached("100000", None)
+    assert cached.cache_info().entries == 2
+
+
+def test_query_cache_negative_entries():
+    clock = _Clock()
+    cached = QueryCache(negative_ttl=10, negative_maxsize=2, clock=clock)(
+        _parse_and_validate_query
+    )
+
+    result = cached("invalid", None)
+    assert result == (None, ["error"])
+    assert cached("invalid", None) is result
+
+    clock.now = 10
+    assert cached("invalid", None) is not result
+
+    cached("invalid2", None)
+    cached("invalid3", None)
+
+    info = cached.cache_info()
+    assert info.negative_hits == 1
+    assert info.expirations == 1
+    assert info.evictions == 1
+    assert info.negative_entries == 2
+    assert info.entries == 0
+    assert info.size == 0
+
+
+def test_query_cache_negative_entries_disabled():
+    cached = QueryCache(negative_ttl=None)(_parse_and_validate_query)
+    cached("invalid", None)
+    cached("invalid", None)
+    assert cached.cache_info().misses == 2
+    assert cached.cache_info().negative_entries == 0
+
+
+def test_query_cache_normalizer():
+    calls = []
+
+    def parse_and_validate_query(query, schema):
+        calls.append(query)
+        if query.startswith("invalid"):
+            return None, ["error"]
+        return _Document(len(query)), None
+
+    cached = QueryCache(normalizer=lambda query: query.replace(" ", ""))(
+        parse_and_validate_query
+    )
+
+    document, _ = cached("1 0", None)
+    assert cached("10", None)[0] is document
+    assert cached("  10", None)[0] is document
+    assert cached("  10", None)[0] is document
+    assert calls == ["1 0"]
+
+    info = cached.cache_info()
+    assert info.hits == 3
+    assert info.misses == 1
+    assert info.entries == 1
+    assert info.aliases == 2
+    assert info.size == (
+        get_retained_size(document)
+        + get_retained_size("1 0")
+        + get_retained_size("  10")
+    )
+
+    # Errors aren't shared between formattings
+    result = cached("invalid query", None)
+    assert cached("invalid  query", None) is not result
+    assert cached("invalid query", None) is result
+    assert calls == ["1 0", "invalid query", "invalid  query"]
+    assert cached.cache_info().negative_entries == 2
+
+
+def test_query_cache_normalizer_evicted_document():
+    document_size = get_retained_size(_Document(1000))
+    cached = QueryCache(
+        max_size=int(document_size * 1.5),
+        normalizer=lambda query: query.strip(),
+    )(_parse_and_validate_query)
+
+    document, _ = cached(" 1000", None)
+    assert cached.cache_info().aliases == 1
+
+    cached("999", None)
+    info = cached.cache_info()
+    assert info.entries == 1
+    assert info.evictions == 1
+
+    # The alias doesn't point to an existing document anymore
+    assert cached(" 1000", None)[0] is not document
+    assert cached.cache_info().misses == 3
+
+
+@pytest.mark.asyncio
+async def test_engine_query_cache_info(clean_registry):
+    engine = await create_engine("type Query { a: String }")
+
+    assert await engine.execute("{ a }") == {"data": {"a": None}}
+    assert await engine.execute("{ a }") == {"data": {"a": None}}
+    await engine.execute("{ b }")
+    await engine.execute("{ b }")
+
+    info = engine.query_cache_info()
+    assert info.hits == 1
+    assert info.negative_hits == 1
+    assert info.misses == 2
+    assert info.entries == 1
+    assert info.negative_entries == 1
+
+    document, _ = engine._cached_parse_and_validate_query(
+        "{ a }", engine._schema
+    )
+    assert document.validators is None
+
+
+@pytest.mark.asyncio
+async def test_engine_query_cache_charges_execution_plans(clean_registry):
+    engine = await create_engine("type Query { a: String b: String }")
+
+    document, _ = engine._cached_parse_and_validate_query(
+        "{ a b }", engine._schema
+    )
+    assert document.execution_plan is not None
+    size = engine.query_cache_info().size
+
+    # Entries added to the execution plan are charged to the document
+    assert await engine.execute("{ a b }") == {"data": {"a": None, "b": None}}
+    planned_size = engine.query_cache_info().size
+    assert planned_size > size
+
+    assert await engine.execute("{ a b }") == {"data": {"a": None, "b": None}}
+    assert engine.query_cache_info().size == planned_size
+
+
+@pytest.mark.asyncio
+async def test_engine_query_cache_info_without_cache(clean_registry):
+    engine = await create_engine(
+        "type Query { a: String }", query_cache_decorator=None
+    )
+    assert engine.query_cache_info() is None
+
+
+@pytest.mark.asyncio
+async def test_engine_normalize_queries(clean_registry):
+    engine = await create_engine(
+        "type Query { a: String }", normalize_queries=True
+    )
+
+    for query in ("{ a }", "{a}", "{\n  a # comment\n}"):
+        assert await engine.execute(query) == {"data": {"a": None}}
+
+    info = engine.query_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.entries == 1
+    assert info.aliases == 2
+
+
+@pytest.mark.asyncio
+async def test_engine_normalize_queries_error_locations(clean_registry):
+    @Resolver("Query.b", schema_name="test_normalize_queries_locations")
+    async def resolve_query_b(*_args, **_kwargs):
+        raise ValueError("b failed")
+
+    engine = await create_engine(
+        "type Query { a: String b: String }",
+        schema_name="test_normalize_queries_locations",
+        normalize_queries=True,
+    )
+
+    query = """
+    {
+      a
+      unknown
+    }
+    """
+    result = await engine.execute(query)
+    assert result["errors"][0]["locations"] == [{"line": 4, "column": 7}]
+
+    query = """
+    {
+      a
+      b
+    }
+    """
+    result = await engine.execute(query)
+    assert result["errors"][0]["locations"] == [{"line": 4, "column": 7}]
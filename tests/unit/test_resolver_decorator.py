@@ -4,7 +4,10 @@ import pytest
 
 from tartiflette import Resolver
 from tartiflette.schema.bakery import SchemaBakery
-from tartiflette.types.exceptions.tartiflette import NonAwaitableResolver
+from tartiflette.types.exceptions.tartiflette import (
+    NonAwaitableResolver,
+    NonCallable,
+)
 
 
 @pytest.mark.asyncio
@@ -84,9 +87,12 @@ async def test_resolver_decorator(clean_registry):
         mock_two()
         return
 
+    with pytest.raises(NonCallable):
+        Resolver("Test.simpleField")("not a callable")
+
     with pytest.raises(NonAwaitableResolver):
 
-        @Resolver("Test.simpleField")
+        @Resolver("Test.simpleField", batch=True)
         def func_default_resolver(*args, **kwargs):
             pass
 
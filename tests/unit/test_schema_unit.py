@@ -83,6 +83,14 @@ async def test_schema_object_get_field_name(clean_registry):
     with pytest.raises(UnknownSchemaFieldResolver):
         assert generated_schema.get_field_by_name("Something.unknownField")
 
+    assert generated_schema.get_field(
+        "Test", "field"
+    ) is generated_schema.get_field_by_name("Test.field")
+    assert generated_schema.get_field("Something", "oneField") is not None
+    assert generated_schema.get_field("Something", "unknownField") is None
+    assert generated_schema.get_field("UserInfo", "name") is None
+    assert generated_schema.get_field("Unknown", "field") is None
+
 
 @pytest.mark.parametrize(
     "full_sdl,expected_error",
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from tartiflette.utils.tasks import gather_results, gather_until_error
+
+
+async def _return(value):
+    await asyncio.sleep(0)
+    return value
+
+
+async def _raise(exception):
+    await asyncio.sleep(0)
+    raise exception
+
+
+@pytest.mark.asyncio
+async def test_gather_until_error():
+    assert await gather_until_error([]) == []
+    assert await gather_until_error([_return(1), _return(2)]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_gather_until_error_cancels_pending():
+    cancelled = asyncio.Event()
+
+    async def pending():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    exception = ValueError("Failing")
+    results = await gather_until_error(
+        [_return(1), pending(), _raise(exception)]
+    )
+    assert results == [1, None, exception]
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_gather_until_error_cancelled():
+    cancelled = asyncio.Event()
+
+    async def pending():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.ensure_future(gather_until_error([pending()]))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_gather_until_error_cancelled_waits_for_tasks():
+    events = []
+
+    async def pending():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0)
+            events.append("cancelled")
+            raise
+
+    task = asyncio.ensure_future(gather_until_error([pending(), pending()]))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The tasks are done once the cancellation is raised
+    assert events == ["cancelled", "cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_gather_until_error_cancelled_awaitable():
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await gather_until_error([_return(1), cancelled()])
+
+
+@pytest.mark.asyncio
+async def test_gather_until_error_cancelled_awaitable_cancels_pending():
+    cancelled = asyncio.Event()
+
+    async def pending():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def cancelling():
+        await asyncio.sleep(0)
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            gather_until_error([pending(), cancelling()]), timeout=1
+        )
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_gather_results():
+    exception = ValueError("Failing")
+    assert await gather_results([_return(1), _raise(exception)]) == [
+        1,
+        exception,
+    ]
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await gather_results([_return(1), cancelled()])